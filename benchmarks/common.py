@@ -0,0 +1,182 @@
+"""
+Shared helpers for the benchmark scripts: engine setup, the synthetic model,
+deterministic row generation and latency statistics.
+"""
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+from sqlalchemy import Column, DateTime, Integer, String, __version__ as sqlalchemy_version
+from sqlalchemy.orm import declarative_base
+
+from sqlalchemy_dbtoolkit.engine.factory import AlchemyEngineFactory
+from sqlalchemy_dbtoolkit.orm.base import ORMBaseManager
+
+BenchmarkBase = declarative_base()
+
+NUM_CATEGORIES = 1000
+EPOCH = datetime(2024, 1, 1)
+
+
+class BenchmarkRow(BenchmarkBase):
+    __tablename__ = 'benchmark_rows'
+    id = Column(Integer, primary_key=True, autoincrement=False)
+    code = Column(String(length=32), nullable=False, unique=True)
+    category = Column(Integer, nullable=False, index=True)
+    value = Column(Integer, nullable=False)
+    payload = Column(String(length=255))
+    created_at = Column(DateTime, nullable=False)
+
+
+def write_sqlite_config(directory):
+    """
+    Writes a minimal config.ini that points the SQLite engine at a directory.
+
+    Args:
+        directory (str): Directory holding the SQLite database files.
+
+    Returns:
+        str: Path to the written configuration file.
+    """
+
+    config_path = os.path.join(directory, 'config.ini')
+    with open(config_path, 'w', encoding='utf-8') as config_file:
+        config_file.write(f"[sqlite]\npath = {directory}\n")
+    return config_path
+
+
+def create_benchmark_engine(dbms, db_name, config_path=None, **factory_kwargs):
+    """
+    Creates an engine through AlchemyEngineFactory. For SQLite without an explicit
+    config a temporary directory and config file are used, so nothing leaves the machine.
+
+    Args:
+        dbms (str): 'sqlite', 'mysql' or 'postgresql'.
+        db_name (str): Name of the benchmark database.
+        config_path (str, optional): Config file for the DBMS. Required for MySQL and PostgreSQL.
+        **factory_kwargs: Additional arguments passed to AlchemyEngineFactory.
+
+    Returns:
+        tuple[AlchemyEngineFactory, tempfile.TemporaryDirectory or None]: The factory and the
+        temporary directory to clean up afterwards, if one was created.
+    """
+
+    temp_dir = None
+    if config_path is None:
+        if dbms != 'sqlite':
+            raise ValueError(f"--config is required for {dbms}")
+        temp_dir = tempfile.TemporaryDirectory(prefix='dbtoolkit_bench_')
+        config_path = write_sqlite_config(temp_dir.name)
+
+    factory = AlchemyEngineFactory(dbms=dbms, db_name=db_name, config_path=config_path, **factory_kwargs)
+    return factory, temp_dir
+
+
+def reset_benchmark_tables(engine):
+    """
+    Drops and recreates the synthetic benchmark tables through ORMBaseManager.
+
+    Args:
+        engine (sqlalchemy.engine.Engine): Target engine.
+
+    Returns:
+        ORMBaseManager: The manager bound to the benchmark base.
+    """
+
+    manager = ORMBaseManager(engine, base=BenchmarkBase)
+    manager.drop_all_metadata_tables()
+    manager.create_tables()
+    return manager
+
+
+def generate_rows(start_id, count, seed=0):
+    """
+    Generates deterministic synthetic rows for BenchmarkRow.
+
+    Args:
+        start_id (int): First primary key value.
+        count (int): Number of rows to generate.
+        seed (int): Seed for the pseudo-random payload.
+
+    Returns:
+        list[dict]: Row dictionaries ready for InsertManager.
+    """
+
+    rng = random.Random(seed + start_id)
+    rows = []
+    for row_id in range(start_id, start_id + count):
+        rows.append({
+            'id': row_id,
+            'code': f'code-{row_id}',
+            'category': row_id % NUM_CATEGORIES,
+            'value': rng.randint(0, 1_000_000),
+            'payload': f'payload-{rng.getrandbits(64):016x}',
+            'created_at': EPOCH + timedelta(seconds=row_id)
+        })
+    return rows
+
+
+def percentile(samples, pct):
+    """
+    Returns the nearest-rank percentile of a list of samples.
+
+    Args:
+        samples (list[float]): Measured values.
+        pct (float): Percentile between 0 and 100.
+
+    Returns:
+        float or None: The percentile value, or None for an empty list.
+    """
+
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    rank = max(int(round(pct / 100 * len(ordered) + 0.5)) - 1, 0)
+    return ordered[min(rank, len(ordered) - 1)]
+
+
+def peak_rss_mb():
+    """
+    Returns the peak resident set size of the current process in megabytes.
+
+    Returns:
+        float or None: Peak RSS, or None where the resource module is unavailable.
+    """
+
+    try:
+        import resource
+    except ImportError:
+        return None
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS reports bytes.
+    divisor = 1024 * 1024 if sys.platform == 'darwin' else 1024
+    return round(peak / divisor, 2)
+
+
+def environment_metadata(dbms):
+    """
+    Describes the environment a benchmark ran in.
+
+    Args:
+        dbms (str): Benchmarked DBMS.
+
+    Returns:
+        dict: Interpreter, library and platform details.
+    """
+
+    return {
+        'dbms': dbms,
+        'python': platform.python_version(),
+        'sqlalchemy': sqlalchemy_version,
+        'platform': platform.platform(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z')
+    }
@@ -0,0 +1,349 @@
+"""
+CRUD benchmark for the query managers.
+
+Synthetic tables are created through ORMBaseManager and every `query/*Manager`
+method is timed across row counts and batch sizes. Results (throughput, p50/p99
+latency and peak RSS) are written to JSON and can be compared against a stored
+baseline. SQLite in a temporary directory is used by default, so the suite runs
+fully offline; pass --dbms/--config to target a local PostgreSQL or MySQL
+container (see benchmarks/docker-compose.yml).
+
+Usage:
+    python benchmarks/crud_benchmark.py run --rows 1000,10000 --batch-sizes 100,1000 --output current.json
+    python benchmarks/crud_benchmark.py compare baseline.json current.json --threshold 0.15
+"""
+import argparse
+import json
+import random
+import sys
+import time
+
+from common import (BenchmarkRow, NUM_CATEGORIES, create_benchmark_engine, environment_metadata,
+                    generate_rows, peak_rss_mb, percentile, reset_benchmark_tables)
+
+from sqlalchemy_dbtoolkit.query.create import InsertManager
+from sqlalchemy_dbtoolkit.query.delete import DeleteManager
+from sqlalchemy_dbtoolkit.query.merge import MergeManager
+from sqlalchemy_dbtoolkit.query.read import SelectManager
+from sqlalchemy_dbtoolkit.query.update import UpdateManager
+
+# Rows per call of the batched methods timed by run_methods (bulk_insert_rows, merge_rows).
+BATCH_METHOD_SIZE = 1000
+
+
+def summarize(method, rows, batch_size, latencies, affected_rows, **extra):
+    """
+    Builds a result record from per-call latencies.
+
+    Args:
+        method (str): Qualified manager method name, e.g. 'SelectManager.select_all_by_column'.
+        rows (int): Table size the benchmark ran against.
+        batch_size (int or None): Batch size used by the method, if any.
+        latencies (list[float]): Per-call latencies in seconds.
+        affected_rows (int): Total number of rows written or returned by all calls.
+        **extra: Additional fields stored with the record.
+
+    Returns:
+        dict: The result record.
+    """
+
+    total = sum(latencies)
+    record = {
+        'method': method,
+        'rows': rows,
+        'batch_size': batch_size,
+        'calls': len(latencies),
+        'p50_ms': round(percentile(latencies, 50) * 1000, 4),
+        'p99_ms': round(percentile(latencies, 99) * 1000, 4),
+        'mean_ms': round(total / len(latencies) * 1000, 4),
+        'calls_per_s': round(len(latencies) / total, 2) if total else None,
+        'rows_per_s': round(affected_rows / total, 2) if total else None,
+        'peak_rss_mb': peak_rss_mb()
+    }
+    record.update(extra)
+    print(f"  {method:40} rows={rows:<9} batch={str(batch_size):<6} "
+          f"p50={record['p50_ms']:9.3f} ms  p99={record['p99_ms']:9.3f} ms  rows/s={record['rows_per_s']}")
+    return record
+
+
+def timed(func, *args, **kwargs):
+    """
+    Calls a function and returns its result with the elapsed wall-clock time.
+    """
+
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def seed_table(engine, inserter, rows, batch_size, seed):
+    """
+    Recreates the benchmark table and fills it with `add_rows`, timing every batch.
+
+    Returns:
+        dict: The result record for InsertManager.add_rows.
+    """
+
+    reset_benchmark_tables(engine)
+    latencies = []
+    for start_id in range(1, rows + 1, batch_size):
+        batch = generate_rows(start_id, min(batch_size, rows + 1 - start_id), seed=seed)
+        _, elapsed = timed(inserter.add_rows, BenchmarkRow, batch)
+        latencies.append(elapsed)
+    return summarize('InsertManager.add_rows', rows, batch_size, latencies, rows)
+
+
+def create_managers(engine):
+    """
+    Builds the managers timed by run_methods, in the order it expects them.
+    """
+
+    return (InsertManager(engine), SelectManager(engine), UpdateManager(engine), DeleteManager(engine),
+            MergeManager(engine))
+
+
+def run_methods(managers, rows, calls, full_scan_limit, rng, seed):
+    """
+    Times every read, aggregate, update, delete, insert and merge method against a seeded table.
+    Batched inserts and merges run last, so the rows they add do not change what the other methods read.
+
+    Returns:
+        list[dict]: One result record per method.
+    """
+
+    inserter, selector, updater, deleter, merger = managers
+    results = []
+    next_id = rows + 1
+
+    latencies = []
+    for _ in range(calls):
+        _, elapsed = timed(inserter.add_row, BenchmarkRow, generate_rows(next_id, 1, seed=seed)[0])
+        latencies.append(elapsed)
+        next_id += 1
+    results.append(summarize('InsertManager.add_row', rows, None, latencies, calls))
+
+    scan_limit = None if rows <= full_scan_limit else full_scan_limit
+    latencies, returned = [], 0
+    for _ in range(max(calls // 10, 1)):
+        result, elapsed = timed(selector.select_all_from_table, BenchmarkRow, limit=scan_limit)
+        latencies.append(elapsed)
+        returned += len(result)
+    results.append(summarize('SelectManager.select_all_from_table', rows, None, latencies, returned,
+                             limit=scan_limit))
+
+    latencies = []
+    for _ in range(calls):
+        _, elapsed = timed(selector.select_one_by_primary_key, BenchmarkRow, rng.randint(1, rows))
+        latencies.append(elapsed)
+    results.append(summarize('SelectManager.select_one_by_primary_key', rows, None, latencies, calls))
+
+    latencies = []
+    for _ in range(calls):
+        code = f'code-{rng.randint(1, rows)}'
+        _, elapsed = timed(selector.select_one_by_column, BenchmarkRow, 'code', code)
+        latencies.append(elapsed)
+    results.append(summarize('SelectManager.select_one_by_column', rows, None, latencies, calls))
+
+    latencies, returned = [], 0
+    for _ in range(calls):
+        result, elapsed = timed(selector.select_all_by_column, BenchmarkRow, 'category',
+                                rng.randrange(NUM_CATEGORIES))
+        latencies.append(elapsed)
+        returned += len(result)
+    results.append(summarize('SelectManager.select_all_by_column', rows, None, latencies, returned))
+
+    latencies = []
+    for _ in range(calls):
+        _, elapsed = timed(selector.count_by_column, BenchmarkRow, 'category', rng.randrange(NUM_CATEGORIES))
+        latencies.append(elapsed)
+    results.append(summarize('SelectManager.count_by_column', rows, None, latencies, calls))
+
+    latencies = []
+    for _ in range(calls):
+        code = f'code-{rng.randint(1, rows)}'
+        _, elapsed = timed(selector.exists_by_column, BenchmarkRow, 'code', code)
+        latencies.append(elapsed)
+    results.append(summarize('SelectManager.exists_by_column', rows, None, latencies, calls))
+
+    latencies, returned = [], 0
+    for _ in range(max(calls // 10, 1)):
+        result, elapsed = timed(selector.aggregate, BenchmarkRow, 'sum', 'value', group_by='category')
+        latencies.append(elapsed)
+        returned += len(result)
+    results.append(summarize('SelectManager.aggregate', rows, None, latencies, returned, func='sum',
+                             group_by='category'))
+
+    latencies, updated = [], 0
+    for _ in range(calls):
+        count, elapsed = timed(updater.bulk_update_rows, BenchmarkRow, 'category',
+                               rng.randrange(NUM_CATEGORIES), {'value': rng.randint(0, 1_000_000)})
+        latencies.append(elapsed)
+        updated += count
+    results.append(summarize('UpdateManager.bulk_update_rows', rows, None, latencies, updated))
+
+    latencies, updated = [], 0
+    for _ in range(calls):
+        count, elapsed = timed(updater.update_rows, BenchmarkRow, 'category',
+                               rng.randrange(NUM_CATEGORIES), {'value': rng.randint(0, 1_000_000)})
+        latencies.append(elapsed)
+        updated += count
+    results.append(summarize('UpdateManager.update_rows', rows, None, latencies, updated))
+
+    # Deletes consume the rows added by add_row first, then random rows of the seeded table.
+    victims = list(range(rows + 1, next_id)) + rng.sample(range(1, rows + 1), min(rows, calls * 12))
+    latencies = []
+    for _ in range(calls):
+        instance = selector.select_one_by_primary_key(BenchmarkRow, victims.pop())
+        _, elapsed = timed(deleter.delete_row, instance)
+        latencies.append(elapsed)
+    results.append(summarize('DeleteManager.delete_row', rows, None, latencies, calls))
+
+    latencies, deleted = [], 0
+    for _ in range(calls):
+        ids = [victims.pop() for _ in range(min(5, len(victims)))]
+        instances = selector.select_all_by_column(BenchmarkRow, 'id', ids, operator_name='in')
+        count, elapsed = timed(deleter.delete_rows, instances)
+        latencies.append(elapsed)
+        deleted += count
+    results.append(summarize('DeleteManager.delete_rows', rows, None, latencies, deleted))
+
+    latencies, deleted = [], 0
+    for _ in range(calls):
+        ids = [victims.pop() for _ in range(min(5, len(victims)))]
+        count, elapsed = timed(deleter.delete_rows_by_filter, BenchmarkRow, 'id', ids, operator_name='in')
+        latencies.append(elapsed)
+        deleted += count
+    results.append(summarize('DeleteManager.delete_rows_by_filter', rows, None, latencies, deleted))
+
+    # New keys only; the ids used by add_row are below next_id.
+    batch_calls = max(calls // 10, 1)
+    bulk_start = next_id
+    latencies = []
+    for _ in range(batch_calls):
+        batch = generate_rows(next_id, BATCH_METHOD_SIZE, seed=seed)
+        _, elapsed = timed(inserter.bulk_insert_rows, BenchmarkRow, batch)
+        latencies.append(elapsed)
+        next_id += BATCH_METHOD_SIZE
+    results.append(summarize('InsertManager.bulk_insert_rows', rows, BATCH_METHOD_SIZE, latencies,
+                             batch_calls * BATCH_METHOD_SIZE))
+
+    # Each merge updates half a batch of the rows bulk_insert_rows added and inserts half a batch of new ones.
+    half = BATCH_METHOD_SIZE // 2
+    latencies, merged = [], 0
+    for index in range(batch_calls):
+        existing = generate_rows(bulk_start + index * half, half, seed=seed + 1)
+        result, elapsed = timed(merger.merge_rows, BenchmarkRow,
+                                existing + generate_rows(next_id, BATCH_METHOD_SIZE - half, seed=seed))
+        latencies.append(elapsed)
+        merged += result['inserted'] + result['updated']
+        next_id += BATCH_METHOD_SIZE - half
+    results.append(summarize('MergeManager.merge_rows', rows, BATCH_METHOD_SIZE, latencies, merged))
+
+    return results
+
+
+def run(args):
+    row_counts = [int(value) for value in args.rows.split(',')]
+    batch_sizes = [int(value) for value in args.batch_sizes.split(',')]
+
+    factory, temp_dir = create_benchmark_engine(args.dbms, args.db_name, args.config)
+    engine = factory.engine
+    managers = create_managers(engine)
+    results = []
+    try:
+        for rows in row_counts:
+            print(f"\n{args.dbms}: {rows} rows")
+            for batch_size in batch_sizes:
+                results.append(seed_table(engine, managers[0], rows, batch_size, args.seed))
+            rng = random.Random(args.seed)
+            results.extend(run_methods(managers, rows, args.calls, args.full_scan_limit, rng, args.seed))
+    finally:
+        engine.dispose()
+        if temp_dir is not None:
+            temp_dir.cleanup()
+
+    report = {'meta': environment_metadata(args.dbms), 'results': results}
+    report['meta']['peak_rss_mb'] = peak_rss_mb()
+    with open(args.output, 'w', encoding='utf-8') as output_file:
+        json.dump(report, output_file, indent=2)
+    print(f"\nResults written to {args.output}")
+    return 0
+
+
+def result_key(record):
+    return record['method'], record['rows'], record['batch_size']
+
+
+def compare(args):
+    with open(args.baseline, encoding='utf-8') as baseline_file:
+        baseline = {result_key(record): record for record in json.load(baseline_file)['results']}
+    with open(args.current, encoding='utf-8') as current_file:
+        current = json.load(current_file)['results']
+
+    regressions = []
+    for record in current:
+        reference = baseline.get(result_key(record))
+        if reference is None:
+            continue
+
+        checks = [
+            ('p50_ms', record['p50_ms'], reference['p50_ms'], True),
+            ('p99_ms', record['p99_ms'], reference['p99_ms'], True),
+            ('rows_per_s', record['rows_per_s'], reference['rows_per_s'], False)
+        ]
+        for metric, value, reference_value, lower_is_better in checks:
+            if not value or not reference_value:
+                continue
+            change = (value - reference_value) / reference_value
+            worse = change > args.threshold if lower_is_better else change < -args.threshold
+            if metric == 'p99_ms' and args.ignore_p99:
+                worse = False
+            marker = 'REGRESSION' if worse else ''
+            print(f"{record['method']:40} rows={record['rows']:<9} batch={str(record['batch_size']):<6} "
+                  f"{metric:10} {reference_value:>12} -> {value:>12} ({change:+.1%}) {marker}")
+            if worse:
+                regressions.append((record['method'], record['rows'], record['batch_size'], metric, change))
+
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) beyond {args.threshold:.0%}:")
+        for method, rows, batch_size, metric, change in regressions:
+            print(f"  - {method} rows={rows} batch={batch_size} {metric} {change:+.1%}")
+        return 1
+    print(f"\nNo regressions beyond {args.threshold:.0%}.")
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark the CRUD query managers.')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = subparsers.add_parser('run', help='Run the benchmark and write results to JSON.')
+    run_parser.add_argument('--dbms', default='sqlite', choices=['sqlite', 'mysql', 'postgresql'])
+    run_parser.add_argument('--config', default=None,
+                            help='Config file; defaults to a temporary SQLite config.')
+    run_parser.add_argument('--db-name', default='dbtoolkit_benchmark')
+    run_parser.add_argument('--rows', default='1000,10000,100000',
+                            help='Comma-separated table sizes, up to e.g. 10000000.')
+    run_parser.add_argument('--batch-sizes', default='100,1000',
+                            help='Comma-separated batch sizes for add_rows.')
+    run_parser.add_argument('--calls', type=int, default=50, help='Timed calls per method.')
+    run_parser.add_argument('--full-scan-limit', type=int, default=100_000,
+                            help='Largest table read in full by select_all_from_table; larger tables use it as limit.')
+    run_parser.add_argument('--seed', type=int, default=42)
+    run_parser.add_argument('--output', default='crud_benchmark.json')
+    run_parser.set_defaults(handler=run)
+
+    compare_parser = subparsers.add_parser('compare', help='Compare results against a stored baseline.')
+    compare_parser.add_argument('baseline')
+    compare_parser.add_argument('current')
+    compare_parser.add_argument('--threshold', type=float, default=0.15,
+                                help='Relative change treated as a regression (default 0.15).')
+    compare_parser.add_argument('--ignore-p99', action='store_true', help='Do not fail on p99 changes.')
+    compare_parser.set_defaults(handler=compare)
+
+    args = parser.parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
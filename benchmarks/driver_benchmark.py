@@ -0,0 +1,135 @@
+"""
+DBAPI driver benchmark for the query managers.
+
+Runs the CRUD benchmark of crud_benchmark.py once per driver selected through the
+config 'driver' key, so each run uses the driver's fast-path options exactly as the
+toolkit applies them, and prints throughput side by side. Drivers whose package is not
+installed are skipped. Requires a running PostgreSQL and/or MySQL server, e.g. the
+containers of benchmarks/docker-compose.yml with benchmarks/benchmark_config.ini.
+
+Usage:
+    python benchmarks/driver_benchmark.py --config benchmarks/benchmark_config.ini
+    python benchmarks/driver_benchmark.py --config benchmarks/benchmark_config.ini --dbms postgresql --rows 100000
+"""
+import argparse
+import configparser
+import importlib.util
+import json
+import os
+import random
+import sys
+import tempfile
+
+from common import create_benchmark_engine, environment_metadata, peak_rss_mb
+from crud_benchmark import create_managers, run_methods, seed_table
+
+# Drivers per DBMS with the module that must be importable for the driver to be benchmarked.
+DRIVERS = {
+    'postgresql': {'psycopg2': 'psycopg2', 'psycopg': 'psycopg'},
+    'mysql': {'mysqlconnector': 'mysql.connector', 'mysqldb': 'MySQLdb', 'pymysql': 'pymysql'}
+}
+
+
+def write_driver_config(config_path, dbms, driver, directory):
+    """
+    Copies a config file with the 'driver' key of one section replaced.
+
+    Returns:
+        str: Path to the written configuration file.
+    """
+
+    config = configparser.ConfigParser(interpolation=None)
+    config.read(config_path)
+    config[dbms]['driver'] = driver
+    driver_config_path = os.path.join(directory, f'{dbms}-{driver}.ini')
+    with open(driver_config_path, 'w', encoding='utf-8') as config_file:
+        config.write(config_file)
+    return driver_config_path
+
+
+def run_driver(args, dbms, driver, config_path):
+    """
+    Runs the CRUD benchmark with one driver.
+
+    Returns:
+        list[dict]: Result records tagged with the driver name.
+    """
+
+    factory, _ = create_benchmark_engine(dbms, args.db_name, config_path)
+    engine = factory.engine
+    managers = create_managers(engine)
+    try:
+        results = [seed_table(engine, managers[0], args.rows, args.batch_size, args.seed)]
+        results.extend(run_methods(managers, args.rows, args.calls, args.full_scan_limit,
+                                   random.Random(args.seed), args.seed))
+    finally:
+        engine.dispose()
+    for record in results:
+        record['dbms'] = dbms
+        record['driver'] = driver
+    return results
+
+
+def print_comparison(results):
+    """
+    Prints rows per second of every method, one column per driver.
+    """
+
+    for dbms in sorted({record['dbms'] for record in results}):
+        records = [record for record in results if record['dbms'] == dbms]
+        drivers = list(dict.fromkeys(record['driver'] for record in records))
+        methods = list(dict.fromkeys(record['method'] for record in records))
+        by_key = {(record['method'], record['driver']): record for record in records}
+
+        print(f"\n{dbms} rows/s")
+        print(f"  {'method':40}" + ''.join(f"{driver:>16}" for driver in drivers))
+        for method in methods:
+            values = [by_key.get((method, driver), {}).get('rows_per_s') for driver in drivers]
+            print(f"  {method:40}" + ''.join(f"{str(value):>16}" for value in values))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Compare DBAPI drivers on the CRUD query managers.')
+    parser.add_argument('--config', required=True, help='Config file with [postgresql] and/or [mysql] sections.')
+    parser.add_argument('--dbms', default='all', choices=['all', 'postgresql', 'mysql'])
+    parser.add_argument('--drivers', default=None, help='Comma-separated subset of drivers to run.')
+    parser.add_argument('--db-name', default='dbtoolkit_benchmark')
+    parser.add_argument('--rows', type=int, default=100_000, help='Table size.')
+    parser.add_argument('--batch-size', type=int, default=1000, help='Batch size for add_rows.')
+    parser.add_argument('--calls', type=int, default=50, help='Timed calls per method.')
+    parser.add_argument('--full-scan-limit', type=int, default=100_000)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--output', default='driver_benchmark.json')
+    args = parser.parse_args(argv)
+
+    selected = set(args.drivers.split(',')) if args.drivers else None
+    dbms_list = list(DRIVERS) if args.dbms == 'all' else [args.dbms]
+
+    results = []
+    with tempfile.TemporaryDirectory(prefix='dbtoolkit_drivers_') as directory:
+        for dbms in dbms_list:
+            for driver, module_name in DRIVERS[dbms].items():
+                if selected is not None and driver not in selected:
+                    continue
+                if importlib.util.find_spec(module_name.split('.')[0]) is None:
+                    print(f"\n{dbms}+{driver}: skipped, {module_name} is not installed")
+                    continue
+                print(f"\n{dbms}+{driver}: {args.rows} rows")
+                config_path = write_driver_config(args.config, dbms, driver, directory)
+                results.extend(run_driver(args, dbms, driver, config_path))
+
+    if not results:
+        print("No driver could be benchmarked.")
+        return 1
+
+    print_comparison(results)
+    report = {'meta': environment_metadata(args.dbms), 'results': results}
+    report['meta']['peak_rss_mb'] = peak_rss_mb()
+    with open(args.output, 'w', encoding='utf-8') as output_file:
+        json.dump(report, output_file, indent=2)
+    print(f"\nResults written to {args.output}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
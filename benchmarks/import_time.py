@@ -0,0 +1,123 @@
+"""
+Import-time benchmark for the sqlalchemy-dbtoolkit package.
+
+Each module is imported in a fresh interpreter with `python -X importtime`,
+the cumulative import time is compared against a budget and the modules it
+pulled in are checked against a list of heavy dependencies that must stay lazy.
+
+Usage:
+    python benchmarks/import_time.py
+    python benchmarks/import_time.py --repeat 10 --budget sqlalchemy_dbtoolkit.engine.factory=5
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+# Budgets in milliseconds for the cumulative import time of each module.
+DEFAULT_BUDGETS_MS = {
+    'sqlalchemy_dbtoolkit.engine.factory': 10,
+    'sqlalchemy_dbtoolkit.utils.sanitization': 10,
+    'sqlalchemy_dbtoolkit.utils.query_operators': 10,
+    'sqlalchemy_dbtoolkit.utils.config': 25,
+    'sqlalchemy_dbtoolkit.orm.base': 400,
+    'sqlalchemy_dbtoolkit.query.read': 600
+}
+
+# Modules that must not be imported as a side effect of importing the key.
+FORBIDDEN_IMPORTS = {
+    'sqlalchemy_dbtoolkit.engine.factory': ['sqlalchemy', 'pandas', 'mysql.connector', 'psycopg2'],
+    'sqlalchemy_dbtoolkit.utils.sanitization': ['pandas', 'numpy'],
+    'sqlalchemy_dbtoolkit.orm.base': ['pandas', 'sqlalchemy.orm']
+}
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def measure_import(module_name):
+    """
+    Imports a module in a fresh interpreter and parses the `-X importtime` report.
+
+    Args:
+        module_name (str): Dotted name of the module to import.
+
+    Returns:
+        tuple[float, set[str]]: Cumulative import time in milliseconds and the set of imported modules.
+    """
+
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module_name}'],
+        cwd=REPO_ROOT, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Failed to import {module_name}: {result.stderr.strip().splitlines()[-1]}")
+
+    cumulative_us = None
+    imported = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        imported.add(name.strip())
+        if name.strip() == module_name:
+            cumulative_us = int(cumulative)
+
+    if cumulative_us is None:
+        raise RuntimeError(f"No import time reported for {module_name}")
+    return cumulative_us / 1000, imported
+
+
+def parse_budgets(overrides):
+    """
+    Merges `module=ms` overrides from the command line into the default budgets.
+
+    Args:
+        overrides (list[str]): Budget overrides in the form 'module=milliseconds'.
+
+    Returns:
+        dict[str, float]: Budget in milliseconds per module.
+    """
+
+    budgets = dict(DEFAULT_BUDGETS_MS)
+    for override in overrides or []:
+        module_name, _, value = override.partition('=')
+        if not value:
+            raise ValueError(f"Invalid budget override '{override}', expected module=milliseconds")
+        budgets[module_name] = float(value)
+    return budgets
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Check import times against a budget.')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='Imports per module; the fastest run is compared to the budget.')
+    parser.add_argument('--budget', action='append', metavar='MODULE=MS',
+                        help='Override or add a budget in milliseconds.')
+    args = parser.parse_args(argv)
+
+    budgets = parse_budgets(args.budget)
+    failures = []
+    for module_name, budget_ms in budgets.items():
+        runs = [measure_import(module_name) for _ in range(max(args.repeat, 1))]
+        best_ms = min(elapsed for elapsed, _ in runs)
+        imported = runs[0][1]
+
+        leaked = [name for name in FORBIDDEN_IMPORTS.get(module_name, []) if name in imported]
+        status = 'OK' if best_ms <= budget_ms and not leaked else 'FAIL'
+        print(f"{status:4} {module_name:45} {best_ms:9.2f} ms (budget {budget_ms:.0f} ms)")
+
+        if best_ms > budget_ms:
+            failures.append(f"{module_name} took {best_ms:.2f} ms, budget is {budget_ms:.0f} ms")
+        if leaked:
+            failures.append(f"{module_name} eagerly imports {', '.join(leaked)}")
+
+    if failures:
+        print('\nImport-time budget exceeded:')
+        for failure in failures:
+            print(f"  - {failure}")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
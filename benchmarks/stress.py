@@ -0,0 +1,273 @@
+"""
+Concurrency stress harness for the query managers.
+
+Many threads share one AlchemyEngineFactory engine and run a weighted mix of
+insert/select/update/delete calls of the `query/*Manager` classes for a fixed
+duration. The report covers throughput, per-operation latency percentiles, pool
+checkout wait times (from PoolMonitor), pool timeouts and errors, which shows
+where pool size or locking becomes the limit. SQLite in a temporary directory
+(WAL journal) is used by default, so the harness runs fully offline; pass
+--dbms/--config to target a local PostgreSQL or MySQL container (see
+benchmarks/docker-compose.yml).
+
+Usage:
+    python benchmarks/stress.py --threads 64 --duration 30 --pool-size 10 --max-overflow 10
+    python benchmarks/stress.py --mix select=50,insert=20,update=20,delete=10 --retry --output stress.json
+    python benchmarks/stress.py --dbms postgresql --config benchmarks/benchmark_config.ini --threads 64
+"""
+import argparse
+import itertools
+import json
+import random
+import sys
+import threading
+import time
+
+from sqlalchemy import exc
+
+from common import (BenchmarkRow, NUM_CATEGORIES, create_benchmark_engine, environment_metadata, generate_rows,
+                    peak_rss_mb, percentile, reset_benchmark_tables)
+
+from sqlalchemy_dbtoolkit.core.pool_monitor import PoolMonitor
+from sqlalchemy_dbtoolkit.query.create import InsertManager
+from sqlalchemy_dbtoolkit.query.delete import DeleteManager
+from sqlalchemy_dbtoolkit.query.read import SelectManager
+from sqlalchemy_dbtoolkit.query.update import UpdateManager
+from sqlalchemy_dbtoolkit.utils.retry import RetryPolicy
+
+OPERATIONS = ('select', 'insert', 'update', 'delete')
+DEFAULT_MIX = 'select=70,insert=10,update=15,delete=5'
+
+
+def parse_mix(mix):
+    """
+    Parses an operation mix such as 'select=70,insert=10,update=15,delete=5'.
+
+    Returns:
+        dict[str, float]: Operation names mapped to their relative weights.
+    """
+
+    weights = {}
+    for item in mix.split(','):
+        name, _, weight = item.partition('=')
+        name = name.strip()
+        if name not in OPERATIONS:
+            raise ValueError(f"{name} is not in supported operations: {list(OPERATIONS)}")
+        weights[name] = float(weight)
+    if not weights or sum(weights.values()) <= 0 or min(weights.values()) < 0:
+        raise ValueError("The mix needs non-negative weights with a positive sum")
+    return weights
+
+
+class Workload:
+    """
+    The manager calls of each operation, drawn against the seeded key range.
+    """
+
+    def __init__(self, engine, rows, seed, retry_policy=None):
+        self.rows = rows
+        self.seed = seed
+        self.inserter = InsertManager(engine, retry_policy=retry_policy)
+        self.selector = SelectManager(engine)
+        self.updater = UpdateManager(engine, retry_policy=retry_policy)
+        self.deleter = DeleteManager(engine, retry_policy=retry_policy)
+        # itertools.count is atomic under the GIL, so threads never insert the same key.
+        self.next_ids = itertools.count(rows + 1)
+
+    def select(self, rng):
+        if rng.random() < 0.5:
+            return 1 if self.selector.select_one_by_primary_key(BenchmarkRow, rng.randint(1, self.rows)) else 0
+        return len(self.selector.select_all_by_column(BenchmarkRow, 'category', rng.randrange(NUM_CATEGORIES)))
+
+    def insert(self, rng):
+        self.inserter.add_row(BenchmarkRow, generate_rows(next(self.next_ids), 1, seed=self.seed)[0])
+        return 1
+
+    def update(self, rng):
+        return self.updater.bulk_update_rows(BenchmarkRow, 'id', rng.randint(1, self.rows),
+                                             {'value': rng.randint(0, 1_000_000)})
+
+    def delete(self, rng):
+        return self.deleter.delete_rows_by_filter(BenchmarkRow, 'id', rng.randint(1, self.rows))
+
+
+def worker(workload, operations, weights, duration, barrier, rng, results):
+    """
+    Runs randomly drawn operations for `duration` seconds after all threads passed the barrier;
+    latencies and errors stay thread-local.
+    """
+
+    latencies = {name: [] for name in operations}
+    errors = {}
+    timeouts = 0
+    barrier.wait()
+    deadline = time.perf_counter() + duration
+    while time.perf_counter() < deadline:
+        name = rng.choices(operations, weights)[0]
+        start = time.perf_counter()
+        try:
+            getattr(workload, name)(rng)
+        except exc.TimeoutError:
+            timeouts += 1
+            continue
+        except Exception as e:
+            key = f"{name}: {type(e).__name__}: {str(e).splitlines()[0][:120]}"
+            errors[key] = errors.get(key, 0) + 1
+            continue
+        latencies[name].append(time.perf_counter() - start)
+    results.append((latencies, errors, timeouts))
+
+
+def summarize_latencies(samples, elapsed_s):
+    """
+    Builds throughput and latency percentiles for one operation.
+
+    Returns:
+        dict: Call count, calls per second and p50/p95/p99/max latency in milliseconds.
+    """
+
+    def ms(value):
+        return round(value * 1000, 3) if value is not None else None
+
+    return {
+        'calls': len(samples),
+        'calls_per_s': round(len(samples) / elapsed_s, 2),
+        'p50_ms': ms(percentile(samples, 50)),
+        'p95_ms': ms(percentile(samples, 95)),
+        'p99_ms': ms(percentile(samples, 99)),
+        'max_ms': ms(max(samples) if samples else None)
+    }
+
+
+def run(args):
+    weights = parse_mix(args.mix)
+    operations = list(weights)
+    engine_kwargs = {'pool_size': args.pool_size, 'max_overflow': args.max_overflow,
+                     'pool_timeout': args.pool_timeout, 'pool_pre_ping': args.pool_pre_ping}
+    session_settings = {'busy_timeout_ms': args.busy_timeout_ms} if args.dbms == 'sqlite' else None
+
+    factory, temp_dir = create_benchmark_engine(args.dbms, args.db_name, args.config,
+                                                session_settings=session_settings, engine_kwargs=engine_kwargs)
+    engine = factory.engine
+    try:
+        if args.dbms == 'sqlite':
+            with engine.connect() as connection:
+                journal_mode = connection.exec_driver_sql(f"PRAGMA journal_mode = {args.journal_mode}").scalar()
+            print(f"SQLite journal mode: {journal_mode}")
+
+        reset_benchmark_tables(engine)
+        inserter = InsertManager(engine)
+        for start_id in range(1, args.rows + 1, 10_000):
+            inserter.bulk_insert_rows(BenchmarkRow, generate_rows(start_id, min(10_000, args.rows - start_id + 1),
+                                                                  seed=args.seed))
+
+        retry_policy = RetryPolicy(retry_sqlite_locked=True) if args.retry else None
+        workload = Workload(engine, args.rows, args.seed, retry_policy=retry_policy)
+        # Attached after seeding, so only the timed phase counts towards the pool metrics.
+        pool_monitor = PoolMonitor()
+        pool_monitor.attach(engine)
+
+        print(f"{args.threads} threads, {args.duration}s, pool_size={args.pool_size} "
+              f"max_overflow={args.max_overflow} pool_timeout={args.pool_timeout}s, mix={weights}")
+        barrier = threading.Barrier(args.threads + 1)
+        results = []
+        threads = [threading.Thread(target=worker, name=f'stress-{index}',
+                                    args=(workload, operations, [weights[name] for name in operations], args.duration,
+                                          barrier, random.Random(args.seed + index), results))
+                   for index in range(args.threads)]
+        for thread in threads:
+            thread.start()
+        barrier.wait()
+        start = time.perf_counter()
+        for thread in threads:
+            thread.join()
+        elapsed_s = time.perf_counter() - start
+
+        latencies = {name: [] for name in operations}
+        errors = {}
+        timeouts = 0
+        for thread_latencies, thread_errors, thread_timeouts in results:
+            for name, samples in thread_latencies.items():
+                latencies[name].extend(samples)
+            for key, count in thread_errors.items():
+                errors[key] = errors.get(key, 0) + count
+            timeouts += thread_timeouts
+
+        all_samples = [sample for samples in latencies.values() for sample in samples]
+        pool = pool_monitor.snapshot(engine)
+        report = {
+            'meta': environment_metadata(args.dbms),
+            'config': {'threads': args.threads, 'duration_s': args.duration, 'rows': args.rows, 'mix': weights,
+                       'pool_size': args.pool_size, 'max_overflow': args.max_overflow,
+                       'pool_timeout_s': args.pool_timeout, 'retry': args.retry},
+            'elapsed_s': round(elapsed_s, 3),
+            'total': summarize_latencies(all_samples, elapsed_s),
+            'operations': {name: summarize_latencies(samples, elapsed_s) for name, samples in latencies.items()},
+            'pool_timeouts': timeouts,
+            'errors': sum(errors.values()),
+            'error_kinds': dict(sorted(errors.items(), key=lambda item: -item[1])[:20]),
+            'pool': {key: pool[key] for key in ('pool_class', 'pool_size', 'max_overflow', 'checkouts',
+                                                'checkout_timeouts', 'connections_opened', 'invalidations',
+                                                'checkout_wait', 'hold_time')},
+            'retries': retry_policy.snapshot() if retry_policy is not None else None,
+            'peak_rss_mb': peak_rss_mb()
+        }
+    finally:
+        engine.dispose()
+        if temp_dir is not None:
+            temp_dir.cleanup()
+
+    print_report(report)
+    with open(args.output, 'w', encoding='utf-8') as output_file:
+        json.dump(report, output_file, indent=2)
+    print(f"\nResults written to {args.output}")
+    return report
+
+
+def print_report(report):
+    """
+    Prints the throughput, latency, pool and error summary.
+    """
+
+    print(f"\n{'operation':10} {'calls':>9} {'calls/s':>10} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'max ms':>9}")
+    for name, stats in [*report['operations'].items(), ('total', report['total'])]:
+        print(f"{name:10} {stats['calls']:>9} {stats['calls_per_s']:>10} {str(stats['p50_ms']):>9} "
+              f"{str(stats['p95_ms']):>9} {str(stats['p99_ms']):>9} {str(stats['max_ms']):>9}")
+
+    wait = report['pool']['checkout_wait']
+    print(f"\npool wait ms: p50={wait['p50_ms']} p95={wait['p95_ms']} p99={wait['p99_ms']} max={wait['max_ms']} "
+          f"over {wait['count']} checkouts; connections opened={report['pool']['connections_opened']}")
+    print(f"pool timeouts: {report['pool_timeouts']}, errors: {report['errors']}")
+    for key, count in report['error_kinds'].items():
+        print(f"  {count:>7}  {key}")
+    if report['retries'] is not None:
+        retries = report['retries']
+        print(f"retries: {retries['retries']} (recovered {retries['recovered']}, exhausted {retries['exhausted']})")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Concurrency stress test of the query managers.')
+    parser.add_argument('--dbms', default='sqlite', choices=['sqlite', 'postgresql', 'mysql'])
+    parser.add_argument('--config', default=None, help='Config file; required for PostgreSQL and MySQL.')
+    parser.add_argument('--db-name', default='dbtoolkit_stress')
+    parser.add_argument('--threads', type=int, default=64)
+    parser.add_argument('--duration', type=float, default=30, help='Seconds of load.')
+    parser.add_argument('--rows', type=int, default=100_000, help='Rows seeded before the load starts.')
+    parser.add_argument('--mix', default=DEFAULT_MIX, help='Relative operation weights.')
+    parser.add_argument('--pool-size', type=int, default=10)
+    parser.add_argument('--max-overflow', type=int, default=10)
+    parser.add_argument('--pool-timeout', type=float, default=30, help='Seconds to wait for a pool connection.')
+    parser.add_argument('--pool-pre-ping', action='store_true')
+    parser.add_argument('--retry', action='store_true', help='Retry deadlocks and lock errors with RetryPolicy.')
+    parser.add_argument('--journal-mode', default='WAL', help='SQLite journal mode.')
+    parser.add_argument('--busy-timeout-ms', type=int, default=5000, help='SQLite busy timeout.')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--output', default='stress.json')
+    args = parser.parse_args(argv)
+
+    report = run(args)
+    return 1 if report['total']['calls'] == 0 else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
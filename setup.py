@@ -21,5 +21,11 @@ setup(
         'psycopg2>=2.9.10',
         'pandas>=2.2.0'
     ],
+    extras_require={
+        'parquet': ['pyarrow>=14.0'],
+        'mysqlclient': ['mysqlclient>=2.2'],
+        'pymysql': ['PyMySQL>=1.1'],
+        'psycopg': ['psycopg[binary]>=3.1']
+    },
     python_requires='>=3.8'
 )
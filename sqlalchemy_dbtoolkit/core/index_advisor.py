@@ -0,0 +1,182 @@
+import hashlib
+import threading
+
+from sqlalchemy import Column, Index, MetaData, Table
+from sqlalchemy.schema import CreateIndex
+
+from sqlalchemy_dbtoolkit.core.inspector import InspectionManager
+from sqlalchemy_dbtoolkit.utils.metrics import DEFAULT_LATENCY_BUCKETS_MS, LatencyHistogram
+from sqlalchemy_dbtoolkit.utils.tracing import add_operation_listener, remove_operation_listener
+
+# Predicates that match most of a table, so an index on the column rarely helps.
+NON_SELECTIVE_OPERATORS = frozenset({'ne', 'not_in'})
+
+
+class IndexAdvisor:
+    """
+    Finds hot filter predicates of the query managers that no index supports.
+
+    While started, every manager call that filters on a column (e.g. `select_all_by_column`,
+    `update_rows`, `delete_rows_by_filter`) is counted and timed per (table, column, operator).
+    `report` cross-checks those predicates against the indexes, unique constraints and primary
+    keys reflected from the database: a column counts as indexed when it is the leading column
+    of one of them. Manager calls are attributed by table name only, so an advisor should be
+    started for the workload of one database at a time.
+    """
+
+    def __init__(self, engine, schema=None, buckets_ms=DEFAULT_LATENCY_BUCKETS_MS):
+        """
+        Initializes the IndexAdvisor.
+
+        Args:
+            engine (sqlalchemy.engine.Engine): Engine connected to the database whose indexes are checked.
+            schema (str, optional): Schema of the tracked tables. Defaults to the default schema.
+            buckets_ms (tuple[float], optional): Latency histogram bucket bounds in milliseconds.
+        """
+
+        self.engine = engine
+        self.schema = schema
+        self.buckets_ms = buckets_ms
+        self._predicates = {}
+        self._lock = threading.Lock()
+
+    def start(self):
+        """
+        Starts recording the filter predicates of manager calls.
+        """
+
+        add_operation_listener(self.record)
+
+    def stop(self):
+        """
+        Stops recording; the collected statistics are kept.
+        """
+
+        remove_operation_listener(self.record)
+
+    def record(self, operation, elapsed_ms, error=False):
+        """
+        Records one manager call per filter predicate. Failed calls and calls without a table or filter are ignored.
+
+        Args:
+            operation (OperationContext): The tracked manager call.
+            elapsed_ms (float): Duration of the call in milliseconds.
+            error (bool, optional): Whether the call raised. Defaults to False.
+        """
+
+        if error or operation.table is None or not operation.filters:
+            return
+        with self._lock:
+            for column_name, operator_name in operation.filters:
+                key = (operation.table, column_name, operator_name)
+                histogram = self._predicates.get(key)
+                if histogram is None:
+                    histogram = self._predicates[key] = LatencyHistogram(self.buckets_ms)
+                histogram.observe(elapsed_ms)
+
+    def reset(self):
+        """
+        Clears the collected statistics.
+        """
+
+        with self._lock:
+            self._predicates.clear()
+
+    def get_indexed_columns(self, table_name):
+        """
+        Returns the columns that lead an index, unique constraint or the primary key of a table.
+
+        Args:
+            table_name (str): Name of the table to inspect.
+
+        Returns:
+            set[str]: Leading column names, or None if the table does not exist.
+        """
+
+        inspector = InspectionManager(self.engine)
+        if not inspector.has_table(table_name, schema=self.schema):
+            return None
+        primary_key = inspector.get_primary_key_constraint(table_name, schema=self.schema)
+        # The primary key constraint lists its columns under 'constrained_columns'.
+        definitions = (inspector.get_indexes(table_name, schema=self.schema)
+                       + inspector.get_unique_constraints(table_name, schema=self.schema)
+                       + [{'column_names': primary_key.get('constrained_columns')}])
+        return {definition['column_names'][0] for definition in definitions
+                if definition.get('column_names') and definition['column_names'][0] is not None}
+
+    def report(self, min_calls=10, include_indexed=False):
+        """
+        Lists the recorded predicates, hottest (by total time) first.
+
+        Args:
+            min_calls (int, optional): Ignore predicates called fewer times. Defaults to 10.
+            include_indexed (bool, optional): Also list predicates an index already supports. Defaults to False.
+
+        Returns:
+            list[dict]: Table, column, operator, call count, total/p50/p95 latency in milliseconds,
+                whether the column is indexed and whether an index is recommended.
+        """
+
+        with self._lock:
+            predicates = {key: histogram.snapshot() for key, histogram in self._predicates.items()}
+
+        indexed_columns = {}
+        report = []
+        for (table_name, column_name, operator_name), stats in predicates.items():
+            if stats['count'] < min_calls:
+                continue
+            if table_name not in indexed_columns:
+                indexed_columns[table_name] = self.get_indexed_columns(table_name)
+            if indexed_columns[table_name] is None:
+                continue
+            indexed = column_name in indexed_columns[table_name]
+            if indexed and not include_indexed:
+                continue
+            report.append({
+                'table': table_name,
+                'column': column_name,
+                'operator': operator_name,
+                'calls': stats['count'],
+                'total_ms': stats['total_ms'],
+                'p50_ms': stats['p50_ms'],
+                'p95_ms': stats['p95_ms'],
+                'indexed': indexed,
+                'recommended': not indexed and operator_name not in NON_SELECTIVE_OPERATORS,
+            })
+        report.sort(key=lambda entry: entry['total_ms'], reverse=True)
+        return report
+
+    def _index_name(self, table_name, column_name):
+        name = f"ix_{table_name}_{column_name}"
+        max_length = self.engine.dialect.max_identifier_length
+        if len(name) > max_length:
+            digest = hashlib.md5(name.encode()).hexdigest()[:8]
+            name = f"{name[:max_length - 9]}_{digest}"
+        return name
+
+    def create_index_statements(self, report=None, concurrently=True):
+        """
+        Generates CREATE INDEX statements for the recommended predicates of a report.
+        The statements are returned for review, not executed.
+
+        Args:
+            report (list[dict], optional): Output of `report`. Defaults to `report()`.
+            concurrently (bool, optional): Build the indexes without blocking writes (CONCURRENTLY,
+                PostgreSQL only; such statements must run outside a transaction). Defaults to True.
+
+        Returns:
+            list[str]: One statement per recommended (table, column), hottest first.
+        """
+
+        statements = []
+        seen = set()
+        for entry in report if report is not None else self.report():
+            key = (entry['table'], entry['column'])
+            if not entry['recommended'] or key in seen:
+                continue
+            seen.add(key)
+            table = Table(entry['table'], MetaData(), Column(entry['column']), schema=self.schema)
+            index = Index(self._index_name(*key), table.c[entry['column']],
+                          postgresql_concurrently=concurrently)
+            statements.append(str(CreateIndex(index).compile(dialect=self.engine.dialect)).strip())
+        return statements
@@ -113,3 +113,42 @@ class InspectionManager:
 
         return self.inspector.get_pk_constraint(table_name, schema=schema)
 
+    def get_indexes(self, table_name, schema=None):
+        """
+        Retrieves the indexes defined on the specified table.
+
+        Args:
+            table_name (str): Name of the table to inspect.
+            schema (str, optional): Schema containing the table. Defaults to the default schema.
+
+        Raises:
+            ValueError: If the specified table does not exist in the schema.
+
+        Returns:
+            list[dict]: A list of index definitions with their name, column_names and unique flag.
+        """
+
+        if not self.has_table(table_name, schema=schema):
+            raise ValueError(f"Table '{table_name}' does not exist in schema '{schema}'.")
+
+        return self.inspector.get_indexes(table_name, schema=schema)
+
+    def get_unique_constraints(self, table_name, schema=None):
+        """
+        Retrieves the unique constraints defined on the specified table.
+
+        Args:
+            table_name (str): Name of the table to inspect.
+            schema (str, optional): Schema containing the table. Defaults to the default schema.
+
+        Raises:
+            ValueError: If the specified table does not exist in the schema.
+
+        Returns:
+            list[dict]: A list of unique constraint definitions with their name and column_names.
+        """
+
+        if not self.has_table(table_name, schema=schema):
+            raise ValueError(f"Table '{table_name}' does not exist in schema '{schema}'.")
+
+        return self.inspector.get_unique_constraints(table_name, schema=schema)
@@ -0,0 +1,259 @@
+import logging
+import random
+import threading
+import time
+from collections import deque
+
+from sqlalchemy import event
+
+from sqlalchemy_dbtoolkit.core.profiler import is_explaining
+from sqlalchemy_dbtoolkit.utils.metrics import DEFAULT_LATENCY_BUCKETS_MS, LatencyHistogram
+from sqlalchemy_dbtoolkit.utils.tracing import get_current_operation
+
+slow_query_logger = logging.getLogger('sqlalchemy_dbtoolkit.slow_query')
+
+OTHER_STATEMENTS = '<other>'
+UNTRACKED_OPERATION = '<untracked>'
+
+
+class _StatementStats:
+    """
+    Aggregated metrics for a single SQL statement or manager method.
+    """
+
+    __slots__ = ('histogram', 'rows', 'errors', 'origins')
+
+    def __init__(self, buckets_ms):
+        self.histogram = LatencyHistogram(buckets_ms)
+        self.rows = 0
+        self.errors = 0
+        self.origins = {}
+
+    def snapshot(self, include_origins=True):
+        data = self.histogram.snapshot()
+        data['rows'] = self.rows
+        data['errors'] = self.errors
+        if include_origins:
+            data['origins'] = dict(self.origins)
+        return data
+
+
+class InstrumentationManager:
+    """
+    Records per-statement timing for SQLAlchemy engines through cursor execution events.
+
+    Every statement is attributed to the toolkit manager method that issued it
+    (e.g. 'SelectManager.select_all_by_column'), aggregated into latency histograms
+    per statement and per method, and statements above a threshold are written to a
+    sampled slow-query log. The per-statement work is a couple of clock reads, a dict
+    lookup and a bucket increment under a lock, so it is cheap enough to leave enabled.
+    """
+
+    def __init__(self, slow_query_threshold_ms=500, slow_query_sample_rate=1.0, slow_query_log_size=100,
+                 log_parameters=False, max_statements=500, buckets_ms=DEFAULT_LATENCY_BUCKETS_MS,
+                 logger=slow_query_logger, explain_profiler=None):
+        """
+        Initializes the InstrumentationManager.
+
+        Args:
+            slow_query_threshold_ms (float, optional): Statements at or above this latency are slow.
+                None disables the slow-query log. Defaults to 500.
+            slow_query_sample_rate (float, optional): Fraction of slow statements that are logged,
+                between 0 and 1. Defaults to 1.0.
+            slow_query_log_size (int, optional): Number of slow-query records kept in memory. Defaults to 100.
+            log_parameters (bool, optional): Whether bound parameters are included in slow-query records.
+                Defaults to False, since parameters may contain sensitive values.
+            max_statements (int, optional): Maximum number of distinct statements tracked. Further
+                statements are aggregated under '<other>'. Defaults to 500.
+            buckets_ms (tuple[float], optional): Latency histogram bucket bounds in milliseconds.
+            logger (logging.Logger, optional): Logger receiving slow-query records.
+                Defaults to the 'sqlalchemy_dbtoolkit.slow_query' logger.
+            explain_profiler (ExplainProfiler, optional): Profiler that captures execution plans
+                for logged slow queries and stores them on the slow-query record.
+        """
+
+        if not 0 <= slow_query_sample_rate <= 1:
+            raise ValueError(f"slow_query_sample_rate must be between 0 and 1, not {slow_query_sample_rate}")
+
+        self.slow_query_threshold_ms = slow_query_threshold_ms
+        self.slow_query_sample_rate = slow_query_sample_rate
+        self.log_parameters = log_parameters
+        self.max_statements = max_statements
+        self.buckets_ms = buckets_ms
+        self.logger = logger
+        self.explain_profiler = explain_profiler
+
+        self._lock = threading.Lock()
+        self._engines = []
+        self._statements = {}
+        self._operations = {}
+        self._slow_queries = deque(maxlen=slow_query_log_size)
+        self._slow_query_count = 0
+        self._started_at = time.time()
+
+    def attach(self, engine):
+        """
+        Registers the cursor execution listeners on an engine.
+
+        Args:
+            engine (sqlalchemy.engine.Engine): Engine to instrument.
+        """
+
+        if engine in self._engines:
+            return
+        event.listen(engine, 'before_cursor_execute', self._before_cursor_execute)
+        event.listen(engine, 'after_cursor_execute', self._after_cursor_execute)
+        event.listen(engine, 'handle_error', self._handle_error)
+        self._engines.append(engine)
+
+    def detach(self, engine):
+        """
+        Removes the cursor execution listeners from an engine.
+
+        Args:
+            engine (sqlalchemy.engine.Engine): Previously instrumented engine.
+        """
+
+        if engine not in self._engines:
+            return
+        event.remove(engine, 'before_cursor_execute', self._before_cursor_execute)
+        event.remove(engine, 'after_cursor_execute', self._after_cursor_execute)
+        event.remove(engine, 'handle_error', self._handle_error)
+        self._engines.remove(engine)
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault('dbtoolkit_query_start', []).append(time.perf_counter())
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        elapsed_ms = (time.perf_counter() - conn.info['dbtoolkit_query_start'].pop()) * 1000
+        rowcount = getattr(cursor, 'rowcount', -1)
+        self.record(statement, elapsed_ms, rowcount=rowcount, parameters=parameters, connection=conn)
+
+    def _handle_error(self, exception_context):
+        conn = exception_context.connection
+        if conn is None or not conn.info.get('dbtoolkit_query_start'):
+            return
+        elapsed_ms = (time.perf_counter() - conn.info['dbtoolkit_query_start'].pop()) * 1000
+        self.record(exception_context.statement or '', elapsed_ms, error=True)
+
+    def record(self, statement, elapsed_ms, rowcount=-1, parameters=None, connection=None, error=False):
+        """
+        Records a single executed statement.
+
+        Args:
+            statement (str): SQL statement as sent to the DBAPI cursor.
+            elapsed_ms (float): Execution time in milliseconds.
+            rowcount (int, optional): Rows affected as reported by the cursor; negative if unknown.
+            parameters (Any, optional): Bound parameters of the statement.
+            connection (sqlalchemy.engine.Connection, optional): Connection that executed the statement.
+            error (bool, optional): Whether the statement raised an error.
+        """
+
+        if is_explaining():
+            return
+
+        operation = get_current_operation()
+        origin = operation.method if operation is not None else UNTRACKED_OPERATION
+
+        with self._lock:
+            statement_stats = self._statements.get(statement)
+            if statement_stats is None:
+                key = statement if len(self._statements) < self.max_statements else OTHER_STATEMENTS
+                statement_stats = self._statements.setdefault(key, _StatementStats(self.buckets_ms))
+            operation_stats = self._operations.get(origin)
+            if operation_stats is None:
+                operation_stats = self._operations[origin] = _StatementStats(self.buckets_ms)
+
+            for stats in (statement_stats, operation_stats):
+                stats.histogram.observe(elapsed_ms)
+                if rowcount is not None and rowcount > 0:
+                    stats.rows += rowcount
+                if error:
+                    stats.errors += 1
+            statement_stats.origins[origin] = statement_stats.origins.get(origin, 0) + 1
+
+        if (self.slow_query_threshold_ms is not None and elapsed_ms >= self.slow_query_threshold_ms
+                and random.random() < self.slow_query_sample_rate):
+            self._log_slow_query(statement, elapsed_ms, rowcount, parameters, operation, connection, error)
+
+    def _log_slow_query(self, statement, elapsed_ms, rowcount, parameters, operation, connection, error):
+        """
+        Builds a slow-query record, keeps it in memory and sends it to the logger.
+
+        Returns:
+            dict: The slow-query record.
+        """
+
+        slow_query = {
+            'timestamp': time.time(),
+            'duration_ms': round(elapsed_ms, 3),
+            'statement': statement,
+            'rowcount': rowcount,
+            'error': error,
+            'method': operation.method if operation is not None else None,
+            'table': operation.table if operation is not None else None,
+            'column': operation.column if operation is not None else None,
+            'operator': operation.operator if operation is not None else None,
+            'dialect': connection.dialect.name if connection is not None else None
+        }
+        if self.log_parameters:
+            slow_query['parameters'] = parameters
+
+        with self._lock:
+            self._slow_queries.append(slow_query)
+            self._slow_query_count += 1
+
+        self.logger.warning("Slow query (%.1f ms) from %s: %s", elapsed_ms,
+                            slow_query['method'] or UNTRACKED_OPERATION, statement, extra={'slow_query': slow_query})
+
+        if self.explain_profiler is not None and connection is not None:
+            self.explain_profiler.submit(connection.engine, statement, parameters, slow_query)
+        return slow_query
+
+    @property
+    def slow_queries(self):
+        """
+        Returns the most recent slow-query records, oldest first.
+
+        Returns:
+            list[dict]: Slow-query records.
+        """
+
+        with self._lock:
+            return list(self._slow_queries)
+
+    def snapshot(self):
+        """
+        Returns an in-process snapshot of all collected metrics.
+
+        Returns:
+            dict: Uptime, totals, per-statement and per-method latency histograms,
+                  and the recent slow-query records.
+        """
+
+        with self._lock:
+            statements = {statement: stats.snapshot() for statement, stats in self._statements.items()}
+            operations = {method: stats.snapshot(include_origins=False) for method, stats in self._operations.items()}
+            slow_queries = list(self._slow_queries)
+            slow_query_count = self._slow_query_count
+
+        return {
+            'uptime_s': round(time.time() - self._started_at, 3),
+            'total_statements': sum(stats['count'] for stats in operations.values()),
+            'slow_query_count': slow_query_count,
+            'statements': statements,
+            'operations': operations,
+            'slow_queries': slow_queries
+        }
+
+    def reset(self):
+        """
+        Clears all collected metrics and slow-query records.
+        """
+
+        with self._lock:
+            self._statements.clear()
+            self._operations.clear()
+            self._slow_queries.clear()
+            self._slow_query_count = 0
+            self._started_at = time.time()
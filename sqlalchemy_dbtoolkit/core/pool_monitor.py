@@ -0,0 +1,242 @@
+import threading
+import time
+
+from sqlalchemy import event, exc
+
+from sqlalchemy_dbtoolkit.utils.metrics import LatencyHistogram
+
+
+class _PoolStats:
+    """
+    Counters and histograms collected for the pool of a single engine.
+    """
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.label = engine.url.render_as_string(hide_password=True)
+        self.checkout_wait = LatencyHistogram()
+        self.connect_latency = LatencyHistogram()
+        self.hold_time = LatencyHistogram()
+        self.connections_opened = 0
+        self.connections_closed = 0
+        self.checkouts = 0
+        self.checkout_timeouts = 0
+        self.invalidations = 0
+        self.soft_invalidations = 0
+        self.live_connections = {}
+
+
+class PoolMonitor:
+    """
+    Collects connection pool health and saturation metrics through SQLAlchemy pool events.
+
+    Tracks the checked-out and overflow gauges, a checkout wait-time histogram (including
+    pool timeouts), connect latency, how long connections are held, connection age and
+    invalidations. Metrics are available as a snapshot dictionary or pushed to a callback
+    on a fixed interval.
+    """
+
+    def __init__(self):
+        """
+        Initializes an empty PoolMonitor. Engines are added with `attach`.
+        """
+
+        self._lock = threading.Lock()
+        self._stats = {}
+        self._reporter = None
+        self._stop_reporting = threading.Event()
+
+    def attach(self, engine):
+        """
+        Starts collecting pool metrics for an engine.
+
+        Args:
+            engine (sqlalchemy.engine.Engine): Engine whose pool should be monitored.
+        """
+
+        if engine in self._stats:
+            return
+
+        stats = _PoolStats(engine)
+        self._stats[engine] = stats
+
+        event.listen(engine, 'do_connect', self._make_do_connect(stats))
+        event.listen(engine, 'connect', self._make_connect(stats))
+        event.listen(engine, 'checkout', self._make_checkout(stats))
+        event.listen(engine, 'checkin', self._make_checkin(stats))
+        event.listen(engine, 'close', self._make_close(stats))
+        event.listen(engine, 'detach', self._make_close(stats))
+        event.listen(engine, 'invalidate', self._make_invalidate(stats, soft=False))
+        event.listen(engine, 'soft_invalidate', self._make_invalidate(stats, soft=True))
+        # Pool listeners carry over when the engine is disposed, but the checkout
+        # wrapper lives on the pool instance and has to be applied to the new pool.
+        event.listen(engine, 'engine_disposed', lambda connection: self._wrap_pool_connect(stats))
+        self._wrap_pool_connect(stats)
+
+    def _wrap_pool_connect(self, stats):
+        """
+        Wraps `Pool.connect` to measure how long callers wait for a connection.
+        """
+
+        pool = stats.engine.pool
+        if getattr(pool, '_dbtoolkit_monitored', False):
+            return
+        original_connect = pool.connect
+
+        def connect():
+            start = time.perf_counter()
+            try:
+                return original_connect()
+            except exc.TimeoutError:
+                with self._lock:
+                    stats.checkout_timeouts += 1
+                raise
+            finally:
+                elapsed_ms = (time.perf_counter() - start) * 1000
+                with self._lock:
+                    stats.checkout_wait.observe(elapsed_ms)
+
+        pool.connect = connect
+        pool._dbtoolkit_monitored = True
+
+    def _make_do_connect(self, stats):
+        def do_connect(dialect, connection_record, cargs, cparams):
+            connection_record.info['dbtoolkit_connect_start'] = time.perf_counter()
+
+        return do_connect
+
+    def _make_connect(self, stats):
+        def connect(dbapi_connection, connection_record):
+            start = connection_record.info.pop('dbtoolkit_connect_start', None)
+            with self._lock:
+                stats.connections_opened += 1
+                stats.live_connections[id(connection_record)] = time.time()
+                if start is not None:
+                    stats.connect_latency.observe((time.perf_counter() - start) * 1000)
+
+        return connect
+
+    def _make_checkout(self, stats):
+        def checkout(dbapi_connection, connection_record, connection_proxy):
+            connection_record.info['dbtoolkit_checkout_at'] = time.perf_counter()
+            with self._lock:
+                stats.checkouts += 1
+
+        return checkout
+
+    def _make_checkin(self, stats):
+        def checkin(dbapi_connection, connection_record):
+            start = connection_record.info.pop('dbtoolkit_checkout_at', None)
+            if start is not None:
+                with self._lock:
+                    stats.hold_time.observe((time.perf_counter() - start) * 1000)
+
+        return checkin
+
+    def _make_close(self, stats):
+        def close(dbapi_connection, connection_record):
+            with self._lock:
+                if stats.live_connections.pop(id(connection_record), None) is not None:
+                    stats.connections_closed += 1
+
+        return close
+
+    def _make_invalidate(self, stats, soft):
+        def invalidate(dbapi_connection, connection_record, exception):
+            with self._lock:
+                if soft:
+                    stats.soft_invalidations += 1
+                else:
+                    stats.invalidations += 1
+                    if stats.live_connections.pop(id(connection_record), None) is not None:
+                        stats.connections_closed += 1
+
+        return invalidate
+
+    @staticmethod
+    def _pool_gauge(pool, name):
+        """
+        Reads a pool gauge such as `checkedout` or `overflow` if the pool class provides it.
+        """
+
+        gauge = getattr(pool, name, None)
+        return gauge() if callable(gauge) else None
+
+    def _engine_snapshot(self, stats):
+        pool = stats.engine.pool
+        now = time.time()
+        with self._lock:
+            ages = [now - connected_at for connected_at in stats.live_connections.values()]
+            return {
+                'pool_class': type(pool).__name__,
+                'pool_size': self._pool_gauge(pool, 'size'),
+                'checked_out': self._pool_gauge(pool, 'checkedout'),
+                'checked_in': self._pool_gauge(pool, 'checkedin'),
+                'overflow': self._pool_gauge(pool, 'overflow'),
+                'max_overflow': getattr(pool, '_max_overflow', None),
+                'checkouts': stats.checkouts,
+                'checkout_timeouts': stats.checkout_timeouts,
+                'connections_opened': stats.connections_opened,
+                'connections_closed': stats.connections_closed,
+                'invalidations': stats.invalidations,
+                'soft_invalidations': stats.soft_invalidations,
+                'connection_age_s': {
+                    'count': len(ages),
+                    'min': round(min(ages), 3) if ages else None,
+                    'mean': round(sum(ages) / len(ages), 3) if ages else None,
+                    'max': round(max(ages), 3) if ages else None
+                },
+                'checkout_wait': stats.checkout_wait.snapshot(),
+                'connect_latency': stats.connect_latency.snapshot(),
+                'hold_time': stats.hold_time.snapshot()
+            }
+
+    def snapshot(self, engine=None):
+        """
+        Returns the current pool metrics.
+
+        Args:
+            engine (sqlalchemy.engine.Engine, optional): Return only the metrics of this engine.
+
+        Returns:
+            dict: Metrics of the given engine, or a mapping of engine URL (password hidden)
+                  to metrics for every attached engine.
+        """
+
+        if engine is not None:
+            stats = self._stats.get(engine)
+            if stats is None:
+                raise ValueError(f"Engine {engine} is not monitored")
+            return self._engine_snapshot(stats)
+        return {stats.label: self._engine_snapshot(stats) for stats in list(self._stats.values())}
+
+    def start_reporting(self, callback, interval_s=60):
+        """
+        Calls `callback(snapshot)` from a daemon thread every `interval_s` seconds.
+
+        Args:
+            callback (callable): Receives the result of `snapshot()`.
+            interval_s (float, optional): Seconds between reports. Defaults to 60.
+        """
+
+        if self._reporter is not None and self._reporter.is_alive():
+            raise RuntimeError("Pool reporting is already running")
+
+        self._stop_reporting.clear()
+
+        def report():
+            while not self._stop_reporting.wait(interval_s):
+                callback(self.snapshot())
+
+        self._reporter = threading.Thread(target=report, name='dbtoolkit-pool-monitor', daemon=True)
+        self._reporter.start()
+
+    def stop_reporting(self):
+        """
+        Stops the periodic reporting thread, if running.
+        """
+
+        self._stop_reporting.set()
+        if self._reporter is not None:
+            self._reporter.join()
+            self._reporter = None
@@ -0,0 +1,292 @@
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
+
+profiler_logger = logging.getLogger('sqlalchemy_dbtoolkit.profiler')
+
+EXPLAIN_PREFIXES = {
+    'postgresql': 'EXPLAIN (FORMAT JSON) ',
+    'mysql': 'EXPLAIN FORMAT=JSON ',
+    'mariadb': 'EXPLAIN FORMAT=JSON ',
+    'sqlite': 'EXPLAIN QUERY PLAN '
+}
+
+EXPLAINABLE_STATEMENTS = ('SELECT', 'WITH', 'UPDATE', 'DELETE')
+
+# SQLite plan rows that introduce a subquery or CTE, which later rows scan by name.
+SQLITE_SUBQUERY_DETAILS = ('MATERIALIZE ', 'CO-ROUTINE ')
+
+_explaining = ContextVar('dbtoolkit_explaining', default=False)
+
+
+def is_explaining():
+    """
+    Returns True while the current thread is running an EXPLAIN issued by the profiler.
+
+    Instrumentation uses this to avoid recording, and re-explaining, the profiler's own statements.
+
+    Returns:
+        bool: Whether a profiler EXPLAIN is in progress.
+    """
+
+    return _explaining.get()
+
+
+class ExplainProfiler:
+    """
+    Captures execution plans for slow statements by re-running them under EXPLAIN.
+
+    Plans are captured on a separate pooled connection by a single background worker,
+    so the slow request itself is not delayed. A token bucket caps the number of EXPLAIN
+    statements per minute and a per-statement cooldown prevents the same query from being
+    explained repeatedly, so the profiler cannot amplify load on an already slow database.
+
+    Intended to be passed to InstrumentationManager as `explain_profiler`.
+    """
+
+    def __init__(self, threshold_ms=1000, max_explains_per_minute=6, statement_cooldown_s=300,
+                 max_pending=10, history_size=50, logger=profiler_logger):
+        """
+        Initializes the ExplainProfiler.
+
+        Args:
+            threshold_ms (float, optional): Only slow queries at or above this latency are explained. Defaults to 1000.
+            max_explains_per_minute (int, optional): Maximum EXPLAIN statements issued per minute. Defaults to 6.
+            statement_cooldown_s (float, optional): Minimum seconds between two EXPLAINs of the same
+                statement. Defaults to 300.
+            max_pending (int, optional): Maximum number of queued EXPLAIN requests; further requests
+                are dropped. Defaults to 10.
+            history_size (int, optional): Number of captured plans kept in memory. Defaults to 50.
+            logger (logging.Logger, optional): Logger used to report sequential scans and failures.
+        """
+
+        self.threshold_ms = threshold_ms
+        self.max_explains_per_minute = max_explains_per_minute
+        self.statement_cooldown_s = statement_cooldown_s
+        self.max_pending = max_pending
+        self.logger = logger
+
+        self._lock = threading.Lock()
+        self._tokens = float(max_explains_per_minute)
+        self._last_refill = time.monotonic()
+        # Statements in explain order; entries past the cooldown are evicted on the next request.
+        self._last_explained = OrderedDict()
+        self._pending = 0
+        self._skipped = 0
+        self._captured = deque(maxlen=history_size)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='dbtoolkit-explain')
+
+    def _acquire(self, statement):
+        """
+        Applies the rate limit, cooldown and queue bound to an EXPLAIN request.
+
+        Returns:
+            bool: True if the request may proceed.
+        """
+
+        now = time.monotonic()
+        with self._lock:
+            elapsed = now - self._last_refill
+            self._tokens = min(float(self.max_explains_per_minute),
+                               self._tokens + elapsed * self.max_explains_per_minute / 60)
+            self._last_refill = now
+
+            while self._last_explained and now - next(iter(self._last_explained.values())) >= self.statement_cooldown_s:
+                self._last_explained.popitem(last=False)
+            last = self._last_explained.get(statement)
+            if (self._tokens < 1 or self._pending >= self.max_pending
+                    or (last is not None and now - last < self.statement_cooldown_s)):
+                self._skipped += 1
+                return False
+
+            self._tokens -= 1
+            self._pending += 1
+            self._last_explained[statement] = now
+            self._last_explained.move_to_end(statement)
+            return True
+
+    def submit(self, engine, statement, parameters, slow_query):
+        """
+        Schedules an EXPLAIN for a slow statement; the plan is stored on the slow-query record.
+
+        Args:
+            engine (sqlalchemy.engine.Engine): Engine the statement ran on.
+            statement (str): SQL statement as sent to the DBAPI cursor.
+            parameters (tuple or dict): Bound DBAPI parameters of the statement.
+            slow_query (dict): Slow-query record; receives an 'explain' entry once captured.
+
+        Returns:
+            bool: True if the EXPLAIN was scheduled, False if it was filtered or rate-limited.
+        """
+
+        if slow_query['duration_ms'] < self.threshold_ms or slow_query.get('error'):
+            return False
+        if engine.dialect.name not in EXPLAIN_PREFIXES:
+            return False
+        if not statement.lstrip().upper().startswith(EXPLAINABLE_STATEMENTS):
+            return False
+        # executemany parameter lists have no single plan to explain.
+        if isinstance(parameters, list):
+            return False
+        if not self._acquire(statement):
+            return False
+
+        self._executor.submit(self._capture, engine, statement, parameters, slow_query)
+        return True
+
+    def _capture(self, engine, statement, parameters, slow_query):
+        token = _explaining.set(True)
+        try:
+            plan = self.explain(engine, statement, parameters)
+            scans = self.find_sequential_scans(engine.dialect.name, plan, slow_query.get('table'),
+                                               slow_query.get('column'))
+            slow_query['explain'] = {
+                'captured_at': time.time(),
+                'dialect': engine.dialect.name,
+                'plan': plan,
+                'sequential_scans': scans
+            }
+            if scans and slow_query.get('column'):
+                self.logger.warning("Sequential scan on %s while filtering by '%s' (%s): %s",
+                                    slow_query.get('table'), slow_query.get('column'),
+                                    slow_query.get('method'), statement)
+            with self._lock:
+                self._captured.append(slow_query)
+        except Exception as e:
+            slow_query['explain'] = {'captured_at': time.time(), 'error': str(e)}
+            self.logger.warning("Failed to capture plan: %s", e)
+        finally:
+            _explaining.reset(token)
+            with self._lock:
+                self._pending -= 1
+
+    def explain(self, engine, statement, parameters=None):
+        """
+        Runs the dialect-specific EXPLAIN for a statement on a new connection.
+
+        Args:
+            engine (sqlalchemy.engine.Engine): Engine to explain against.
+            statement (str): SQL statement in the DBAPI's parameter style.
+            parameters (tuple or dict, optional): Bound DBAPI parameters.
+
+        Returns:
+            Any: The plan; parsed JSON for PostgreSQL and MySQL, a list of plan rows for SQLite.
+        """
+
+        dialect_name = engine.dialect.name
+        prefix = EXPLAIN_PREFIXES.get(dialect_name)
+        if prefix is None:
+            raise NotImplementedError(f"EXPLAIN capture is not supported for {dialect_name}")
+
+        with engine.connect() as connection:
+            result = connection.exec_driver_sql(prefix + statement, parameters or ())
+            rows = result.fetchall()
+            connection.rollback()
+
+        if dialect_name == 'sqlite':
+            return [{'id': row[0], 'parent': row[1], 'detail': row[3]} for row in rows]
+
+        plan = rows[0][0]
+        return json.loads(plan) if isinstance(plan, (str, bytes)) else plan
+
+    @staticmethod
+    def find_sequential_scans(dialect_name, plan, table_name=None, column_name=None):
+        """
+        Finds full table scans in a plan, optionally restricted to the table and filter column of the query.
+
+        Args:
+            dialect_name (str): Dialect that produced the plan.
+            plan (Any): Plan as returned by `explain`.
+            table_name (str, optional): Only report scans of this table.
+            column_name (str, optional): Only report scans whose filter mentions this column.
+                SQLite plans do not name filter columns, so any scan of the table is reported.
+                Scans of constant rows, subqueries, CTEs and derived tables are not reported.
+
+        Returns:
+            list[dict]: One entry per sequential scan with the table and, where available, the filter.
+        """
+
+        scans = []
+
+        def matches(scanned_table, condition):
+            if table_name is not None and scanned_table != table_name:
+                return False
+            if column_name is not None and condition is not None and column_name not in condition:
+                return False
+            return True
+
+        def walk(node):
+            if isinstance(node, list):
+                for child in node:
+                    walk(child)
+            elif isinstance(node, dict):
+                if dialect_name == 'postgresql' and node.get('Node Type') == 'Seq Scan':
+                    condition = node.get('Filter')
+                    if matches(node.get('Relation Name'), condition):
+                        scans.append({'table': node.get('Relation Name'), 'filter': condition})
+                elif dialect_name in ('mysql', 'mariadb') and node.get('access_type') == 'ALL':
+                    condition = node.get('attached_condition')
+                    # Derived tables and CTEs are named like '<derived2>'.
+                    if not str(node.get('table_name')).startswith('<') and matches(node.get('table_name'), condition):
+                        scans.append({'table': node.get('table_name'), 'filter': condition})
+                for child in node.values():
+                    if isinstance(child, (list, dict)):
+                        walk(child)
+
+        if dialect_name == 'sqlite':
+            subqueries = {row['detail'].split()[1] for row in plan
+                          if row['detail'].startswith(SQLITE_SUBQUERY_DETAILS) and len(row['detail'].split()) > 1}
+            for row in plan:
+                detail = row['detail']
+                if not detail.startswith('SCAN ') or 'USING' in detail:
+                    continue
+                # Older SQLite versions report 'SCAN TABLE name' instead of 'SCAN name'.
+                words = detail.split()
+                scanned_table = words[2] if words[1] == 'TABLE' and len(words) > 2 else words[1]
+                # 'SCAN CONSTANT ROW', 'SCAN SUBQUERY 1' and 'SCAN (subquery-1)' name no table.
+                if scanned_table in ('CONSTANT', 'SUBQUERY') or scanned_table.startswith('('):
+                    continue
+                if scanned_table in subqueries:
+                    continue
+                if matches(scanned_table, None):
+                    scans.append({'table': scanned_table, 'filter': None})
+        else:
+            walk(plan)
+        return scans
+
+    @property
+    def captured_plans(self):
+        """
+        Returns the most recent slow-query records that received a plan.
+
+        Returns:
+            list[dict]: Slow-query records with an 'explain' entry.
+        """
+
+        with self._lock:
+            return list(self._captured)
+
+    def stats(self):
+        """
+        Returns counters describing the profiler's activity.
+
+        Returns:
+            dict: Pending requests, requests skipped by rate limiting and plans captured so far.
+        """
+
+        with self._lock:
+            return {'pending': self._pending, 'skipped': self._skipped, 'captured': len(self._captured)}
+
+    def close(self, wait=True):
+        """
+        Stops the background worker.
+
+        Args:
+            wait (bool, optional): Whether to wait for queued EXPLAINs to finish. Defaults to True.
+        """
+
+        self._executor.shutdown(wait=wait)
@@ -1,6 +1,27 @@
 import re
-from sqlalchemy import URL, create_engine
+import time
+from concurrent.futures import ThreadPoolExecutor
+from sqlalchemy import URL, create_engine, event, text
 from abc import ABC, abstractmethod
+from sqlalchemy_dbtoolkit.engine.fork_safety import make_fork_safe
+
+_IDENTIFIER_PATTERN = re.compile(r'^[A-Za-z_][A-Za-z0-9_$]*$')
+
+
+def _render_setting(kind, value):
+    """
+    Renders a session setting value as SQL according to its kind.
+    """
+
+    if kind == 'integer':
+        return str(int(value))
+    if kind == 'identifiers':
+        names = [name.strip() for name in value.split(',')] if isinstance(value, str) else list(value)
+        for name in names:
+            if not _IDENTIFIER_PATTERN.match(name):
+                raise ValueError(f"{name!r} is not a valid identifier")
+        return ', '.join(names)
+    return "'" + str(value).replace("'", "''") + "'"
 
 
 class BaseEngine(ABC):
@@ -18,6 +39,15 @@ class BaseEngine(ABC):
         'postgresql': 5432
     }
 
+    # Per-connection session settings supported by the dialect: name -> (SQL template, value kind).
+    SESSION_SETTING_TEMPLATES = {}
+
+    # DBAPI drivers selectable with the config 'driver' key, each mapped to the `create_engine`
+    # arguments that enable its fast paths. DRIVER_ALIASES maps package names to driver names.
+    DEFAULT_DRIVER = None
+    SUPPORTED_DRIVERS = {}
+    DRIVER_ALIASES = {}
+
     def __init__(self, db_name, config_path='../../.config/config.ini'):
         """
         Initialize the base engine with a sanitized database name and config path.
@@ -35,7 +65,9 @@ class BaseEngine(ABC):
         self.password = None
         self.host = None
         self.port = None
+        self.replicas = []
         self.engine = None
+        self.replica_engines = []
 
     @property
     @abstractmethod
@@ -96,12 +128,77 @@ class BaseEngine(ABC):
         )
         return connection_url
 
-    def initialize_engine(self, echo=False, **engine_kwargs):
+    def resolve_driver(self, driver_name):
+        """
+        Validate a configured driver name and return the SQLAlchemy driver name.
+
+        Args:
+            driver_name (str or None): Driver or package name from the config; None selects the default driver.
+
+        Returns:
+            str: The SQLAlchemy driver name, e.g. 'psycopg2'.
+        """
+
+        if not driver_name:
+            return self.DEFAULT_DRIVER
+        driver_name = self.DRIVER_ALIASES.get(driver_name.strip().lower(), driver_name.strip().lower())
+        if driver_name not in self.SUPPORTED_DRIVERS:
+            raise ValueError(f"{driver_name} is not in supported drivers for {self.dialect}: "
+                             f"{list(self.SUPPORTED_DRIVERS)}")
+        return driver_name
+
+    def apply_driver_options(self, engine_kwargs):
+        """
+        Merge the fast-path options of the selected driver into `create_engine` arguments.
+        Explicitly passed arguments, including individual `connect_args`, take precedence.
+
+        Args:
+            engine_kwargs (dict): Arguments for `create_engine`.
+
+        Returns:
+            dict: The merged arguments.
+        """
+
+        driver_options = self.SUPPORTED_DRIVERS.get(self.driver) or {}
+        merged = {**driver_options, **engine_kwargs}
+        if 'connect_args' in driver_options or 'connect_args' in engine_kwargs:
+            merged['connect_args'] = {**driver_options.get('connect_args', {}), **engine_kwargs.get('connect_args', {})}
+        return merged
+
+    def build_session_statements(self, session_settings):
+        """
+        Render session settings into the statements run on every new connection.
+
+        Args:
+            session_settings (dict): Setting names (see `SESSION_SETTING_TEMPLATES`) mapped to values,
+                e.g. {'timezone': 'UTC', 'statement_timeout_ms': 5000}.
+
+        Returns:
+            list[str]: SQL statements, empty if no settings are given.
+        """
+
+        statements = []
+        for name, value in (session_settings or {}).items():
+            if name not in self.SESSION_SETTING_TEMPLATES:
+                raise ValueError(f"{name} is not in supported session settings for {self.dialect}: "
+                                 f"{list(self.SESSION_SETTING_TEMPLATES)}")
+            template, kind = self.SESSION_SETTING_TEMPLATES[name]
+            statements.append(template.format(value=_render_setting(kind, value)))
+        return statements
+
+    def initialize_engine(self, echo=False, instrumentation=None, pool_monitor=None, session_settings=None,
+                          **engine_kwargs):
         """
         Create and return a SQLAlchemy engine for the target database.
+        The engine is fork-safe: forked child processes never reuse the parent's pooled connections,
+        and the fast-path options of the configured driver are applied.
 
         Args:
             echo (bool): If True, SQLAlchemy will log all SQL statements.
+            instrumentation (InstrumentationManager, optional): Statement instrumentation
+                to attach to the new engine.
+            pool_monitor (PoolMonitor, optional): Pool metrics collector to attach to the new engine.
+            session_settings (dict, optional): Session settings applied to every new connection.
             **engine_kwargs: Additional arguments passed to `create_engine`.
 
         Returns:
@@ -109,9 +206,150 @@ class BaseEngine(ABC):
         """
 
         connection_url = self.create_connection_url()
-        self.engine = create_engine(url=connection_url, echo=echo, **engine_kwargs)
+        self.engine = self._create_engine(connection_url, echo, instrumentation, pool_monitor,
+                                          self.build_session_statements(session_settings),
+                                          **self.apply_driver_options(engine_kwargs))
         return self.engine
 
+    def initialize_replica_engines(self, echo=False, instrumentation=None, pool_monitor=None, session_settings=None,
+                                   **engine_kwargs):
+        """
+        Create one engine per configured read replica of the target database.
+        Replicas share the credentials and database name of the primary.
+
+        Args:
+            echo (bool): If True, SQLAlchemy will log all SQL statements.
+            instrumentation (InstrumentationManager, optional): Statement instrumentation
+                to attach to the replica engines.
+            pool_monitor (PoolMonitor, optional): Pool metrics collector to attach to the replica engines.
+            session_settings (dict, optional): Session settings applied to every new connection.
+            **engine_kwargs: Additional arguments passed to `create_engine`.
+
+        Returns:
+            list[sqlalchemy.engine.Engine]: Replica engines, empty if no replicas are configured.
+        """
+
+        session_statements = self.build_session_statements(session_settings)
+        engine_kwargs = self.apply_driver_options(engine_kwargs)
+        self.replica_engines = []
+        for host, port in self.replicas:
+            replica_url = self.create_connection_url().set(host=host, port=port or self.port)
+            self.replica_engines.append(self._create_engine(replica_url, echo, instrumentation, pool_monitor,
+                                                            session_statements, **engine_kwargs))
+        return self.replica_engines
+
+    @staticmethod
+    def _create_engine(connection_url, echo, instrumentation, pool_monitor, session_statements=None,
+                       **engine_kwargs):
+        """
+        Create a fork-safe engine for a URL and attach the optional instrumentation, pool monitor
+        and per-connection session setup.
+        """
+
+        engine = make_fork_safe(create_engine(url=connection_url, echo=echo, **engine_kwargs))
+        if session_statements:
+            def apply_session_settings(dbapi_connection, connection_record):
+                cursor = dbapi_connection.cursor()
+                try:
+                    for statement in session_statements:
+                        cursor.execute(statement)
+                finally:
+                    cursor.close()
+                # Commit so that a later rollback on checkin does not revert the settings.
+                dbapi_connection.commit()
+
+            event.listen(engine, 'connect', apply_session_settings)
+        if instrumentation is not None:
+            instrumentation.attach(engine)
+        if pool_monitor is not None:
+            pool_monitor.attach(engine)
+        return engine
+
+    @staticmethod
+    def warm_up_engine(engine, connections=None):
+        """
+        Open pool connections concurrently and validate each with a ping, then return them to the pool.
+
+        All connections are held until every one is open, so each slot gets a fresh connection
+        including its TCP/TLS handshake, authentication and session setup.
+
+        Args:
+            engine (sqlalchemy.engine.Engine): Engine whose pool is warmed up.
+            connections (int, optional): Number of connections to open. Defaults to the pool size;
+                with zero connections (e.g. a pool of size 0) nothing is opened.
+
+        Returns:
+            dict: Opened and failed connection counts, the first errors, connect and ping latency
+                percentiles in milliseconds, and the elapsed seconds.
+        """
+
+        if connections is None:
+            pool_size = getattr(engine.pool, 'size', None)
+            connections = pool_size() if callable(pool_size) else 1
+        if connections < 1:
+            return {'opened': 0, 'failed': 0, 'errors': [], 'connect_ms': None, 'ping_ms': None, 'seconds': 0.0}
+
+        def open_connection(_):
+            start = time.perf_counter()
+            connection = engine.connect()
+            connected = time.perf_counter()
+            try:
+                connection.execute(text('SELECT 1'))
+            except Exception:
+                connection.close()
+                raise
+            return connection, (connected - start) * 1000, (time.perf_counter() - connected) * 1000
+
+        start = time.perf_counter()
+        opened, errors = [], []
+        with ThreadPoolExecutor(max_workers=connections, thread_name_prefix='pool-warm-up') as executor:
+            futures = [executor.submit(open_connection, index) for index in range(connections)]
+            for future in futures:
+                try:
+                    opened.append(future.result())
+                except Exception as e:
+                    errors.append(str(e).splitlines()[0])
+        for connection, _, _ in opened:
+            connection.close()
+
+        def percentiles(values):
+            if not values:
+                return None
+            values = sorted(values)
+
+            def pick(pct):
+                return round(values[min(len(values) - 1, int(pct / 100 * len(values)))], 3)
+
+            return {'min': round(values[0], 3), 'p50': pick(50), 'p95': pick(95), 'p99': pick(99),
+                    'max': round(values[-1], 3)}
+
+        return {
+            'opened': len(opened),
+            'failed': len(errors),
+            'errors': errors[:5],
+            'connect_ms': percentiles([connect_ms for _, connect_ms, _ in opened]),
+            'ping_ms': percentiles([ping_ms for _, _, ping_ms in opened]),
+            'seconds': round(time.perf_counter() - start, 3)
+        }
+
+    def warm_up_pool(self, connections=None):
+        """
+        Warm up the pools of the primary engine and of every replica engine.
+
+        Args:
+            connections (int, optional): Connections to open per engine. Defaults to each pool's size.
+
+        Returns:
+            dict: Warm-up stats of the primary and a list with the stats of each replica.
+        """
+
+        stats = {'primary': self.warm_up_engine(self.engine, connections),
+                 'replicas': [self.warm_up_engine(engine, connections) for engine in self.replica_engines]}
+        connect_ms = stats['primary']['connect_ms'] or {}
+        print(f"POOL WARMED UP: {stats['primary']['opened']} CONNECTIONS, "
+              f"CONNECT P99 {connect_ms.get('p99')} MS, {stats['primary']['failed']} FAILED")
+        return stats
+
     def connect_to_fallback_db(self):
         """
         Create a temporary engine to connect to a fallback database
@@ -128,10 +366,13 @@ class BaseEngine(ABC):
         return temporary_engine
 
     @abstractmethod
-    def establish_db_connection(self):
+    def establish_db_connection(self, **engine_kwargs):
         """
         Create or connect to the target database using the initialized configuration.
         To be implemented by subclasses.
+
+        Args:
+            **engine_kwargs: Additional arguments passed to `initialize_engine`.
         """
         pass
 
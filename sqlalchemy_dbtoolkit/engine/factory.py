@@ -1,6 +1,12 @@
-from sqlalchemy_dbtoolkit.engine.mysql_engine import MysqlEngine
-from sqlalchemy_dbtoolkit.engine.postgresql_engine import PostgreSQLEngine
-from sqlalchemy_dbtoolkit.engine.sqlite_engine import SqliteEngine
+from importlib import import_module
+
+# Engine classes are imported on demand so that importing the factory does not
+# pull in SQLAlchemy or any dialect-specific module before an engine is requested.
+SUPPORTED_ENGINES = {
+    'mysql': ('sqlalchemy_dbtoolkit.engine.mysql_engine', 'MysqlEngine'),
+    'postgresql': ('sqlalchemy_dbtoolkit.engine.postgresql_engine', 'PostgreSQLEngine'),
+    'sqlite': ('sqlalchemy_dbtoolkit.engine.sqlite_engine', 'SqliteEngine')
+}
 
 
 class AlchemyEngineFactory:
@@ -11,7 +17,9 @@ class AlchemyEngineFactory:
     Currently, supports MySQL and SQLite engines.
     """
 
-    def __init__(self, dbms, db_name, config_path='../../.config/config.ini'):
+    def __init__(self, dbms, db_name, config_path='../../.config/config.ini', instrumentation=None,
+                 pool_monitor=None, replica_strategy='round_robin', read_your_writes_s=0, session_settings=None,
+                 warm_up=False, engine_kwargs=None):
         """
         Initializes the AlchemyEngineFactory with the specified DBMS and database name.
 
@@ -19,20 +27,50 @@ class AlchemyEngineFactory:
             dbms (str): Type of database management system (e.g., 'mysql', 'postgresql', 'sqlite').
             db_name (str): Name of the target database.
             config_path (str): Path to the configuration file. Defaults to '../../.config/config.ini'.
+            instrumentation (InstrumentationManager, optional): Statement instrumentation
+                attached to the created engine.
+            pool_monitor (PoolMonitor, optional): Pool metrics collector attached to the created engine.
+            replica_strategy (str): Read replica selection, 'round_robin' or 'least_busy'.
+                Defaults to 'round_robin'.
+            read_your_writes_s (float): Seconds after a write during which reads of the same thread
+                stay on the primary. Defaults to 0 (disabled).
+            session_settings (dict, optional): Per-connection session settings, e.g.
+                {'timezone': 'UTC', 'statement_timeout_ms': 5000}. Supported names depend on the DBMS.
+            warm_up (bool or int): Open this many connections (True: the pool size) per engine
+                right away instead of on first use. Defaults to False.
+            engine_kwargs (dict, optional): Additional arguments passed to `create_engine` for the primary
+                and replica engines, e.g. {'pool_size': 20, 'max_overflow': 10, 'pool_timeout': 5}.
         """
 
         self.dbms = dbms
         self.db_name = db_name
         self.config_path = config_path
+        self.instrumentation = instrumentation
+        self.pool_monitor = pool_monitor
+        self.session_settings = session_settings
+        self.engine_kwargs = engine_kwargs or {}
+        self.engine_instance = None
+        self.warm_up_stats = None
 
         self.validate_supported_dbms()
         self.engine = self.initialize_engine()
 
+        from sqlalchemy_dbtoolkit.engine.group import EngineGroup
+        self.replica_engines = self.engine_instance.initialize_replica_engines(
+            instrumentation=self.instrumentation, pool_monitor=self.pool_monitor,
+            session_settings=self.session_settings, **self.engine_kwargs)
+        self.engine_group = EngineGroup(self.engine, replicas=self.replica_engines, strategy=replica_strategy,
+                                        read_your_writes_s=read_your_writes_s)
+        if warm_up:
+            connections = None if warm_up is True else warm_up
+            self.warm_up_stats = self.engine_instance.warm_up_pool(connections=connections)
+
     def validate_supported_dbms(self):
         """
         Validates that the provided DBMS is supported.
         """
-        supported_dbms = ['mysql', 'postgresql', 'sqlite']
+
+        supported_dbms = list(SUPPORTED_ENGINES)
         if self.dbms not in supported_dbms:
             raise ValueError(f"{self.dbms} is not in supported DBMS: {supported_dbms}")
 
@@ -45,15 +83,11 @@ class AlchemyEngineFactory:
             sqlalchemy.engine.Engine: Initialized SQLAlchemy engine.
         """
 
-        if self.dbms == 'mysql':
-            engine_instance = MysqlEngine(db_name=self.db_name, config_path=self.config_path)
-            engine_instance.establish_db_connection()
-            return engine_instance.engine
-        elif self.dbms == 'postgresql':
-            engine_instance = PostgreSQLEngine(db_name=self.db_name, config_path=self.config_path)
-            engine_instance.establish_db_connection()
-            return engine_instance.engine
-        elif self.dbms == 'sqlite':
-            engine_instance = SqliteEngine(db_name=self.db_name, config_path=self.config_path)
-            engine_instance.establish_db_connection()
-            return engine_instance.engine
+        module_path, class_name = SUPPORTED_ENGINES[self.dbms]
+        engine_class = getattr(import_module(module_path), class_name)
+        self.engine_instance = engine_class(db_name=self.db_name, config_path=self.config_path)
+        self.engine_instance.establish_db_connection(instrumentation=self.instrumentation,
+                                                     pool_monitor=self.pool_monitor,
+                                                     session_settings=self.session_settings,
+                                                     **self.engine_kwargs)
+        return self.engine_instance.engine
@@ -0,0 +1,61 @@
+import os
+import weakref
+
+from sqlalchemy import event, exc
+
+_fork_safe_engines = weakref.WeakSet()
+
+
+def _reset_pools_after_fork():
+    """
+    Replaces the pools of all fork-safe engines in a freshly forked child process.
+
+    `dispose(close=False)` drops the inherited connections without closing them,
+    so the sockets still used by the parent process are left untouched.
+    """
+
+    for engine in list(_fork_safe_engines):
+        engine.dispose(close=False)
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_pools_after_fork)
+
+
+def _record_pid(dbapi_connection, connection_record):
+    connection_record.info['dbtoolkit_pid'] = os.getpid()
+
+
+def _check_pid(dbapi_connection, connection_record, connection_proxy):
+    pid = os.getpid()
+    if connection_record.info.get('dbtoolkit_pid') != pid:
+        # The connection was created by another process; detach it without closing
+        # the parent's socket and let the pool open a fresh one.
+        connection_record.dbapi_connection = connection_proxy.dbapi_connection = None
+        raise exc.DisconnectionError(
+            f"Connection record belongs to pid {connection_record.info.get('dbtoolkit_pid')}, "
+            f"attempting to check out in pid {pid}")
+
+
+def make_fork_safe(engine):
+    """
+    Protects an engine's pool from being shared across forked processes.
+
+    Pools are reset in the child right after `os.fork()` (where supported), and every
+    checkout verifies that the connection was opened by the current process, which also
+    covers connections that were checked out while the fork happened.
+
+    Args:
+        engine (sqlalchemy.engine.Engine): Engine to protect.
+
+    Returns:
+        sqlalchemy.engine.Engine: The same engine.
+    """
+
+    if engine in _fork_safe_engines:
+        return engine
+
+    _fork_safe_engines.add(engine)
+    event.listen(engine, 'connect', _record_pid)
+    event.listen(engine, 'checkout', _check_pid)
+    return engine
@@ -0,0 +1,111 @@
+import itertools
+import threading
+import time
+
+
+class EngineGroup:
+    """
+    A primary engine with an optional set of read-replica engines.
+
+    Reads are routed to the replicas (round-robin or least-busy), writes always go to
+    the primary. With a read-your-writes window, reads issued by the same thread shortly
+    after a write are pinned to the primary so they cannot observe replication lag.
+    """
+
+    STRATEGIES = ('round_robin', 'least_busy')
+
+    def __init__(self, primary, replicas=None, strategy='round_robin', read_your_writes_s=0):
+        """
+        Initializes the EngineGroup.
+
+        Args:
+            primary (sqlalchemy.engine.Engine): Engine connected to the primary database.
+            replicas (list[sqlalchemy.engine.Engine], optional): Engines connected to read replicas.
+                Without replicas all reads go to the primary.
+            strategy (str, optional): Replica selection, 'round_robin' or 'least_busy'
+                (fewest checked-out pool connections). Defaults to 'round_robin'.
+            read_your_writes_s (float, optional): Seconds after a write during which reads from the
+                same thread are served by the primary. Defaults to 0 (disabled).
+        """
+
+        if strategy not in self.STRATEGIES:
+            raise ValueError(f"{strategy} is not in supported strategies: {list(self.STRATEGIES)}")
+
+        self.primary = primary
+        self.replicas = list(replicas or [])
+        self.strategy = strategy
+        self.read_your_writes_s = read_your_writes_s
+        self._counter = itertools.count()
+        self._local = threading.local()
+
+    @property
+    def engines(self):
+        """
+        Returns all engines of the group, primary first.
+
+        Returns:
+            list[sqlalchemy.engine.Engine]: The primary followed by the replicas.
+        """
+
+        return [self.primary] + self.replicas
+
+    def get_write_engine(self):
+        """
+        Returns the engine used for writes.
+
+        Returns:
+            sqlalchemy.engine.Engine: The primary engine.
+        """
+
+        return self.primary
+
+    def get_read_engine(self):
+        """
+        Selects the engine for a read-only unit of work.
+
+        Returns:
+            sqlalchemy.engine.Engine: A replica engine, or the primary if there are no replicas
+            or the current thread wrote within the read-your-writes window.
+        """
+
+        if not self.replicas or self.is_pinned_to_primary():
+            return self.primary
+
+        if self.strategy == 'least_busy':
+            offset = next(self._counter)
+            candidates = self.replicas[offset % len(self.replicas):] + self.replicas[:offset % len(self.replicas)]
+            return min(candidates, key=self._checked_out)
+        return self.replicas[next(self._counter) % len(self.replicas)]
+
+    @staticmethod
+    def _checked_out(engine):
+        checked_out = getattr(engine.pool, 'checkedout', None)
+        return checked_out() if callable(checked_out) else 0
+
+    def mark_write(self):
+        """
+        Records a write by the current thread, starting its read-your-writes window.
+        """
+
+        self._local.last_write = time.monotonic()
+
+    def is_pinned_to_primary(self):
+        """
+        Checks whether reads of the current thread are pinned to the primary.
+
+        Returns:
+            bool: True if the current thread wrote within the read-your-writes window.
+        """
+
+        if not self.read_your_writes_s:
+            return False
+        last_write = getattr(self._local, 'last_write', None)
+        return last_write is not None and time.monotonic() - last_write < self.read_your_writes_s
+
+    def dispose(self):
+        """
+        Disposes the connection pools of all engines in the group.
+        """
+
+        for engine in self.engines:
+            engine.dispose()
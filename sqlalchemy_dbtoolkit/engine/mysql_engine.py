@@ -10,6 +10,23 @@ class MysqlEngine(BaseEngine):
     Manages engine initialization, configuration loading, and database creation for MySQL databases.
     """
 
+    SESSION_SETTING_TEMPLATES = {
+        'timezone': ("SET time_zone = {value}", 'literal'),
+        'statement_timeout_ms': ("SET SESSION max_execution_time = {value}", 'integer'),
+        'lock_timeout_s': ("SET SESSION innodb_lock_wait_timeout = {value}", 'integer')
+    }
+
+    DEFAULT_DRIVER = 'mysqlconnector'
+    SUPPORTED_DRIVERS = {
+        'mysqlconnector': {'connect_args': {'use_pure': False}},   # C extension instead of pure Python
+        'mysqldb': {},   # mysqlclient, C extension; batches executemany INSERTs natively
+        'pymysql': {}   # pure Python; batches executemany INSERTs natively
+    }
+    DRIVER_ALIASES = {
+        'mysqlclient': 'mysqldb',
+        'mysql-connector-python': 'mysqlconnector'
+    }
+
     def __init__(self, db_name, config_path='../../.config/config.ini'):
         """
         Initializes the MysqlEngine with the given database name and config path.
@@ -20,7 +37,7 @@ class MysqlEngine(BaseEngine):
         """
 
         super().__init__(db_name, config_path)
-        self.driver = 'mysqlconnector'
+        self.driver = self.DEFAULT_DRIVER
         self.load_config()
 
     @property
@@ -55,12 +72,17 @@ class MysqlEngine(BaseEngine):
             self.password = config.mysql_password
             self.host = config.mysql_host
             self.port = config.mysql_port or self.DEFAULT_DB_PORTS.get(self.dialect)
+            self.replicas = config.mysql_replicas
+            self.driver = self.resolve_driver(config.mysql_driver)
         except Exception as e:
             raise RuntimeError(f"Failed to load configuration: {e}")
 
-    def establish_db_connection(self):
+    def establish_db_connection(self, **engine_kwargs):
         """
         Checks if the database exists; creates it if necessary, then initializes the engine.
+
+        Args:
+            **engine_kwargs: Additional arguments passed to `initialize_engine`.
         """
 
         if not self.database_exists():
@@ -68,7 +90,7 @@ class MysqlEngine(BaseEngine):
             print("DB CREATED READY TO CONTINUE")
         else:
             print("DB ALREADY EXISTED")
-        self.initialize_engine()
+        self.initialize_engine(**engine_kwargs)
 
     def database_exists(self):
         """
@@ -10,6 +10,23 @@ class PostgreSQLEngine(BaseEngine):
     Manages engine initialization, configuration loading, and database creation for PostgreSQL databases.
     """
 
+    SESSION_SETTING_TEMPLATES = {
+        'timezone': ("SET TIME ZONE {value}", 'literal'),
+        'search_path': ("SET search_path TO {value}", 'identifiers'),
+        'statement_timeout_ms': ("SET statement_timeout = {value}", 'integer'),
+        'lock_timeout_ms': ("SET lock_timeout = {value}", 'integer')
+    }
+
+    DEFAULT_DRIVER = 'psycopg2'
+    SUPPORTED_DRIVERS = {
+        'psycopg2': {'executemany_mode': 'values_plus_batch'},   # multi-row VALUES for INSERT, batches otherwise
+        'psycopg': {'connect_args': {'prepare_threshold': 1}}   # psycopg 3: server-side prepared statements
+    }
+    DRIVER_ALIASES = {
+        'psycopg3': 'psycopg',
+        'psycopg2-binary': 'psycopg2'
+    }
+
     def __init__(self, db_name, config_path='../../.config/config.ini'):
         """
         Initializes the PostgreSQLEngine with the given database name and config path.
@@ -20,7 +37,7 @@ class PostgreSQLEngine(BaseEngine):
         """
 
         super().__init__(db_name, config_path)
-        self.driver = 'psycopg2'
+        self.driver = self.DEFAULT_DRIVER
         self.load_config()
 
     @property
@@ -54,12 +71,17 @@ class PostgreSQLEngine(BaseEngine):
             self.password = config.postgresql_password
             self.host = config.postgresql_host
             self.port = config.postgresql_port or self.DEFAULT_DB_PORTS.get(self.dialect)
+            self.replicas = config.postgresql_replicas
+            self.driver = self.resolve_driver(config.postgresql_driver)
         except Exception as e:
             raise RuntimeError(f"Failed to load configuration: {e}")
 
-    def establish_db_connection(self):
+    def establish_db_connection(self, **engine_kwargs):
         """
         Checks if the database exists; creates it if necessary, then initializes the engine.
+
+        Args:
+            **engine_kwargs: Additional arguments passed to `initialize_engine`.
         """
 
         if not self.database_exists():
@@ -67,7 +89,7 @@ class PostgreSQLEngine(BaseEngine):
             print("DB CREATED READY TO CONTINUE")
         else:
             print("DB ALREADY EXISTED")
-        self.initialize_engine()
+        self.initialize_engine(**engine_kwargs)
 
     def database_exists(self):
         """
@@ -1,7 +1,13 @@
 from sqlalchemy_dbtoolkit.utils.config import Config
 from sqlalchemy_dbtoolkit.engine.builder import BaseEngine
+from sqlalchemy_dbtoolkit.utils.files import atomic_write
 import os
+import pathlib
+import sqlite3
+import threading
+import time
 from sqlalchemy import URL
+from sqlalchemy.pool import StaticPool
 
 
 class SqliteEngine(BaseEngine):
@@ -9,8 +15,25 @@ class SqliteEngine(BaseEngine):
     SQLite-specific implementation of the BaseEngine abstract class.
 
     Manages engine initialization and configuration loading for SQLite databases.
+
+    The optional `mode` of the [sqlite] section selects how the database is opened:
+    'rw' (default) opens the database file read-write; 'ro' opens it read-only with the
+    `immutable` flag, so any number of processes read it without locking (the file must not
+    change while it is open); 'memory' keeps the database in a shared-cache in-memory database
+    on a single connection (`StaticPool`), seeded from the database file if it exists and
+    written back to it with `persist_to_disk` or every `persist_interval_s` seconds.
     """
 
+    SESSION_SETTING_TEMPLATES = {
+        'busy_timeout_ms': ("PRAGMA busy_timeout = {value}", 'integer')
+    }
+
+    SUPPORTED_MODES = ('rw', 'ro', 'memory')
+
+    # Pages copied per backup step and pause between steps, so writers on the engine's connection interleave.
+    BACKUP_PAGES_PER_STEP = 1024
+    BACKUP_STEP_SLEEP_S = 0.01
+
     def __init__(self, db_name, config_path='../../.config/config.ini'):
         """
         Initializes the SqliteEngine with the given database name and config path.
@@ -22,6 +45,11 @@ class SqliteEngine(BaseEngine):
 
         super().__init__(db_name, config_path)
         self.sqlite_dir_path = None
+        self.mode = 'rw'
+        self.persist_interval_s = None
+        self._persist_stop = None
+        self._persist_thread = None
+        self._persist_path = None
         self.load_config()
 
     @property
@@ -53,36 +81,245 @@ class SqliteEngine(BaseEngine):
 
         try:
             config = Config(config_path=self.config_path)
-            self.sqlite_dir_path = config.sqlite_path
+            self.mode = (config.sqlite_mode or 'rw').strip().lower()
+            if self.mode not in self.SUPPORTED_MODES:
+                raise ValueError(f"{self.mode} is not in supported SQLite modes: {list(self.SUPPORTED_MODES)}")
+            self.persist_interval_s = config.sqlite_persist_interval
+            try:
+                self.sqlite_dir_path = config.sqlite_path
+            except KeyError:
+                # An in-memory database does not need a file unless it is seeded or persisted.
+                if self.mode != 'memory':
+                    raise
         except Exception as e:
             raise RuntimeError(f"Failed to load configuration: {e}")
 
+    @property
+    def database_path(self):
+        """
+        Returns the path of the database file.
+
+        Returns:
+            str: Path to `<db_name>.db` in the configured directory, or None if no directory is configured.
+        """
+
+        if self.sqlite_dir_path is None:
+            return None
+        return os.path.join(self.sqlite_dir_path, f'{self.db_name}.db')
+
     def create_connection_url(self):
         """
         Constructs a SQLAlchemy connection URL for the SQLite database.
         Default SQLite URL string is: 'sqlite:///your_database_name.db'
+        Read-only URL string is: 'sqlite:///file:///path/your_database_name.db?immutable=1&mode=ro&uri=true'
+        In-memory URL string is: 'sqlite:///file:your_database_name?cache=shared&mode=memory&uri=true'
 
         Returns:
             sqlalchemy.engine.URL: The SQLite connection URL.
         """
 
-        database_path = os.path.join(self.sqlite_dir_path, f'{self.db_name}.db')
+        if self.mode == 'ro':
+            return URL.create(
+                drivername=self.dialect,
+                database=pathlib.Path(os.path.abspath(self.database_path)).as_uri(),
+                query={'mode': 'ro', 'immutable': '1', 'uri': 'true'}
+            )
+        if self.mode == 'memory':
+            return URL.create(
+                drivername=self.dialect,
+                database=f'file:{self.db_name}',
+                query={'mode': 'memory', 'cache': 'shared', 'uri': 'true'}
+            )
         connection_url = URL.create(
             drivername=self.dialect,
-            database=database_path
+            database=self.database_path
         )
         return connection_url
 
-    def establish_db_connection(self):
+    def establish_db_connection(self, **engine_kwargs):
         """
         Initializes the database engine after verifying the target path exists.
+
+        Args:
+            **engine_kwargs: Additional arguments passed to `initialize_engine`.
         """
+
+        if self.mode == 'memory':
+            self.establish_memory_db(**engine_kwargs)
+            return
+
         if not os.path.exists(self.sqlite_dir_path):
             raise FileNotFoundError(f"SQLite path '{self.sqlite_dir_path}' does not exist.")
 
-        self.initialize_engine()
+        if self.mode == 'ro':
+            if not os.path.exists(self.database_path):
+                raise FileNotFoundError(f"SQLite database '{self.database_path}' does not exist.")
+            self.initialize_engine(**engine_kwargs)
+            print(f"DB OPENED READ-ONLY at: {self.database_path}")
+            return
+
+        self.initialize_engine(**engine_kwargs)
         print(f"DB CREATED at: {os.path.join(self.sqlite_dir_path, f'{self.db_name}.db')}")
 
+    def establish_memory_db(self, **engine_kwargs):
+        """
+        Initializes the in-memory engine on a single shared connection, seeds it from the
+        database file if one exists and starts the periodic persist if an interval is configured.
+
+        Args:
+            **engine_kwargs: Additional arguments passed to `initialize_engine`.
+        """
+
+        engine_kwargs.setdefault('poolclass', StaticPool)
+        engine_kwargs['connect_args'] = {'check_same_thread': False, **engine_kwargs.get('connect_args', {})}
+        self.initialize_engine(**engine_kwargs)
+        # Open the single pooled connection now: the shared in-memory database lives as long as it does.
+        self.engine.connect().close()
+        print(f"DB CREATED IN MEMORY: {self.db_name}")
+
+        if self.database_path is not None and os.path.exists(self.database_path):
+            self.load_from_disk()
+        if self.persist_interval_s:
+            self.start_periodic_persist(self.persist_interval_s)
+
+    def _snapshot_connection(self):
+        """
+        Opens a separate connection to the shared-cache in-memory database, so loading and persisting
+        never check out (and, on check-in, reset) the engine's single connection.
+        """
+
+        if self.mode != 'memory' or self.engine is None:
+            raise RuntimeError("Loading and persisting require an initialized SQLite engine in 'memory' mode")
+        return sqlite3.connect(f'file:{self.db_name}?mode=memory&cache=shared', uri=True)
+
+    def _backup(self, source, target, timeout_s):
+        """
+        Runs the online backup in steps and aborts it after `timeout_s` seconds, e.g. while a transaction
+        on the engine's connection keeps the shared-cache database locked.
+        """
+
+        deadline = time.monotonic() + timeout_s
+
+        def check_deadline(status, remaining, total):
+            if time.monotonic() > deadline:
+                raise RuntimeError(f"SQLite backup did not finish within {timeout_s} seconds "
+                                   f"({remaining} of {total} pages left)")
+
+        source.backup(target, pages=self.BACKUP_PAGES_PER_STEP, progress=check_deadline,
+                      sleep=self.BACKUP_STEP_SLEEP_S)
+
+    def _resolve_file_path(self, path):
+        path = path or self.database_path
+        if path is None:
+            raise ValueError("No file path given and no 'path' configured under [sqlite] section.")
+        return path
+
+    def load_from_disk(self, path=None, timeout_s=30):
+        """
+        Replaces the in-memory database with the contents of a database file, using the SQLite online backup API.
+
+        Args:
+            path (str, optional): Database file to load. Defaults to the configured database file.
+            timeout_s (float, optional): Seconds after which a blocked load is abandoned. Defaults to 30.
+        """
+
+        path = self._resolve_file_path(path)
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"SQLite database '{path}' does not exist.")
+
+        memory = self._snapshot_connection()
+        try:
+            source = sqlite3.connect(path)
+            try:
+                self._backup(source, memory, timeout_s)
+            finally:
+                source.close()
+        finally:
+            memory.close()
+        print(f"DB LOADED INTO MEMORY from: {path}")
+
+    def persist_to_disk(self, path=None, timeout_s=30):
+        """
+        Writes a consistent snapshot of the in-memory database to a database file, using the SQLite online
+        backup API. The snapshot is written to a temporary file that then atomically replaces the target,
+        so readers of the file never see a partial copy. The snapshot only contains committed data; while
+        a transaction on the engine's connection holds a write lock, the backup waits for it.
+
+        Args:
+            path (str, optional): Target database file. Defaults to the configured database file.
+            timeout_s (float, optional): Seconds after which a blocked persist is abandoned and its
+                temporary file removed. Defaults to 30.
+
+        Returns:
+            str: Path of the written file.
+        """
+
+        path = self._resolve_file_path(path)
+        memory = self._snapshot_connection()
+
+        def write(temporary_path):
+            target = sqlite3.connect(temporary_path)
+            try:
+                self._backup(memory, target, timeout_s)
+            finally:
+                target.close()
+
+        try:
+            return atomic_write(path, write)
+        finally:
+            memory.close()
+
+    def start_periodic_persist(self, interval_s, path=None):
+        """
+        Persists the in-memory database to disk every `interval_s` seconds in a daemon thread.
+
+        Args:
+            interval_s (float): Seconds between persists.
+            path (str, optional): Target database file. Defaults to the configured database file.
+        """
+
+        if interval_s <= 0:
+            raise ValueError("interval_s must be positive")
+        self._snapshot_connection().close()
+        path = self._resolve_file_path(path)
+        self.stop_periodic_persist(final=False)
+
+        stop = threading.Event()
+
+        def persist_loop():
+            while not stop.wait(interval_s):
+                try:
+                    self.persist_to_disk(path)
+                except Exception as e:
+                    print(f"DB PERSIST FAILED: {e}")
+
+        self._persist_stop = stop
+        self._persist_path = path
+        self._persist_thread = threading.Thread(target=persist_loop, name=f'sqlite-persist-{self.db_name}',
+                                                daemon=True)
+        self._persist_thread.start()
+        print(f"DB PERSISTING EVERY {interval_s} S to: {path}")
+
+    def stop_periodic_persist(self, final=True, path=None):
+        """
+        Stops the periodic persist.
+
+        Args:
+            final (bool, optional): Persist once more after stopping, if a periodic persist was running.
+                Defaults to True.
+            path (str, optional): Target database file of the final persist. Defaults to the file
+                the periodic persist wrote to.
+        """
+
+        if self._persist_thread is None:
+            return
+        self._persist_stop.set()
+        self._persist_thread.join()
+        persist_path = path or self._persist_path
+        self._persist_stop = self._persist_thread = self._persist_path = None
+        if final:
+            self.persist_to_disk(persist_path)
+
     def database_exists(self):
         """
         SQLite does not require a separate 'exists' check for databases.
@@ -0,0 +1,272 @@
+import csv
+import gzip
+import hashlib
+import os
+import time
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import Column, MetaData, delete, insert, inspect, select, types
+from sqlalchemy import Table as CoreTable
+
+from sqlalchemy_dbtoolkit.io.csv_stream import csv_row_serializer
+from sqlalchemy_dbtoolkit.io.incremental import decode_watermark, encode_watermark
+from sqlalchemy_dbtoolkit.orm.session import ORMSessionManager
+from sqlalchemy_dbtoolkit.utils.files import atomic_write
+from sqlalchemy_dbtoolkit.utils.query_operators import get_filter_operator
+
+ARCHIVE_FILE_FORMATS = {'csv': '.csv.gz', 'parquet': '.parquet'}
+
+
+def build_archive_table(Table, suffix='_archive'):
+    """
+    Builds the archive table of a model: the same column names, types and primary key under
+    `<table><suffix>`, without defaults, indexes or foreign keys.
+
+    Args:
+        Table (Base): A SQLAlchemy ORM model/table class.
+        suffix (str, optional): Suffix appended to the table name. Defaults to '_archive'.
+
+    Returns:
+        sqlalchemy.Table: The archive table, not yet created.
+    """
+
+    source = inspect(Table).local_table
+    columns = [Column(column.name, column.type, primary_key=column.primary_key, nullable=column.nullable,
+                      autoincrement=False)
+               for column in source.columns]
+    return CoreTable(f'{source.name}{suffix}', MetaData(schema=source.schema), *columns)
+
+
+class ArchiveManager:
+    """
+    Moves cold rows out of a table into an archive table or compressed files.
+
+    Rows matching an age predicate are moved in batches ordered by primary key. Each batch is
+    selected and locked (FOR UPDATE where supported), copied and deleted in one transaction, so
+    a row is never deleted without having been copied. An optional pause between batches keeps
+    the load on the database low, and the position of the last moved batch is checkpointed in a
+    watermark store, so an interrupted run resumes where it stopped with its original cutoff.
+
+    File archives are written as one file per batch (gzip-compressed CSV or Parquet), named after
+    the batch's first and last key, before the batch's delete commits. A failure in between leaves
+    the batch in the table and in a file; the resumed run selects the same keys and overwrites that
+    file, so unless the table changed in the meantime the archive holds no duplicates.
+    """
+
+    def __init__(self, engine, store=None, batch_size=5000, pause_s=0.0):
+        """
+        Initializes the ArchiveManager with a SQLAlchemy engine.
+
+        Args:
+            engine (sqlalchemy.Engine): An initialized SQLAlchemy engine.
+            store (FileWatermarkStore or TableWatermarkStore, optional): Where checkpoints are kept.
+                Without a store an interrupted run starts over, which is safe but rescans the table.
+            batch_size (int, optional): Rows moved per transaction. Defaults to 5000.
+            pause_s (float, optional): Seconds to sleep between batches. Defaults to 0.
+        """
+
+        self.session_manager = ORMSessionManager(engine)
+        self.store = store
+        self.batch_size = batch_size
+        self.pause_s = pause_s
+
+    def create_archive_table(self, Table, suffix='_archive'):
+        """
+        Creates the archive table of a model if it does not exist.
+
+        Args:
+            Table (Base): A SQLAlchemy ORM model/table class.
+            suffix (str, optional): Suffix appended to the table name. Defaults to '_archive'.
+
+        Returns:
+            sqlalchemy.Table: The archive table.
+        """
+
+        archive = build_archive_table(Table, suffix)
+        with self.session_manager.session_scope() as session:
+            archive.create(session.connection(), checkfirst=True)
+        return archive
+
+    @staticmethod
+    def _resolve_cutoff(column, cutoff):
+        """
+        Turns a timedelta age into an absolute cutoff; naive timestamp columns are assumed to hold UTC.
+        """
+
+        if not isinstance(cutoff, timedelta):
+            return cutoff
+        now = datetime.now(timezone.utc)
+        if isinstance(column.type, types.DateTime) and not column.type.timezone:
+            now = now.replace(tzinfo=None)
+        return now - cutoff
+
+    def _run(self, Table, column_name, cutoff, operator_name, name, target, move_batch, max_batches):
+        """
+        Moves batches with `move_batch(connection, table, key_column, keys, run_id)` until no
+        matching rows are left, checkpointing after every committed batch.
+        """
+
+        table = inspect(Table).local_table
+        column = table.columns.get(column_name)
+        if column is None:
+            raise AttributeError(f"{column_name} is not a valid column of {Table.__name__}")
+        primary_key = list(table.primary_key.columns)
+        if len(primary_key) != 1:
+            raise ValueError(f"{Table.__name__} needs a single-column primary key for batched archival")
+        key_column = primary_key[0]
+        operator_func = get_filter_operator(operator_name=operator_name)
+
+        name = name or f"archive.{table.fullname}.{target}"
+        state = self.store.get(name) if self.store is not None else None
+        if state and not state['complete']:
+            # Resume the interrupted run with its original cutoff.
+            cutoff = decode_watermark(state['cutoff'])
+            last_key = decode_watermark(state['key'])
+            archived, batches, run_id = state['archived'], state['batches'], state['run_id']
+            print(f"ARCHIVE RESUMED: {name} AFTER KEY {last_key}")
+        else:
+            cutoff = self._resolve_cutoff(column, cutoff)
+            last_key, archived, batches = None, 0, 0
+            run_id = datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%S')
+
+        def checkpoint(complete):
+            if self.store is not None:
+                self.store.set(name, {'cutoff': encode_watermark(cutoff), 'key': encode_watermark(last_key),
+                                      'archived': archived, 'batches': batches, 'run_id': run_id,
+                                      'complete': complete})
+
+        start = time.perf_counter()
+        complete = False
+        batches_this_run = 0
+        while max_batches is None or batches_this_run < max_batches:
+            if batches_this_run and self.pause_s:
+                time.sleep(self.pause_s)
+
+            condition = operator_func(column, cutoff)
+            if last_key is not None:
+                condition = condition & (key_column > last_key)
+            query = select(key_column).where(condition).order_by(key_column).limit(self.batch_size).with_for_update()
+            with self.session_manager.session_scope() as session:
+                connection = session.connection()
+                keys = connection.execute(query).scalars().all()
+                if keys:
+                    move_batch(connection, table, key_column, keys, run_id)
+                    deleted = connection.execute(delete(table).where(key_column.in_(keys))).rowcount
+            if not keys:
+                complete = True
+                break
+
+            last_key = keys[-1]
+            archived += deleted
+            batches += 1
+            batches_this_run += 1
+            checkpoint(False)
+
+        checkpoint(complete)
+        print(f"ARCHIVED {archived} ROWS FROM {table.fullname} TO {target} IN {batches} BATCHES"
+              + ("" if complete else " (INCOMPLETE)"))
+        return {'archived': archived, 'batches': batches, 'complete': complete,
+                'cutoff': cutoff, 'seconds': round(time.perf_counter() - start, 3)}
+
+    def archive_to_table(self, Table, column_name, cutoff, operator_name='lt', suffix='_archive', name=None,
+                         max_batches=None):
+        """
+        Moves rows matching an age predicate into the archive table `<table><suffix>`, created if missing.
+
+        Args:
+            Table (Base): A SQLAlchemy ORM model/table class.
+            column_name (str): The age column to filter by, e.g. 'created_at'.
+            cutoff (Any or timedelta): Rows whose column compares to the cutoff with `operator_name` are
+                moved. A timedelta means 'older than' relative to now (UTC).
+            operator_name (str, optional): The filter operator to use (default 'lt').
+            suffix (str, optional): Suffix of the archive table. Defaults to '_archive'.
+            name (str, optional): Checkpoint name. Defaults to 'archive.<table>.<archive table>'.
+            max_batches (int, optional): Stop after this many batches; the next run resumes. Defaults to no limit.
+
+        Returns:
+            dict: Rows archived and batches of the whole run, whether it completed, the cutoff used and
+                the elapsed seconds of this call.
+        """
+
+        archive = self.create_archive_table(Table, suffix)
+
+        def move_batch(connection, table, key_column, keys, run_id):
+            rows = select(*table.columns).where(key_column.in_(keys))
+            connection.execute(insert(archive).from_select(table.columns.keys(), rows))
+
+        return self._run(Table, column_name, cutoff, operator_name, name, archive.fullname, move_batch, max_batches)
+
+    def archive_to_files(self, Table, column_name, cutoff, directory, file_format='csv', operator_name='lt',
+                         name=None, max_batches=None, compression='zstd'):
+        """
+        Moves rows matching an age predicate into compressed files, one per batch, named
+        `<table>-<run>-<first key>-<last key>.csv.gz` or `.parquet` in a directory.
+
+        Args:
+            Table (Base): A SQLAlchemy ORM model/table class.
+            column_name (str): The age column to filter by, e.g. 'created_at'.
+            cutoff (Any or timedelta): Rows whose column compares to the cutoff with `operator_name` are
+                moved. A timedelta means 'older than' relative to now (UTC).
+            directory (str): Target directory, created if missing.
+            file_format (str, optional): 'csv' (gzip-compressed) or 'parquet' (requires pyarrow). Defaults to 'csv'.
+            operator_name (str, optional): The filter operator to use (default 'lt').
+            name (str, optional): Checkpoint name. Defaults to 'archive.<table>.<directory>'.
+            max_batches (int, optional): Stop after this many batches; the next run resumes. Defaults to no limit.
+            compression (str, optional): Parquet compression codec. Defaults to 'zstd'.
+
+        Returns:
+            dict: Rows archived and batches of the whole run, whether it completed, the cutoff used and
+                the elapsed seconds of this call.
+        """
+
+        if file_format not in ARCHIVE_FILE_FORMATS:
+            raise ValueError(f"{file_format} is not in supported archive formats: {list(ARCHIVE_FILE_FORMATS)}")
+        os.makedirs(directory, exist_ok=True)
+        table = inspect(Table).local_table
+        if file_format == 'parquet':
+            from sqlalchemy_dbtoolkit.io.parquet import arrow_schema_from_model
+            schema = arrow_schema_from_model(table)
+
+        def move_batch(connection, table, key_column, keys, run_id):
+            rows = connection.execute(select(table).where(key_column.in_(keys)).order_by(key_column)).all()
+            path = os.path.join(directory, f"{table.name}-{run_id}-{self._key_label(keys[0])}-"
+                                           f"{self._key_label(keys[-1])}{ARCHIVE_FILE_FORMATS[file_format]}")
+            if file_format == 'csv':
+                self._write_csv(path, table, rows)
+            else:
+                self._write_parquet(path, table, schema, rows, compression)
+
+        return self._run(Table, column_name, cutoff, operator_name, name, os.path.abspath(directory), move_batch,
+                         max_batches)
+
+    @staticmethod
+    def _key_label(key):
+        """
+        Renders a key for a file name: integers as they are, other keys as a short hash.
+        """
+
+        if isinstance(key, int):
+            return str(key)
+        return hashlib.md5(str(key).encode()).hexdigest()[:12]
+
+    @staticmethod
+    def _write_csv(path, table, rows):
+        serialize = csv_row_serializer(table.columns)
+
+        def write(temp_path):
+            with gzip.open(temp_path, 'wt', newline='', encoding='utf-8') as csv_file:
+                writer = csv.writer(csv_file)
+                writer.writerow(table.columns.keys())
+                writer.writerows(serialize(row) for row in rows)
+
+        atomic_write(path, write, prefix='.archive-')
+
+    @staticmethod
+    def _write_parquet(path, table, schema, rows, compression):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        from sqlalchemy_dbtoolkit.io.parquet import record_batch_from_rows
+
+        record_batch = record_batch_from_rows(rows, table, schema)
+        atomic_write(path, lambda temp_path: pq.write_table(pa.Table.from_batches([record_batch]), temp_path,
+                                                            compression=compression), prefix='.archive-')
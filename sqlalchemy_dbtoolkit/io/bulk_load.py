@@ -0,0 +1,155 @@
+import io
+import json
+from datetime import date, datetime, time as time_of_day, timedelta
+
+from sqlalchemy import insert, types
+
+# Characters that must be backslash-escaped in PostgreSQL's COPY text format.
+_COPY_ESCAPES = str.maketrans({'\\': '\\\\', '\t': '\\t', '\n': '\\n', '\r': '\\r'})
+
+COPY_DRIVERS = ('psycopg2', 'psycopg')
+
+
+def bulk_load_method(connection):
+    """
+    Returns the bulk path `bulk_load` uses for a connection.
+
+    Args:
+        connection (sqlalchemy.engine.Connection): Connection to the target database.
+
+    Returns:
+        str: 'copy' for PostgreSQL through psycopg2 or psycopg, otherwise 'executemany'.
+    """
+
+    dialect = connection.dialect
+    if dialect.name == 'postgresql' and dialect.driver in COPY_DRIVERS:
+        return 'copy'
+    return 'executemany'
+
+
+def _text_value(value):
+    # Text of a non-null value before COPY escaping.
+    if isinstance(value, bool):
+        return 't' if value else 'f'
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return '\\x' + bytes(value).hex()
+    if isinstance(value, (datetime, date, time_of_day)):
+        return value.isoformat()
+    if isinstance(value, timedelta):
+        return f'{value.days} days {value.seconds} seconds {value.microseconds} microseconds'
+    if isinstance(value, (dict, list)):
+        return json.dumps(value)
+    return str(value)
+
+
+def _copy_text_value(value):
+    if value is None:
+        return '\\N'
+    return _text_value(value).translate(_COPY_ESCAPES)
+
+
+def _copy_array_literal(values):
+    elements = []
+    for element in values:
+        if element is None:
+            elements.append('NULL')
+        elif isinstance(element, (list, tuple)):
+            elements.append(_copy_array_literal(element))
+        else:
+            elements.append('"' + _text_value(element).replace('\\', '\\\\').replace('"', '\\"') + '"')
+    return '{' + ','.join(elements) + '}'
+
+
+def _copy_serializer(column_type, dialect):
+    """
+    Builds the function that renders one column's values in COPY text format.
+
+    Only TypeDecorator.process_bind_param runs; the dialect's bind processors are not applied, as
+    they produce driver adapter objects (e.g. Binary or Json wrappers) rather than plain values.
+    """
+
+    decorators = []
+    column_type = column_type.dialect_impl(dialect)
+    while isinstance(column_type, types.TypeDecorator):
+        decorators.append(column_type)
+        column_type = column_type.impl_instance
+
+    if isinstance(column_type, types.JSON):
+        def render(value):
+            if value is types.JSON.NULL or (value is None and not column_type.none_as_null):
+                return 'null'
+            return '\\N' if value is None else json.dumps(value).translate(_COPY_ESCAPES)
+    elif isinstance(column_type, types.ARRAY):
+        def render(value):
+            return '\\N' if value is None else _copy_array_literal(value).translate(_COPY_ESCAPES)
+    elif isinstance(column_type, types.Enum) and column_type.enum_class is not None:
+        # Enum members are stored as their names (or `values_callable` values), as the bind processor would.
+        members = list(column_type.enum_class.__members__.values())
+        lookup = dict(zip(reversed(members), reversed(column_type.enums)))
+
+        def render(value):
+            return _copy_text_value(lookup.get(value, value))
+    else:
+        render = _copy_text_value
+
+    if not decorators:
+        return render
+
+    def serialize(value):
+        for decorator in decorators:
+            value = decorator.process_bind_param(value, dialect)
+        return render(value)
+
+    return serialize
+
+
+def _copy_rows(connection, table, rows):
+    dialect = connection.dialect
+    preparer = dialect.identifier_preparer
+    # COPY bypasses SQLAlchemy's parameter handling, so each column type renders its own text.
+    serializers = [_copy_serializer(column.type, dialect) for column in table.columns]
+    columns = ', '.join(preparer.quote(column.name) for column in table.columns)
+    statement = f"COPY {preparer.format_table(table)} ({columns}) FROM STDIN"
+
+    buffer = io.StringIO()
+    for row in rows:
+        buffer.write('\t'.join([serialize(value) for serialize, value in zip(serializers, row)]))
+        buffer.write('\n')
+    buffer.seek(0)
+
+    cursor = connection.connection.cursor()
+    try:
+        if dialect.driver == 'psycopg2':
+            cursor.copy_expert(statement, buffer)
+        else:
+            with cursor.copy(statement) as copy:
+                copy.write(buffer.getvalue())
+    finally:
+        cursor.close()
+
+
+def bulk_load(connection, table, rows):
+    """
+    Loads rows into a table using the fastest bulk path of the connection's driver.
+
+    PostgreSQL through psycopg2 or psycopg uses COPY FROM STDIN. Every other backend uses an
+    executemany insert, which SQLAlchemy batches into multi-row VALUES statements where the
+    driver supports it. The caller controls the transaction.
+
+    Args:
+        connection (sqlalchemy.engine.Connection): Connection to the target database.
+        table (sqlalchemy.Table): Target table.
+        rows (list[Sequence]): Rows with one value per table column, in column order.
+
+    Returns:
+        int: Number of rows loaded.
+    """
+
+    if not rows:
+        return 0
+    if bulk_load_method(connection) == 'copy':
+        _copy_rows(connection, table, rows)
+    else:
+        keys = table.columns.keys()
+        connection.execute(insert(table), [dict(zip(keys, row)) for row in rows])
+    return len(rows)
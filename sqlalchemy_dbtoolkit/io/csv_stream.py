@@ -0,0 +1,354 @@
+import csv
+import json
+import time
+import uuid
+from datetime import date, datetime, time as time_of_day
+from decimal import Decimal
+
+from sqlalchemy import select, types
+
+from sqlalchemy_dbtoolkit.query.create import InsertManager
+from sqlalchemy_dbtoolkit.utils.query_operators import get_filter_operator
+
+# Null markers are compared case-insensitively after stripping whitespace. By default only empty fields
+# are NULL, plus 'nan' in numeric columns, where it cannot be a legitimate value; text such as 'NA' or
+# 'None' is kept as is. EXTENDED_NULL_MARKERS opts into the common spellings of missing values.
+DEFAULT_NULL_MARKERS = frozenset({''})
+NUMERIC_NULL_MARKERS = frozenset({'nan'})
+EXTENDED_NULL_MARKERS = frozenset({'', 'null', 'none', 'nan', 'na', 'n/a', '\\n'})
+
+TRUE_VALUES = frozenset({'true', 't', '1', 'yes', 'y'})
+FALSE_VALUES = frozenset({'false', 'f', '0', 'no', 'n'})
+
+
+def _parse_bool(value):
+    lowered = value.strip().lower()
+    if lowered in TRUE_VALUES:
+        return True
+    if lowered in FALSE_VALUES:
+        return False
+    raise ValueError(f"invalid boolean {value!r}")
+
+
+def _parse_int(value):
+    try:
+        return int(value)
+    except ValueError:
+        number = float(value)
+        if not number.is_integer():
+            raise ValueError(f"invalid integer {value!r}")
+        return int(number)
+
+
+def _parse_datetime(value):
+    # datetime.fromisoformat only accepts a trailing 'Z' from Python 3.11 on.
+    return datetime.fromisoformat(value.strip().replace('Z', '+00:00'))
+
+
+def column_coercer(column):
+    """
+    Builds a function that converts a CSV string into a Python value for a column.
+
+    Args:
+        column (sqlalchemy.Column): Target column.
+
+    Returns:
+        callable: Converts a non-null string value, raising ValueError for invalid input.
+    """
+
+    column_type = column.type
+    if isinstance(column_type, types.Boolean):
+        return _parse_bool
+    if isinstance(column_type, types.Integer):
+        return _parse_int
+    if isinstance(column_type, types.Float):
+        return float
+    if isinstance(column_type, types.Numeric):
+        return Decimal if column_type.asdecimal else float
+    if isinstance(column_type, types.DateTime):
+        return _parse_datetime
+    if isinstance(column_type, types.Date):
+        return lambda value: date.fromisoformat(value.strip())
+    if isinstance(column_type, types.Time):
+        return lambda value: time_of_day.fromisoformat(value.strip())
+    if isinstance(column_type, types.JSON):
+        return json.loads
+    if isinstance(column_type, types.Uuid):
+        return uuid.UUID if column_type.as_uuid else lambda value: str(uuid.UUID(value))
+    if isinstance(column_type, types.Enum):
+        allowed = set(column_type.enums)
+
+        def parse_enum(value):
+            if value not in allowed:
+                raise ValueError(f"{value!r} is not one of {sorted(allowed)}")
+            return value
+
+        return parse_enum
+    if isinstance(column_type, types.String) and column_type.length:
+        length = column_type.length
+
+        def parse_string(value):
+            if len(value) > length:
+                raise ValueError(f"value exceeds length {length}")
+            return value
+
+        return parse_string
+    return lambda value: value
+
+
+def csv_row_serializer(columns, null_value=''):
+    """
+    Builds a function that turns a result row into CSV field values: JSON columns are serialized
+    with json.dumps and NULLs are written as `null_value`.
+
+    Args:
+        columns (Iterable[sqlalchemy.Column]): Columns of the rows, in row order.
+        null_value (str, optional): Text written for NULL values. Defaults to ''.
+
+    Returns:
+        callable: Converts a row into a list of field values.
+    """
+
+    json_indexes = [index for index, column in enumerate(columns) if isinstance(column.type, types.JSON)]
+
+    def serialize(row):
+        values = list(row)
+        for index in json_indexes:
+            if values[index] is not None:
+                values[index] = json.dumps(values[index])
+        return [null_value if value is None else value for value in values]
+
+    return serialize
+
+
+class _RejectWriter:
+    """
+    Lazily opened CSV file collecting rejected records with their line number and error.
+    """
+
+    def __init__(self, path, fieldnames, delimiter):
+        self.path = path
+        self.fieldnames = list(fieldnames) + ['_line', '_error']
+        self.delimiter = delimiter
+        self.count = 0
+        self._file = None
+        self._writer = None
+
+    def write(self, line_number, record, error):
+        self.count += 1
+        if self.path is None:
+            return
+        if self._writer is None:
+            self._file = open(self.path, 'w', newline='', encoding='utf-8')
+            self._writer = csv.DictWriter(self._file, fieldnames=self.fieldnames, delimiter=self.delimiter,
+                                          extrasaction='ignore')
+            self._writer.writeheader()
+        self._writer.writerow(dict(record, _line=line_number, _error=error))
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+
+
+class CSVManager:
+    """
+    Streams CSV files into and out of tables with bounded memory.
+
+    Imports read the file with the csv module, coerce every value using the SQLAlchemy
+    type of its column, map null markers to None in the same pass and insert fixed-size
+    chunks through InsertManager's bulk insert path. Records that fail coercion or
+    insertion are written to a rejected-rows file instead of aborting the import.
+    """
+
+    def __init__(self, engine, chunk_size=10000, null_markers=DEFAULT_NULL_MARKERS):
+        """
+        Initializes the CSVManager with a SQLAlchemy engine.
+
+        Args:
+            engine (sqlalchemy.Engine): An initialized SQLAlchemy engine.
+            chunk_size (int, optional): Rows per insert batch and export fetch. Defaults to 10000.
+            null_markers (Iterable[str], optional): Values treated as NULL, compared case-insensitively
+                after stripping whitespace. Defaults to DEFAULT_NULL_MARKERS (empty fields only; numeric
+                columns also treat 'nan' as NULL). Pass EXTENDED_NULL_MARKERS to also map 'null', 'none',
+                'na', 'n/a' and '\\n'.
+        """
+
+        self.engine = engine
+        self.chunk_size = chunk_size
+        self.null_markers = frozenset(marker.lower() for marker in null_markers)
+        self.inserter = InsertManager(engine)
+
+    def _prepare_columns(self, table, fieldnames):
+        """
+        Resolves the CSV header against the table and returns (column, coercer, omit_if_null, null_markers)
+        per known field.
+        """
+
+        prepared = {}
+        for fieldname in fieldnames:
+            column = table.columns.get(fieldname)
+            if column is None:
+                continue
+            # Columns with a default (or an autoincrement key) are left out when null, so the default applies.
+            omit_if_null = (column.default is not None or column.server_default is not None
+                            or (column.primary_key and column.autoincrement in (True, 'auto')
+                                and isinstance(column.type, types.Integer)))
+            null_markers = self.null_markers
+            if isinstance(column.type, (types.Integer, types.Float, types.Numeric)):
+                null_markers = null_markers | NUMERIC_NULL_MARKERS
+            prepared[fieldname] = (column, column_coercer(column), omit_if_null, null_markers)
+        return prepared
+
+    def coerce_record(self, record, columns):
+        """
+        Converts one CSV record into a row dictionary for the table.
+
+        Args:
+            record (dict): Raw record from csv.DictReader.
+            columns (dict): Prepared columns from the CSV header.
+
+        Raises:
+            ValueError: If a value cannot be converted or a required value is missing.
+
+        Returns:
+            dict: Row values keyed by column name.
+        """
+
+        row = {}
+        for fieldname, (column, coercer, omit_if_null, null_markers) in columns.items():
+            value = record.get(fieldname)
+            if value is None or value.strip().lower() in null_markers:
+                if omit_if_null:
+                    continue
+                if column.nullable is False:
+                    raise ValueError(f"{fieldname}: missing value for non-nullable column")
+                row[fieldname] = None
+                continue
+            try:
+                row[fieldname] = coercer(value)
+            except (ValueError, TypeError, ArithmeticError) as e:
+                raise ValueError(f"{fieldname}: {e}")
+        return row
+
+    def _flush(self, Table, batch, rejects):
+        """
+        Inserts a batch; if the batch fails, retries its rows one by one to isolate the bad records.
+
+        Returns:
+            int: The number of rows inserted.
+        """
+
+        if not batch:
+            return 0
+        try:
+            return self.inserter.bulk_insert_rows(Table, [row for _, _, row in batch])
+        except Exception:
+            inserted = 0
+            for line_number, record, row in batch:
+                try:
+                    inserted += self.inserter.bulk_insert_rows(Table, [row])
+                except Exception as e:
+                    rejects.write(line_number, record, str(e).splitlines()[0])
+            return inserted
+
+    def import_file(self, Table, path, rejects_path=None, delimiter=',', encoding='utf-8'):
+        """
+        Imports a CSV file with a header row into a table.
+
+        Header fields that are not columns of the table are ignored.
+
+        Args:
+            Table (Base): A SQLAlchemy ORM model/table class.
+            path (str): Source CSV file.
+            rejects_path (str, optional): File receiving rejected records with '_line' and '_error'
+                columns. Rejected records are only counted if omitted.
+            delimiter (str, optional): Field delimiter. Defaults to ','.
+            encoding (str, optional): File encoding. Defaults to 'utf-8'.
+
+        Returns:
+            dict: Rows read, inserted and rejected, ignored header fields, elapsed seconds and rows per second.
+        """
+
+        table = Table.__table__
+        start = time.perf_counter()
+        rows_read = 0
+        rows_inserted = 0
+
+        with open(path, newline='', encoding=encoding) as csv_file:
+            reader = csv.DictReader(csv_file, delimiter=delimiter)
+            fieldnames = reader.fieldnames or []
+            columns = self._prepare_columns(table, fieldnames)
+            rejects = _RejectWriter(rejects_path, fieldnames, delimiter)
+            try:
+                batch = []
+                for record in reader:
+                    rows_read += 1
+                    try:
+                        batch.append((reader.line_num, record, self.coerce_record(record, columns)))
+                    except ValueError as e:
+                        rejects.write(reader.line_num, record, str(e))
+                        continue
+                    if len(batch) >= self.chunk_size:
+                        rows_inserted += self._flush(Table, batch, rejects)
+                        batch = []
+                rows_inserted += self._flush(Table, batch, rejects)
+            finally:
+                rejects.close()
+
+        seconds = time.perf_counter() - start
+        return {
+            'rows_read': rows_read,
+            'rows_inserted': rows_inserted,
+            'rows_rejected': rejects.count,
+            'rejects_path': rejects_path if rejects.count else None,
+            'ignored_columns': [fieldname for fieldname in fieldnames if fieldname not in columns],
+            'seconds': round(seconds, 3),
+            'rows_per_second': round(rows_inserted / seconds, 1) if seconds else None
+        }
+
+    def export_file(self, Table, path, column_name=None, column_value=None, operator_name='eq', delimiter=',',
+                    encoding='utf-8', null_value=''):
+        """
+        Exports the rows of a table, optionally filtered by a column, to a CSV file with a header row.
+
+        Args:
+            Table (Base): A SQLAlchemy ORM model/table class.
+            path (str): Destination CSV file.
+            column_name (str, optional): The column name to filter by. Exports all rows if omitted.
+            column_value (Any, optional): The value to match in the specified column.
+            operator_name (str, optional): The filter operator to use (default 'eq').
+                Supported operators: eq, ne, gt, lt, ge, le, like, in, etc.
+            delimiter (str, optional): Field delimiter. Defaults to ','.
+            encoding (str, optional): File encoding. Defaults to 'utf-8'.
+            null_value (str, optional): Text written for NULL values. Defaults to ''.
+
+        Returns:
+            dict: Rows written, elapsed seconds and rows per second.
+        """
+
+        table = Table.__table__
+        statement = select(table)
+        if column_name is not None:
+            column = table.columns.get(column_name)
+            if column is None:
+                raise AttributeError(f"{column_name} is not a valid column of {Table.__name__}")
+            operator_func = get_filter_operator(operator_name=operator_name)
+            statement = statement.where(operator_func(column, column_value))
+
+        serialize = csv_row_serializer(table.columns, null_value)
+        start = time.perf_counter()
+        rows = 0
+        with open(path, 'w', newline='', encoding=encoding) as csv_file, self.engine.connect() as connection:
+            writer = csv.writer(csv_file, delimiter=delimiter)
+            writer.writerow(table.columns.keys())
+            result = connection.execution_options(stream_results=True, yield_per=self.chunk_size).execute(statement)
+            for batch in result.partitions(self.chunk_size):
+                writer.writerows(serialize(row) for row in batch)
+                rows += len(batch)
+
+        seconds = time.perf_counter() - start
+        return {
+            'rows_written': rows,
+            'seconds': round(seconds, 3),
+            'rows_per_second': round(rows / seconds, 1) if seconds else None
+        }
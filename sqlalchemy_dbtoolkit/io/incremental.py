@@ -0,0 +1,318 @@
+import json
+import os
+import threading
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+
+from sqlalchemy import Column, DateTime, MetaData, String, Text, and_, insert, inspect, or_, select, update
+from sqlalchemy import Table as CoreTable
+
+from sqlalchemy_dbtoolkit.orm.session import ORMSessionManager
+from sqlalchemy_dbtoolkit.utils.files import atomic_write
+
+# Watermark values are stored as tagged strings so that both stores can round-trip them.
+_ENCODERS = {
+    datetime: ('datetime', datetime.isoformat),
+    date: ('date', date.isoformat),
+    int: ('int', str),
+    float: ('float', repr),
+    Decimal: ('decimal', str),
+    str: ('str', str),
+}
+_DECODERS = {
+    'datetime': datetime.fromisoformat,
+    'date': date.fromisoformat,
+    'int': int,
+    'float': float,
+    'decimal': Decimal,
+    'str': str,
+}
+
+
+def encode_watermark(value):
+    """
+    Converts a watermark or key value into a JSON-serializable `[type, text]` pair.
+
+    Args:
+        value (datetime | date | int | float | Decimal | str | None): Value to encode.
+
+    Returns:
+        list | None: The tagged value, or None for None.
+    """
+
+    if value is None:
+        return None
+    for value_type, (tag, to_text) in _ENCODERS.items():
+        if type(value) is value_type:
+            return [tag, to_text(value)]
+    raise ValueError(f"Unsupported watermark type: {type(value).__name__}")
+
+
+def decode_watermark(encoded):
+    """
+    Restores a value produced by `encode_watermark`.
+
+    Args:
+        encoded (list | None): A `[type, text]` pair.
+
+    Returns:
+        datetime | date | int | float | Decimal | str | None: The original value.
+    """
+
+    if encoded is None:
+        return None
+    tag, text = encoded
+    if tag not in _DECODERS:
+        raise ValueError(f"Unsupported watermark type: {tag}")
+    return _DECODERS[tag](text)
+
+
+class FileWatermarkStore:
+    """
+    Keeps watermark states in a local JSON file.
+    Every update rewrites the file to a temporary file in the same directory and renames it over the
+    original, so a crash never leaves a partially written state behind.
+    """
+
+    def __init__(self, path):
+        """
+        Initializes the FileWatermarkStore.
+
+        Args:
+            path (str): Path of the JSON state file, created on the first update.
+        """
+
+        self.path = path
+        self._lock = threading.Lock()
+
+    def _read(self):
+        try:
+            with open(self.path, encoding='utf-8') as state_file:
+                return json.load(state_file)
+        except FileNotFoundError:
+            return {}
+
+    def get(self, name):
+        """
+        Returns the stored state for a name.
+
+        Args:
+            name (str): Name of the extraction.
+
+        Returns:
+            dict | None: The stored state, or None if nothing has been stored yet.
+        """
+
+        with self._lock:
+            return self._read().get(name)
+
+    def set(self, name, state):
+        """
+        Atomically stores the state for a name.
+
+        Args:
+            name (str): Name of the extraction.
+            state (dict): JSON-serializable state.
+        """
+
+        with self._lock:
+            states = self._read()
+            states[name] = state
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+
+            def write(temp_path):
+                with open(temp_path, 'w', encoding='utf-8') as temp_file:
+                    json.dump(states, temp_file, indent=2, sort_keys=True)
+
+            atomic_write(self.path, write, prefix='.watermarks-')
+
+
+class TableWatermarkStore:
+    """
+    Keeps watermark states in a toolkit-managed table of the target database.
+    Each update runs in its own transaction.
+    """
+
+    def __init__(self, engine, table_name='dbtoolkit_watermarks', schema=None):
+        """
+        Initializes the TableWatermarkStore and creates its state table if it does not exist.
+
+        Args:
+            engine (sqlalchemy.Engine): An initialized SQLAlchemy engine.
+            table_name (str, optional): Name of the state table. Defaults to 'dbtoolkit_watermarks'.
+            schema (str, optional): Schema of the state table. Defaults to None.
+        """
+
+        self.engine = engine
+        self.table = CoreTable(
+            table_name, MetaData(schema=schema),
+            Column('name', String(255), primary_key=True),
+            Column('state', Text, nullable=False),
+            Column('updated_at', DateTime(timezone=True), nullable=False),
+        )
+        self.table.create(engine, checkfirst=True)
+
+    def get(self, name):
+        """
+        Returns the stored state for a name.
+
+        Args:
+            name (str): Name of the extraction.
+
+        Returns:
+            dict | None: The stored state, or None if nothing has been stored yet.
+        """
+
+        with self.engine.connect() as connection:
+            state = connection.execute(select(self.table.c.state).where(self.table.c.name == name)).scalar()
+        return json.loads(state) if state is not None else None
+
+    def set(self, name, state):
+        """
+        Stores the state for a name.
+
+        Args:
+            name (str): Name of the extraction.
+            state (dict): JSON-serializable state.
+        """
+
+        values = {'state': json.dumps(state, sort_keys=True), 'updated_at': datetime.now(timezone.utc)}
+        with self.engine.begin() as connection:
+            result = connection.execute(update(self.table).where(self.table.c.name == name).values(**values))
+            if result.rowcount == 0:
+                connection.execute(insert(self.table).values(name=name, **values))
+
+
+class IncrementalExtractor:
+    """
+    Extracts only the rows added or changed since the previous run.
+
+    Rows are read in batches ordered by (watermark column, primary key) using keyset pagination,
+    and the position of the last row of each batch is persisted once the consumer has processed
+    the batch. An interrupted run therefore resumes after the last completed batch. Rows with a
+    NULL watermark are never extracted.
+
+    Late-arriving rows, committed with a watermark below one already extracted, are picked up
+    by the overlap window: each run restarts `overlap` before the stored watermark, so rows in
+    that window are delivered again and consumers should upsert.
+    """
+
+    def __init__(self, engine, store, batch_size=10000):
+        """
+        Initializes the IncrementalExtractor.
+
+        Args:
+            engine (sqlalchemy.Engine or EngineGroup): An initialized SQLAlchemy engine, or an
+                EngineGroup whose read replicas serve the queries.
+            store (FileWatermarkStore or TableWatermarkStore): Where watermarks are persisted.
+            batch_size (int, optional): Maximum number of rows per batch. Defaults to 10000.
+        """
+
+        self.session_manager = ORMSessionManager(engine)
+        self.store = store
+        self.batch_size = batch_size
+
+    @staticmethod
+    def _get_columns(Table, watermark_column):
+        if not hasattr(Table, watermark_column):
+            raise AttributeError(f"{Table.__name__} has no column named '{watermark_column}'")
+        primary_key = list(inspect(Table).primary_key)
+        if len(primary_key) != 1:
+            raise ValueError(f"{Table.__name__} needs a single-column primary key for keyset pagination")
+        return getattr(Table, watermark_column), getattr(Table, primary_key[0].key)
+
+    @staticmethod
+    def _default_name(Table, watermark_column):
+        return f"{inspect(Table).local_table.fullname}.{watermark_column}"
+
+    def get_watermark(self, Table, watermark_column, name=None):
+        """
+        Returns the stored watermark for a table.
+
+        Args:
+            Table (Base): A SQLAlchemy ORM model/table class.
+            watermark_column (str): Name of the watermark column.
+            name (str, optional): State name. Defaults to '<table>.<watermark_column>'.
+
+        Returns:
+            The watermark value, or None if the table has not been extracted yet.
+        """
+
+        state = self.store.get(name or self._default_name(Table, watermark_column))
+        return decode_watermark(state['watermark']) if state else None
+
+    def reset(self, Table, watermark_column, name=None, watermark=None):
+        """
+        Overwrites the stored watermark, e.g. to force a full re-extraction with `watermark=None`.
+
+        Args:
+            Table (Base): A SQLAlchemy ORM model/table class.
+            watermark_column (str): Name of the watermark column.
+            name (str, optional): State name. Defaults to '<table>.<watermark_column>'.
+            watermark (optional): The new watermark. Rows with exactly this watermark are extracted again.
+        """
+
+        self.store.set(name or self._default_name(Table, watermark_column),
+                       {'watermark': encode_watermark(watermark), 'key': None})
+
+    def extract(self, Table, watermark_column, overlap=None, name=None):
+        """
+        Yields the rows past the stored watermark in ordered batches.
+
+        The watermark is persisted when the consumer requests the next batch, so a batch counts as
+        processed only once the loop body handling it has finished.
+
+        Args:
+            Table (Base): A SQLAlchemy ORM model/table class.
+            watermark_column (str): Name of a timestamp or monotonically increasing column.
+            overlap (timedelta | int, optional): How far before the stored watermark each run restarts.
+                A timedelta for timestamp columns, a number for numeric columns. Defaults to None.
+            name (str, optional): State name. Defaults to '<table>.<watermark_column>'.
+
+        Yields:
+            list[Base]: A batch of ORM model instances, ordered by watermark and primary key.
+        """
+
+        watermark_attribute, key_attribute = self._get_columns(Table, watermark_column)
+        name = name or self._default_name(Table, watermark_column)
+
+        state = self.store.get(name)
+        watermark = decode_watermark(state['watermark']) if state else None
+        key = decode_watermark(state.get('key')) if state else None
+
+        if watermark is not None and overlap:
+            if isinstance(watermark, (datetime, date)) and not isinstance(overlap, timedelta):
+                raise ValueError("overlap must be a timedelta for date and timestamp watermarks")
+            condition = watermark_attribute >= watermark - overlap
+        elif watermark is not None and key is not None:
+            condition = or_(watermark_attribute > watermark,
+                            and_(watermark_attribute == watermark, key_attribute > key))
+        elif watermark is not None:
+            condition = watermark_attribute >= watermark
+        else:
+            condition = watermark_attribute.is_not(None)
+
+        while True:
+            query = (select(Table).where(condition)
+                     .order_by(watermark_attribute, key_attribute)
+                     .limit(self.batch_size))
+            with self.session_manager.session_scope(commit=False) as session:
+                batch = session.scalars(query).all()
+            if not batch:
+                return
+
+            last = batch[-1]
+            last_watermark = getattr(last, watermark_attribute.key)
+            last_key = getattr(last, key_attribute.key)
+            yield batch
+
+            # Never move the stored watermark backwards when re-reading the overlap window.
+            if watermark is None or last_watermark > watermark or (
+                    last_watermark == watermark and (key is None or last_key > key)):
+                self.store.set(name, {'watermark': encode_watermark(last_watermark),
+                                      'key': encode_watermark(last_key)})
+
+            if len(batch) < self.batch_size:
+                return
+            condition = or_(watermark_attribute > last_watermark,
+                            and_(watermark_attribute == last_watermark, key_attribute > last_key))
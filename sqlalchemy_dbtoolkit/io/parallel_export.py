@@ -0,0 +1,303 @@
+import csv
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from sqlalchemy import func, inspect, select
+
+
+class CSVSink:
+    """
+    Writes each exported partition to its own CSV file.
+    """
+
+    def __init__(self, directory, prefix='part', header=True):
+        """
+        Initializes the CSVSink.
+
+        Args:
+            directory (str): Output directory, created if missing.
+            prefix (str, optional): File name prefix. Defaults to 'part'.
+            header (bool, optional): Whether each file starts with a header row. Defaults to True.
+        """
+
+        self.directory = directory
+        self.prefix = prefix
+        self.header = header
+        os.makedirs(directory, exist_ok=True)
+
+    def write_partition(self, index, table, batches):
+        """
+        Writes the batches of one partition to `<prefix>-<index>.csv`.
+
+        Args:
+            index (int): Partition index.
+            table (sqlalchemy.Table): Exported table.
+            batches (Iterable[list[tuple]]): Row batches in primary key order.
+
+        Returns:
+            dict: Output path and number of rows written.
+        """
+
+        path = os.path.join(self.directory, f'{self.prefix}-{index:05d}.csv')
+        rows = 0
+        with open(path, 'w', newline='', encoding='utf-8') as csv_file:
+            writer = csv.writer(csv_file)
+            if self.header:
+                writer.writerow(table.columns.keys())
+            for batch in batches:
+                writer.writerows(batch)
+                rows += len(batch)
+        return {'path': path, 'rows': rows}
+
+
+class ParquetSink:
+    """
+    Writes each exported partition to its own Parquet file, one row group per batch.
+    The Arrow schema is derived from the table's column types. Requires pyarrow.
+    """
+
+    def __init__(self, directory, prefix='part', compression='snappy'):
+        """
+        Initializes the ParquetSink.
+
+        Args:
+            directory (str): Output directory, created if missing.
+            prefix (str, optional): File name prefix. Defaults to 'part'.
+            compression (str, optional): Parquet compression codec. Defaults to 'snappy'.
+        """
+
+        self.directory = directory
+        self.prefix = prefix
+        self.compression = compression
+        os.makedirs(directory, exist_ok=True)
+
+    def write_partition(self, index, table, batches):
+        """
+        Writes the batches of one partition to `<prefix>-<index>.parquet`.
+
+        Args:
+            index (int): Partition index.
+            table (sqlalchemy.Table): Exported table.
+            batches (Iterable[list[tuple]]): Row batches in primary key order.
+
+        Returns:
+            dict: Output path and number of rows written.
+        """
+
+        import pyarrow.parquet as pq
+        from sqlalchemy_dbtoolkit.io.parquet import arrow_schema_from_model, record_batch_from_rows
+
+        path = os.path.join(self.directory, f'{self.prefix}-{index:05d}.parquet')
+        schema = arrow_schema_from_model(table)
+        rows = 0
+        with pq.ParquetWriter(path, schema, compression=self.compression) as writer:
+            for batch in batches:
+                writer.write_batch(record_batch_from_rows(batch, table, schema))
+                rows += len(batch)
+        return {'path': path, 'rows': rows}
+
+
+class DataFrameSink:
+    """
+    Collects each exported partition as a list of pandas DataFrame chunks in memory.
+    """
+
+    def __init__(self):
+        """
+        Initializes an empty DataFrameSink.
+        """
+
+        self.chunks = {}
+        self._lock = threading.Lock()
+
+    def write_partition(self, index, table, batches):
+        """
+        Converts the batches of one partition to DataFrame chunks.
+
+        Args:
+            index (int): Partition index.
+            table (sqlalchemy.Table): Exported table.
+            batches (Iterable[list[tuple]]): Row batches in primary key order.
+
+        Returns:
+            dict: Number of chunks and rows collected.
+        """
+
+        import pandas as pd
+
+        column_names = table.columns.keys()
+        chunks = [pd.DataFrame.from_records(batch, columns=column_names) for batch in batches]
+        with self._lock:
+            self.chunks[index] = chunks
+        return {'path': None, 'chunks': len(chunks), 'rows': sum(len(chunk) for chunk in chunks)}
+
+    def to_dataframe(self):
+        """
+        Concatenates all chunks in partition order.
+
+        Returns:
+            pandas.DataFrame: The complete export.
+        """
+
+        import pandas as pd
+
+        chunks = [chunk for index in sorted(self.chunks) for chunk in self.chunks[index]]
+        return pd.concat(chunks, ignore_index=True) if chunks else pd.DataFrame()
+
+
+class ParallelTableExporter:
+    """
+    Exports a table in parallel by splitting it into primary key ranges.
+
+    Each range is read on its own pooled connection by a worker thread with a streaming
+    (server-side where supported) cursor and handed to a sink in fetch-sized batches.
+    A manifest records the ranges in primary key order, so the partitions can be
+    reassembled deterministically. The engine's pool should allow at least `max_workers`
+    concurrent connections.
+    """
+
+    METHODS = ('minmax', 'quantile')
+
+    def __init__(self, engine, max_workers=None, fetch_size=10000):
+        """
+        Initializes the ParallelTableExporter.
+
+        Args:
+            engine (sqlalchemy.engine.Engine): Engine connected to the source database.
+            max_workers (int, optional): Number of concurrent readers. Defaults to the CPU count.
+            fetch_size (int, optional): Rows fetched and passed to the sink per batch. Defaults to 10000.
+        """
+
+        self.engine = engine
+        self.max_workers = max_workers or os.cpu_count() or 4
+        self.fetch_size = fetch_size
+
+    @staticmethod
+    def get_primary_key(Table):
+        """
+        Returns the single primary key column used to split the table.
+
+        Args:
+            Table (Base): A SQLAlchemy ORM model/table class.
+
+        Returns:
+            sqlalchemy.Column: The primary key column.
+        """
+
+        primary_key = list(inspect(Table).primary_key)
+        if len(primary_key) != 1:
+            raise ValueError(f"{Table.__name__} needs a single-column primary key for range partitioning")
+        return primary_key[0]
+
+    def compute_ranges(self, Table, partitions, method='minmax'):
+        """
+        Splits the primary key space into contiguous ranges.
+
+        'minmax' divides the interval between the smallest and largest integer key evenly;
+        'quantile' picks boundaries at evenly spaced row offsets, which balances skewed keys
+        and works for any orderable key type at the cost of one extra query per boundary.
+
+        Args:
+            Table (Base): A SQLAlchemy ORM model/table class.
+            partitions (int): Desired number of ranges.
+            method (str, optional): 'minmax' or 'quantile'. Defaults to 'minmax'.
+
+        Returns:
+            list[tuple]: (lower, upper) bounds; lower is inclusive, upper exclusive, None is unbounded.
+        """
+
+        if method not in self.METHODS:
+            raise ValueError(f"{method} is not in supported methods: {list(self.METHODS)}")
+        if partitions < 1:
+            raise ValueError("partitions must be at least 1")
+
+        primary_key = self.get_primary_key(Table)
+        with self.engine.connect() as connection:
+            if method == 'minmax':
+                lowest, highest = connection.execute(select(func.min(primary_key), func.max(primary_key))).one()
+                if lowest is None:
+                    return [(None, None)]
+                if not isinstance(lowest, int):
+                    raise TypeError("The 'minmax' method requires an integer primary key; use 'quantile'")
+                step = (highest - lowest + 1) / partitions
+                boundaries = [lowest + int(step * index) for index in range(1, partitions)]
+            else:
+                total = connection.execute(select(func.count()).select_from(primary_key.table)).scalar()
+                boundaries = []
+                for index in range(1, partitions):
+                    offset = total * index // partitions
+                    if offset >= total:
+                        break
+                    boundaries.append(connection.execute(
+                        select(primary_key).order_by(primary_key).offset(offset).limit(1)).scalar())
+
+        boundaries = sorted(set(boundary for boundary in boundaries if boundary is not None))
+        lowers = [None] + boundaries
+        uppers = boundaries + [None]
+        return list(zip(lowers, uppers))
+
+    def _read_range(self, table, primary_key, lower, upper):
+        """
+        Yields the rows of one primary key range in key order, in fetch-sized batches.
+        """
+
+        statement = select(table).order_by(primary_key)
+        if lower is not None:
+            statement = statement.where(primary_key >= lower)
+        if upper is not None:
+            statement = statement.where(primary_key < upper)
+
+        with self.engine.connect() as connection:
+            result = connection.execution_options(stream_results=True, yield_per=self.fetch_size).execute(statement)
+            for batch in result.partitions(self.fetch_size):
+                yield [tuple(row) for row in batch]
+
+    def _export_range(self, index, table, primary_key, lower, upper, sink):
+        start = time.perf_counter()
+        info = sink.write_partition(index, table, self._read_range(table, primary_key, lower, upper))
+        info.update({'index': index, 'lower': lower, 'upper': upper,
+                     'seconds': round(time.perf_counter() - start, 3)})
+        return info
+
+    def export(self, Table, sink, partitions=None, method='minmax', manifest_path=None):
+        """
+        Exports the table to a sink using one worker per primary key range.
+
+        Args:
+            Table (Base): A SQLAlchemy ORM model/table class.
+            sink (CSVSink or ParquetSink or DataFrameSink): Destination of the partitions.
+            partitions (int, optional): Number of ranges. Defaults to `max_workers`.
+            method (str, optional): Range splitting method, 'minmax' or 'quantile'. Defaults to 'minmax'.
+            manifest_path (str, optional): If given, the manifest is also written there as JSON.
+
+        Returns:
+            dict: Manifest with the ordered partitions, their bounds, row counts and output paths.
+        """
+
+        table = Table.__table__
+        primary_key = self.get_primary_key(Table)
+        ranges = self.compute_ranges(Table, self.max_workers if partitions is None else partitions, method=method)
+
+        started_at = time.time()
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='dbtoolkit-export') as executor:
+            futures = [executor.submit(self._export_range, index, table, primary_key, lower, upper, sink)
+                       for index, (lower, upper) in enumerate(ranges)]
+            parts = [future.result() for future in futures]
+
+        manifest = {
+            'table': table.name,
+            'primary_key': primary_key.name,
+            'columns': table.columns.keys(),
+            'method': method,
+            'started_at': started_at,
+            'seconds': round(time.time() - started_at, 3),
+            'total_rows': sum(part['rows'] for part in parts),
+            'partitions': sorted(parts, key=lambda part: part['index'])
+        }
+        if manifest_path is not None:
+            with open(manifest_path, 'w', encoding='utf-8') as manifest_file:
+                json.dump(manifest, manifest_file, indent=2, default=str)
+        return manifest
@@ -0,0 +1,125 @@
+import itertools
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from sqlalchemy_dbtoolkit.engine.factory import AlchemyEngineFactory
+from sqlalchemy_dbtoolkit.query.create import InsertManager
+
+# Per-process state of ingestion workers, created by _initialize_worker.
+_worker_inserter = None
+
+
+def _initialize_worker(dbms, db_name, config_path):
+    """
+    Creates the worker's own engine from the shared configuration.
+    """
+
+    global _worker_inserter
+    engine = AlchemyEngineFactory(dbms=dbms, db_name=db_name, config_path=config_path).engine
+    _worker_inserter = InsertManager(engine)
+
+
+def _ingest_chunk(Table, chunk, prepare_func):
+    """
+    Prepares and inserts one chunk inside a worker process.
+
+    Returns:
+        tuple[int, int]: Rows inserted and rows skipped because `prepare_func` returned None.
+    """
+
+    if prepare_func is None:
+        rows = list(chunk)
+    else:
+        rows = [row for row in map(prepare_func, chunk) if row is not None]
+    _worker_inserter.bulk_insert_rows(Table, rows)
+    return len(rows), len(chunk) - len(rows)
+
+
+class ParallelIngestor:
+    """
+    Ingests an iterable of records with a pool of worker processes.
+
+    The input is partitioned into chunks that are prepared (e.g. parsed, validated,
+    enriched) and bulk inserted by N processes, each with its own engine created from
+    the same configuration, so CPU-bound row preparation scales beyond the GIL. The
+    number of chunks in flight is bounded, so the input is consumed lazily.
+
+    `Table` and `prepare_func` are sent to the workers by pickling and must therefore be
+    defined at module level.
+    """
+
+    def __init__(self, dbms, db_name, config_path='../../.config/config.ini', workers=None, chunk_size=10000,
+                 mp_context=None):
+        """
+        Initializes the ParallelIngestor.
+
+        Args:
+            dbms (str): Type of database management system (e.g., 'mysql', 'postgresql', 'sqlite').
+            db_name (str): Name of the target database.
+            config_path (str): Path to the configuration file. Defaults to '../../.config/config.ini'.
+            workers (int, optional): Number of worker processes. Defaults to the CPU count.
+            chunk_size (int, optional): Records per chunk and insert batch. Defaults to 10000.
+            mp_context (multiprocessing.context.BaseContext, optional): Start method context for the workers.
+        """
+
+        self.dbms = dbms
+        self.db_name = db_name
+        self.config_path = config_path
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.mp_context = mp_context
+
+    def ingest(self, Table, records, prepare_func=None, max_errors=10):
+        """
+        Partitions the records across the worker processes and inserts them.
+
+        Args:
+            Table (Base): A SQLAlchemy ORM model/table class.
+            records (Iterable): Input records. Without `prepare_func` each record must be a row dict.
+            prepare_func (callable, optional): Converts a record into a row dict, or None to skip it.
+            max_errors (int, optional): Number of chunk error messages kept in the report. Defaults to 10.
+
+        Returns:
+            dict: Records read, rows inserted and skipped, chunk counts, errors, elapsed seconds and rows per second.
+        """
+
+        report = {'records_read': 0, 'rows_inserted': 0, 'rows_skipped': 0, 'chunks': 0, 'chunks_failed': 0,
+                  'errors': []}
+        start = time.perf_counter()
+        iterator = iter(records)
+
+        def collect(future):
+            try:
+                inserted, skipped = future.result()
+                report['rows_inserted'] += inserted
+                report['rows_skipped'] += skipped
+            except Exception as e:
+                report['chunks_failed'] += 1
+                if len(report['errors']) < max_errors:
+                    report['errors'].append(str(e).splitlines()[0])
+
+        with ProcessPoolExecutor(max_workers=self.workers, mp_context=self.mp_context,
+                                 initializer=_initialize_worker,
+                                 initargs=(self.dbms, self.db_name, self.config_path)) as executor:
+            in_flight = set()
+            while True:
+                chunk = list(itertools.islice(iterator, self.chunk_size))
+                if not chunk:
+                    break
+                report['records_read'] += len(chunk)
+                report['chunks'] += 1
+                in_flight.add(executor.submit(_ingest_chunk, Table, chunk, prepare_func))
+
+                if len(in_flight) >= self.workers * 2:
+                    done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        collect(future)
+
+            for future in in_flight:
+                collect(future)
+
+        seconds = time.perf_counter() - start
+        report['seconds'] = round(seconds, 3)
+        report['rows_per_second'] = round(report['rows_inserted'] / seconds, 1) if seconds else None
+        return report
@@ -0,0 +1,251 @@
+import enum
+import json
+import uuid
+
+from sqlalchemy import select, types
+
+from sqlalchemy_dbtoolkit.query.create import InsertManager
+from sqlalchemy_dbtoolkit.utils.query_operators import get_filter_operator
+
+BINARY_TYPES = (types.LargeBinary, types.BINARY, types.VARBINARY)
+NATIVE_ARROW_TYPES = (types.Boolean, types.Integer, types.Float, types.Numeric, types.DateTime, types.Date,
+                      types.Time, types.Interval) + BINARY_TYPES
+
+
+def arrow_type_for_column(column):
+    """
+    Maps a SQLAlchemy column type to the corresponding Arrow type.
+
+    Args:
+        column (sqlalchemy.Column): Column of an ORM model or table.
+
+    Returns:
+        pyarrow.DataType: The Arrow type used for the column. Unknown types map to string.
+    """
+
+    import pyarrow as pa
+
+    column_type = column.type
+    if isinstance(column_type, types.Boolean):
+        return pa.bool_()
+    if isinstance(column_type, types.BigInteger):
+        return pa.int64()
+    if isinstance(column_type, types.SmallInteger):
+        return pa.int16()
+    if isinstance(column_type, types.Integer):
+        return pa.int64()
+    if isinstance(column_type, types.Float):
+        return pa.float64()
+    if isinstance(column_type, types.Numeric):
+        if column_type.asdecimal and column_type.precision is not None:
+            return pa.decimal128(column_type.precision, column_type.scale or 0)
+        return pa.float64()
+    if isinstance(column_type, types.DateTime):
+        return pa.timestamp('us', tz='UTC' if column_type.timezone else None)
+    if isinstance(column_type, types.Date):
+        return pa.date32()
+    if isinstance(column_type, types.Time):
+        return pa.time64('us')
+    if isinstance(column_type, types.Interval):
+        return pa.duration('us')
+    if isinstance(column_type, BINARY_TYPES):
+        return pa.binary()
+    return pa.string()
+
+
+def arrow_schema_from_model(Table):
+    """
+    Builds an Arrow schema from the columns of an ORM model.
+
+    Args:
+        Table (Base or sqlalchemy.Table): A SQLAlchemy ORM model/table class or Core table.
+
+    Returns:
+        pyarrow.Schema: One nullable field per column, in column order.
+    """
+
+    import pyarrow as pa
+
+    table = getattr(Table, '__table__', Table)
+    return pa.schema([pa.field(column.name, arrow_type_for_column(column), nullable=column.nullable is not False)
+                      for column in table.columns])
+
+
+def _export_converter(column):
+    """
+    Returns a function that prepares Python values of a column for Arrow, or None if no conversion is needed.
+    """
+
+    column_type = column.type
+    if isinstance(column_type, types.JSON):
+        return lambda value: None if value is None else json.dumps(value)
+    if isinstance(column_type, types.Enum):
+        return lambda value: value.name if isinstance(value, enum.Enum) else value
+    if isinstance(column_type, NATIVE_ARROW_TYPES) or type(column_type) in (types.String, types.Text, types.Unicode,
+                                                                          types.UnicodeText, types.VARCHAR):
+        return None
+    # UUIDs and any other types without a native Arrow mapping are written as text.
+    return lambda value: None if value is None else str(value)
+
+
+def _import_converter(column):
+    """
+    Returns a function that turns Arrow values back into Python values of a column, or None if not needed.
+    """
+
+    if isinstance(column.type, types.JSON):
+        return lambda value: None if value is None else json.loads(value)
+    if isinstance(column.type, types.Uuid) and column.type.as_uuid:
+        return lambda value: None if value is None else uuid.UUID(value)
+    return None
+
+
+def record_batch_from_rows(rows, table, schema):
+    """
+    Converts a batch of row tuples in table column order into an Arrow RecordBatch.
+
+    Args:
+        rows (list[tuple]): Rows as returned by a Core select over the table.
+        table (sqlalchemy.Table): Table the rows belong to.
+        schema (pyarrow.Schema): Target schema, usually from `arrow_schema_from_model`.
+
+    Returns:
+        pyarrow.RecordBatch: The batch in columnar form.
+    """
+
+    import pyarrow as pa
+
+    arrays = []
+    for column, field, values in zip(table.columns, schema, zip(*rows) if rows else [()] * len(schema)):
+        converter = _export_converter(column)
+        if converter is not None:
+            values = [converter(value) for value in values]
+        arrays.append(pa.array(values, type=field.type))
+    return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+class ParquetManager:
+    """
+    Streams table data between the database and Parquet files.
+
+    Exports read with a streaming cursor and write one Parquet row group per batch,
+    without materializing ORM objects or a full DataFrame. Imports read one batch at a
+    time and insert it through InsertManager's bulk insert path. Requires pyarrow.
+    """
+
+    def __init__(self, engine, batch_size=65536):
+        """
+        Initializes the ParquetManager with a SQLAlchemy engine.
+
+        Args:
+            engine (sqlalchemy.Engine): An initialized SQLAlchemy engine.
+            batch_size (int, optional): Rows per batch and Parquet row group. Defaults to 65536.
+        """
+
+        self.engine = engine
+        self.batch_size = batch_size
+        self.inserter = InsertManager(engine)
+
+    def export_table(self, Table, path, column_name=None, column_value=None, operator_name='eq',
+                     compression='snappy'):
+        """
+        Exports the rows of a table, optionally filtered by a column, to a Parquet file.
+
+        Args:
+            Table (Base): A SQLAlchemy ORM model/table class.
+            path (str): Destination Parquet file.
+            column_name (str, optional): The column name to filter by. Exports all rows if omitted.
+            column_value (Any, optional): The value to match in the specified column.
+            operator_name (str, optional): The filter operator to use (default 'eq').
+                Supported operators: eq, ne, gt, lt, ge, le, like, in, etc.
+            compression (str, optional): Parquet compression codec. Defaults to 'snappy'.
+
+        Returns:
+            int: The number of rows exported.
+        """
+
+        table = Table.__table__
+        statement = select(table)
+        if column_name is not None:
+            column = table.columns.get(column_name)
+            if column is None:
+                raise AttributeError(f"{column_name} is not a valid column of {Table.__name__}")
+            operator_func = get_filter_operator(operator_name=operator_name)
+            statement = statement.where(operator_func(column, column_value))
+
+        return self.export_query(statement, path, table=table, compression=compression)
+
+    def export_query(self, statement, path, table=None, compression='snappy'):
+        """
+        Exports the result of a Core select statement to a Parquet file batch by batch.
+
+        Args:
+            statement (sqlalchemy.sql.Select): Statement to export.
+            path (str): Destination Parquet file.
+            table (sqlalchemy.Table, optional): Table whose column types define the schema. The
+                statement must then select exactly its columns in order. Without a table the
+                schema is inferred from the first batch.
+            compression (str, optional): Parquet compression codec. Defaults to 'snappy'.
+
+        Returns:
+            int: The number of rows exported.
+        """
+
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        schema = arrow_schema_from_model(table) if table is not None else None
+        writer = None
+        rows = 0
+        with self.engine.connect() as connection:
+            result = connection.execution_options(stream_results=True, yield_per=self.batch_size).execute(statement)
+            try:
+                for batch in result.partitions(self.batch_size):
+                    if table is not None:
+                        record_batch = record_batch_from_rows(batch, table, schema)
+                    else:
+                        columns = list(zip(*batch))
+                        record_batch = pa.RecordBatch.from_arrays([pa.array(column) for column in columns],
+                                                                  names=list(result.keys()))
+                    if writer is None:
+                        writer = pq.ParquetWriter(path, record_batch.schema, compression=compression)
+                    writer.write_batch(record_batch)
+                    rows += len(batch)
+                if writer is None and schema is not None:
+                    writer = pq.ParquetWriter(path, schema, compression=compression)
+            finally:
+                if writer is not None:
+                    writer.close()
+        return rows
+
+    def import_file(self, Table, path):
+        """
+        Imports a Parquet file into a table in batches through the bulk insert path.
+
+        Only columns that exist on the table are read. Each batch is inserted in its own
+        transaction, so memory stays bounded by the batch size.
+
+        Args:
+            Table (Base): A SQLAlchemy ORM model/table class.
+            path (str): Source Parquet file.
+
+        Returns:
+            int: The number of rows imported.
+        """
+
+        import pyarrow.parquet as pq
+
+        table = Table.__table__
+        parquet_file = pq.ParquetFile(path)
+        column_names = [name for name in parquet_file.schema_arrow.names if name in table.columns]
+        converters = {name: _import_converter(table.columns[name]) for name in column_names}
+        converters = {name: converter for name, converter in converters.items() if converter is not None}
+
+        rows = 0
+        for record_batch in parquet_file.iter_batches(batch_size=self.batch_size, columns=column_names):
+            batch = record_batch.to_pylist()
+            for name, converter in converters.items():
+                for row in batch:
+                    row[name] = converter(row[name])
+            rows += self.inserter.bulk_insert_rows(Table, batch)
+        return rows
@@ -0,0 +1,172 @@
+import queue
+import threading
+import time
+
+from sqlalchemy import func, inspect, select, text, types
+from sqlalchemy.schema import sort_tables
+
+from sqlalchemy_dbtoolkit.io.bulk_load import bulk_load, bulk_load_method
+from sqlalchemy_dbtoolkit.orm.base import ORMBaseManager
+
+# Queue marker sent by the reader thread once the source table is exhausted.
+_END = object()
+
+
+def _declarative_base(Model):
+    """
+    Returns the declarative base a model class was defined on.
+    """
+
+    for cls in Model.__mro__[1:]:
+        if inspect(cls, raiseerr=False) is None and hasattr(cls, 'metadata'):
+            return cls
+    raise ValueError(f"{Model.__name__} is not a declarative ORM model")
+
+
+class TableCopyPipeline:
+    """
+    Copies ORM tables from one engine to another, e.g. to promote a SQLite prototype to PostgreSQL.
+
+    Target tables are created through ORMBaseManager and copied parent tables first. For each
+    table a reader thread streams the source rows with a server-side cursor into a bounded
+    queue while the calling thread writes them through the target's fastest bulk path (see
+    `bulk_load`), so reading and writing overlap and memory stays bounded by
+    `batch_size * queue_size` rows. Each table is loaded in a single target transaction.
+    """
+
+    def __init__(self, source_engine, target_engine, batch_size=10000, queue_size=4):
+        """
+        Initializes the TableCopyPipeline.
+
+        Args:
+            source_engine (sqlalchemy.engine.Engine): Engine connected to the source database.
+            target_engine (sqlalchemy.engine.Engine): Engine connected to the target database.
+            batch_size (int, optional): Rows per streamed and loaded batch. Defaults to 10000.
+            queue_size (int, optional): Batches buffered between reader and writer. Defaults to 4.
+        """
+
+        self.source_engine = source_engine
+        self.target_engine = target_engine
+        self.batch_size = batch_size
+        self.queue_size = queue_size
+
+    def create_target_tables(self, models):
+        """
+        Creates the models' tables in the target database if they do not exist.
+
+        Args:
+            models (Iterable[Base]): SQLAlchemy ORM model classes.
+        """
+
+        tables_by_base = {}
+        for Model in models:
+            tables_by_base.setdefault(_declarative_base(Model), []).append(Model.__table__)
+        for base, tables in tables_by_base.items():
+            ORMBaseManager(self.target_engine, base=base).create_tables(tables=tables)
+
+    @staticmethod
+    def _put(batches, item, stop):
+        """
+        Puts an item on the queue unless the consumer stopped; returns False if it did.
+        """
+
+        while not stop.is_set():
+            try:
+                batches.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _read_batches(self, table, batches, stop):
+        try:
+            with self.source_engine.connect() as connection:
+                result = connection.execution_options(stream_results=True, yield_per=self.batch_size).execute(
+                    select(table))
+                try:
+                    for batch in result.partitions(self.batch_size):
+                        if not self._put(batches, batch, stop):
+                            return
+                finally:
+                    result.close()
+            self._put(batches, _END, stop)
+        except Exception as e:
+            self._put(batches, e, stop)
+
+    def _reset_sequences(self, connection, table):
+        # Explicit key values bypass PostgreSQL sequences; move them past the copied keys.
+        if connection.dialect.name != 'postgresql':
+            return
+        for column in table.primary_key.columns:
+            if not isinstance(column.type, types.Integer) or column.autoincrement is False:
+                continue
+            table_name = connection.dialect.identifier_preparer.format_table(table)
+            sequence = connection.execute(text("SELECT pg_get_serial_sequence(:table, :column)"),
+                                          {'table': table_name, 'column': column.name}).scalar()
+            if sequence is None:
+                continue
+            highest = connection.execute(select(func.max(column))).scalar()
+            if highest is not None:
+                connection.execute(text("SELECT setval(:sequence, :value)"),
+                                   {'sequence': sequence, 'value': highest})
+
+    def copy_table(self, Model):
+        """
+        Streams all rows of one table from the source into the existing target table.
+
+        Args:
+            Model (Base): A SQLAlchemy ORM model class.
+
+        Returns:
+            dict: Rows copied, bulk method used, elapsed seconds and rows per second.
+        """
+
+        table = Model.__table__
+        batches = queue.Queue(maxsize=self.queue_size)
+        stop = threading.Event()
+        reader = threading.Thread(target=self._read_batches, args=(table, batches, stop),
+                                  name=f'table-copy-{table.name}', daemon=True)
+
+        start = time.perf_counter()
+        rows = 0
+        reader.start()
+        try:
+            with self.target_engine.begin() as connection:
+                method = bulk_load_method(connection)
+                while True:
+                    batch = batches.get()
+                    if batch is _END:
+                        break
+                    if isinstance(batch, Exception):
+                        raise RuntimeError(f"Reading {table.name} from the source failed: {batch}") from batch
+                    rows += bulk_load(connection, table, batch)
+                self._reset_sequences(connection, table)
+        finally:
+            stop.set()
+            reader.join()
+
+        seconds = time.perf_counter() - start
+        return {'rows': rows, 'method': method, 'seconds': round(seconds, 3),
+                'rows_per_second': round(rows / seconds, 1) if seconds else None}
+
+    def copy(self, models, create_tables=True):
+        """
+        Copies the given tables, parents before children so that foreign keys are satisfied.
+
+        Args:
+            models (Iterable[Base]): SQLAlchemy ORM model classes.
+            create_tables (bool, optional): Whether to create missing target tables first. Defaults to True.
+
+        Returns:
+            dict: Per-table reports keyed by table name, in copy order.
+        """
+
+        models_by_table = {Model.__table__: Model for Model in models}
+        if create_tables:
+            self.create_target_tables(models_by_table.values())
+
+        report = {}
+        for table in sort_tables(models_by_table):
+            report[table.name] = self.copy_table(models_by_table[table])
+            print(f"COPIED {report[table.name]['rows']} ROWS INTO {table.name}")
+        return report
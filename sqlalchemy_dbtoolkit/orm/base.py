@@ -1,7 +1,36 @@
-from sqlalchemy.orm import declarative_base
 from sqlalchemy import MetaData
 from sqlalchemy_dbtoolkit.core.inspector import InspectionManager
-Base = declarative_base()
+from sqlalchemy_dbtoolkit.orm.partitioning import PartitionManager
+
+_default_base = None
+
+
+def get_default_base():
+    """
+    Returns the toolkit's shared declarative base, creating it on first use.
+
+    The base is built lazily so that importing this module does not load
+    the SQLAlchemy ORM or register a declarative class as a side effect.
+
+    Returns:
+        sqlalchemy.orm.DeclarativeMeta: The shared declarative base.
+    """
+
+    global _default_base
+    if _default_base is None:
+        from sqlalchemy.orm import declarative_base
+        _default_base = declarative_base()
+    return _default_base
+
+
+def __getattr__(name):
+    """
+    Resolves the module-level `Base` attribute lazily (PEP 562).
+    """
+
+    if name == 'Base':
+        return get_default_base()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class ORMBaseManager:
@@ -10,21 +39,23 @@ class ORMBaseManager:
     using the provided SQLAlchemy engine and declarative base.
     """
 
-    def __init__(self, engine, base=Base, schema=None):
+    def __init__(self, engine, base=None, schema=None):
         """
         Initializes the ORMBaseManager with a given SQLAlchemy engine,
         declarative base, and optional schema.
 
         Args:
             engine (sqlalchemy.engine.Engine): SQLAlchemy engine instance.
-            base (sqlalchemy.orm.DeclarativeMeta): Declarative base used for ORM mappings.
+            base (sqlalchemy.orm.DeclarativeMeta, optional): Declarative base used for ORM mappings.
+                Defaults to the toolkit's shared `Base`.
             schema (str, optional): Database schema to target.
         """
 
         self.engine = engine
-        self.Base = base
+        self.Base = base if base is not None else get_default_base()
         self.schema = schema
         self.inspector = InspectionManager(self.engine)
+        self.partition_manager = PartitionManager(self.engine)
 
     def is_existing_metadata_table(self, table_name):
         """
@@ -39,12 +70,19 @@ class ORMBaseManager:
 
         return table_name in self.Base.metadata.tables
 
-    def create_tables(self):
+    def create_tables(self, tables=None):
         """
         Creates all tables defined in the ORM's metadata using the provided engine.
+        Models declaring `__partitioning__` are created as partitioned tables with their initial partitions.
+
+        Args:
+            tables (list[sqlalchemy.Table], optional): Subset of the metadata tables to create. Defaults to all.
         """
 
-        self.Base.metadata.create_all(bind=self.engine)
+        partitioned_models = self.partition_manager.prepare_tables(self.Base, tables)
+        self.Base.metadata.create_all(bind=self.engine, tables=tables)
+        for Table in partitioned_models:
+            self.partition_manager.create_partitions(Table)
 
     def create_tables_if_not_exists(self):
         """
@@ -54,6 +92,7 @@ class ORMBaseManager:
         present in the target database. If all metadata tables are missing,
         they are created using the full metadata. If only some are missing,
         only the missing tables are created using a temporary metadata object.
+        Missing partitioned tables are created with their initial partitions.
         """
 
         metadata_set = set(self.get_metadata_tables())
@@ -66,11 +105,15 @@ class ORMBaseManager:
             self.create_tables()
         else:
             print(f"MISSING TABLES: {missing_tables}")
+            partitioned_models = self.partition_manager.prepare_tables(
+                self.Base, [self.Base.metadata.tables[table_name] for table_name in missing_tables])
             missing_metadata = MetaData()
             for table_name in missing_tables:
                 table = self.Base.metadata.tables[table_name]
                 table.tometadata(missing_metadata, schema=self.schema)
             missing_metadata.create_all(bind=self.engine)
+            for Table in partitioned_models:
+                self.partition_manager.create_partitions(Table)
 
     def drop_all_metadata_tables(self):
         """
@@ -0,0 +1,87 @@
+from sqlalchemy import inspect
+from sqlalchemy.orm import defer as defer_column, joinedload, load_only as load_only_columns, raiseload, selectinload
+
+RELATIONSHIP_LOADERS = {
+    'selectin': selectinload,   # one extra IN query per relationship level
+    'joined': joinedload,   # LEFT OUTER JOIN in the same query
+    'raise': raiseload   # accessing the relationship raises instead of querying
+}
+
+LOADING_PROFILE_KEYS = ('load_only', 'defer', 'eager_load')
+
+
+def _column_attributes(Table, column_names, option_name):
+    attributes = []
+    for column_name in column_names:
+        column_attr = getattr(Table, column_name, None)
+        if column_attr is None:
+            raise AttributeError(f"{column_name} is not a valid column of {Table.__name__} in {option_name}")
+        attributes.append(column_attr)
+    return attributes
+
+
+def _relationship_loader(Table, path, strategy):
+    """
+    Builds a chained loader option for a dotted relationship path such as 'orders.items'.
+    """
+
+    loader_func = RELATIONSHIP_LOADERS.get(strategy)
+    if loader_func is None:
+        raise ValueError(f"Unsupported loading strategy: {strategy}. Supported: {list(RELATIONSHIP_LOADERS)}")
+    if path == '*':
+        return loader_func('*')
+
+    option = None
+    mapper = inspect(Table)
+    for name in path.split('.'):
+        relationship = mapper.relationships.get(name)
+        if relationship is None:
+            raise AttributeError(f"{name} is not a relationship of {mapper.class_.__name__}")
+        attribute = getattr(mapper.class_, name)
+        option = loader_func(attribute) if option is None else getattr(option, loader_func.__name__)(attribute)
+        mapper = relationship.mapper
+    return option
+
+
+def build_loader_options(Table, load_only=None, defer=None, eager_load=None):
+    """
+    Builds ORM loader options from column and relationship loading settings.
+
+    Settings that are not passed fall back to the model's `__loading_profile__`, a dict with
+    any of the keys 'load_only', 'defer' and 'eager_load'. Passing an empty list or dict
+    disables the corresponding profile entry for a call.
+
+    Columns left out by `load_only` or `defer` are never loaded later. The managers return objects
+    after their session has closed, so accessing such a column raises DetachedInstanceError. Inside
+    an open session the options are built with `raiseload=True`, so access raises InvalidRequestError
+    instead of silently emitting one query per object.
+
+    Args:
+        Table (Base): A SQLAlchemy ORM model/table class.
+        load_only (list[str], optional): Only these columns are loaded; the primary key is always included.
+            Other columns are not available on the returned objects.
+        defer (list[str], optional): Columns that are not loaded and not available on the returned objects.
+        eager_load (dict[str, str], optional): Maps relationship paths (dotted for nested
+            relationships, '*' for all others) to 'selectin', 'joined' or 'raise'.
+
+    Returns:
+        list: Loader options for `Query.options()`, `select().options()` or `Session.get()`.
+    """
+
+    profile = getattr(Table, '__loading_profile__', None) or {}
+    unknown_keys = set(profile) - set(LOADING_PROFILE_KEYS)
+    if unknown_keys:
+        raise ValueError(f"Unsupported __loading_profile__ keys on {Table.__name__}: {sorted(unknown_keys)}")
+
+    load_only = profile.get('load_only') if load_only is None else load_only
+    defer = profile.get('defer') if defer is None else defer
+    eager_load = profile.get('eager_load') if eager_load is None else eager_load
+
+    options = []
+    if load_only:
+        options.append(load_only_columns(*_column_attributes(Table, load_only, 'load_only'), raiseload=True))
+    for column_attr in _column_attributes(Table, defer or [], 'defer'):
+        options.append(defer_column(column_attr, raiseload=True))
+    for path, strategy in (eager_load or {}).items():
+        options.append(_relationship_loader(Table, path, strategy))
+    return options
@@ -0,0 +1,461 @@
+from collections import namedtuple
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import inspect, text, types
+
+Partition = namedtuple('Partition', ['name', 'bound'])
+Partition.__doc__ = """
+A single partition of a partitioned table.
+
+Attributes:
+    name (str): Partition suffix, appended to the table name on PostgreSQL.
+    bound: (lower, upper) for range, a list of values for list and a remainder for hash partitions.
+"""
+
+PARTITIONED_DIALECTS = ('postgresql', 'mysql', 'mariadb')
+
+
+def _quote_literal(value, column, dialect_name):
+    """
+    Renders a partition bound as an SQL literal for the column's type.
+    """
+
+    if isinstance(value, bool):
+        return 'TRUE' if value else 'FALSE'
+    if isinstance(value, (int, float)):
+        return repr(value)
+    if isinstance(value, datetime):
+        if isinstance(column.type, types.DateTime):
+            text_value = value.isoformat(sep=' ')
+            if column.type.timezone and value.tzinfo is None and dialect_name == 'postgresql':
+                text_value += '+00:00'
+        else:
+            text_value = value.date().isoformat()
+    else:
+        text_value = str(value)
+    return "'" + text_value.replace("'", "''") + "'"
+
+
+class RangePartitioning:
+    """
+    Declares time-based range partitioning on a date or timestamp column, one partition per interval.
+
+    Partition bounds are computed in UTC. `premake` future partitions are kept ahead of the
+    current interval, and with `retention` set, partitions that ended more than `retention`
+    intervals before the current one are removed by `PartitionManager.maintain`.
+    """
+
+    INTERVALS = ('day', 'week', 'month', 'year')
+    NAME_FORMATS = {'day': '%Y%m%d', 'week': '%Y%m%d', 'month': '%Y%m', 'year': '%Y'}
+
+    def __init__(self, column_name, interval='month', premake=3, retention=None, start=None):
+        """
+        Initializes the RangePartitioning.
+
+        Args:
+            column_name (str): Date or timestamp column to partition by.
+            interval (str, optional): One of 'day', 'week', 'month' or 'year'. Defaults to 'month'.
+            premake (int, optional): Future partitions kept beyond the current one. Defaults to 3.
+            retention (int, optional): Past intervals kept besides the current one. Defaults to None (keep all).
+            start (datetime, optional): First partition created with the table. Defaults to the current interval.
+        """
+
+        if interval not in self.INTERVALS:
+            raise ValueError(f"{interval} is not in supported intervals: {list(self.INTERVALS)}")
+        self.column_name = column_name
+        self.interval = interval
+        self.premake = premake
+        self.retention = retention
+        self.start = start
+        self.method = 'RANGE'
+
+    def floor(self, moment):
+        """
+        Returns the start of the interval containing a moment.
+        """
+
+        moment = datetime(moment.year, moment.month, moment.day)
+        if self.interval == 'week':
+            return moment - timedelta(days=moment.weekday())
+        if self.interval == 'month':
+            return moment.replace(day=1)
+        if self.interval == 'year':
+            return moment.replace(month=1, day=1)
+        return moment
+
+    def shift(self, moment, count):
+        """
+        Moves an interval start by a number of intervals.
+        """
+
+        if self.interval == 'day':
+            return moment + timedelta(days=count)
+        if self.interval == 'week':
+            return moment + timedelta(weeks=count)
+        months = moment.month - 1 + (count if self.interval == 'month' else 12 * count)
+        return moment.replace(year=moment.year + months // 12, month=months % 12 + 1)
+
+    def partition_for(self, lower):
+        """
+        Returns the partition starting at an interval start.
+        """
+
+        return Partition(f"p{lower.strftime(self.NAME_FORMATS[self.interval])}", (lower, self.shift(lower, 1)))
+
+    def lower_bound_of(self, name):
+        """
+        Parses the interval start back from a partition name, or returns None for foreign partitions.
+        """
+
+        try:
+            return datetime.strptime(name, 'p' + self.NAME_FORMATS[self.interval])
+        except ValueError:
+            return None
+
+    def partitions(self, now):
+        """
+        Returns the partitions from `start` (or the current interval) up to `premake` intervals ahead,
+        leaving out those already past the retention window.
+        """
+
+        current = self.floor(now)
+        lower = self.floor(self.start) if self.start is not None else current
+        expired_before = self.expired_before(now)
+        if expired_before is not None:
+            lower = max(lower, expired_before)
+        upper = self.shift(current, self.premake)
+        partitions = []
+        while lower <= upper:
+            partitions.append(self.partition_for(lower))
+            lower = self.shift(lower, 1)
+        return partitions
+
+    def expired_before(self, now):
+        """
+        Returns the interval start before which partitions are expired, or None without retention.
+        """
+
+        if self.retention is None:
+            return None
+        return self.shift(self.floor(now), -self.retention)
+
+
+class ListPartitioning:
+    """
+    Declares list partitioning, one partition per named group of column values.
+    """
+
+    def __init__(self, column_name, partitions, default=True):
+        """
+        Initializes the ListPartitioning.
+
+        Args:
+            column_name (str): Column to partition by.
+            partitions (dict[str, list]): Partition names mapped to the values they hold.
+            default (bool, optional): Whether a default partition takes any other value.
+                PostgreSQL only. Defaults to True.
+        """
+
+        self.column_name = column_name
+        self.values = partitions
+        self.default = default
+        self.method = 'LIST'
+
+    def partitions(self, now):
+        """
+        Returns the declared partitions.
+        """
+
+        partitions = [Partition(name, list(values)) for name, values in self.values.items()]
+        if self.default:
+            partitions.append(Partition('default', None))
+        return partitions
+
+
+class HashPartitioning:
+    """
+    Declares hash partitioning over a fixed number of partitions.
+    """
+
+    def __init__(self, column_name, modulus):
+        """
+        Initializes the HashPartitioning.
+
+        Args:
+            column_name (str): Column to partition by.
+            modulus (int): Number of partitions.
+        """
+
+        self.column_name = column_name
+        self.modulus = modulus
+        self.method = 'HASH'
+
+    def partitions(self, now):
+        """
+        Returns one partition per hash remainder.
+        """
+
+        return [Partition(f"p{remainder}", remainder) for remainder in range(self.modulus)]
+
+
+def get_partitioning(Table):
+    """
+    Returns the partitioning declared on a model via `__partitioning__`, or None.
+
+    Args:
+        Table (Base): A SQLAlchemy ORM model/table class.
+
+    Returns:
+        RangePartitioning | ListPartitioning | HashPartitioning | None: The declaration.
+    """
+
+    partitioning = getattr(Table, '__partitioning__', None)
+    if partitioning is not None and not hasattr(Table, partitioning.column_name):
+        raise AttributeError(f"{partitioning.column_name} is not a valid column of {Table.__name__}")
+    return partitioning
+
+
+def _utc_now():
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+class PartitionManager:
+    """
+    Creates and maintains the partitions of models declaring `__partitioning__`.
+
+    On PostgreSQL the parent table is declared with PARTITION BY and every partition is a
+    table named `<table>_<partition>`. On MySQL the partitions are part of the table definition
+    and are added or dropped with ALTER TABLE. Other dialects create plain tables and skip
+    partition maintenance.
+    """
+
+    def __init__(self, engine):
+        """
+        Initializes the PartitionManager with a SQLAlchemy engine.
+
+        Args:
+            engine (sqlalchemy.engine.Engine): SQLAlchemy engine instance.
+        """
+
+        self.engine = engine
+        self.dialect_name = engine.dialect.name
+
+    @property
+    def is_supported(self):
+        """
+        bool: Whether the engine's dialect supports declarative partitioning.
+        """
+
+        return self.dialect_name in PARTITIONED_DIALECTS
+
+    def _render_bound(self, partitioning, partition, column):
+        if partitioning.method == 'RANGE':
+            lower, upper = partition.bound
+            if self.dialect_name == 'postgresql':
+                lower_sql = _quote_literal(lower, column, self.dialect_name)
+                upper_sql = _quote_literal(upper, column, self.dialect_name)
+                return f"FROM ({lower_sql}) TO ({upper_sql})"
+            return f"VALUES LESS THAN ({_quote_literal(upper, column, self.dialect_name)})"
+        if partitioning.method == 'LIST':
+            values = ', '.join(_quote_literal(value, column, self.dialect_name) for value in partition.bound)
+            return f"IN ({values})" if self.dialect_name == 'postgresql' else f"VALUES IN ({values})"
+        return f"WITH (MODULUS {partitioning.modulus}, REMAINDER {partition.bound})"
+
+    def partition_by_clause(self, Table, now=None):
+        """
+        Builds the PARTITION BY clause for the parent table on the engine's dialect.
+
+        On MySQL the clause includes the initial partition definitions, which must be part of
+        the CREATE TABLE statement there.
+
+        Args:
+            Table (Base): A SQLAlchemy ORM model/table class declaring `__partitioning__`.
+            now (datetime, optional): Reference time for range partitions. Defaults to the current UTC time.
+
+        Returns:
+            str: The clause without the leading 'PARTITION BY'.
+        """
+
+        partitioning = get_partitioning(Table)
+        column = getattr(Table, partitioning.column_name).property.columns[0]
+        preparer = self.engine.dialect.identifier_preparer
+        column_sql = preparer.quote(column.name)
+
+        if self.dialect_name == 'postgresql':
+            return f"{partitioning.method} ({column_sql})"
+        if partitioning.method == 'HASH':
+            return f"HASH ({column_sql}) PARTITIONS {partitioning.modulus}"
+
+        definitions = [
+            f"PARTITION {preparer.quote(partition.name)} {self._render_bound(partitioning, partition, column)}"
+            for partition in partitioning.partitions(now or _utc_now()) if partition.bound is not None
+        ]
+        return f"{partitioning.method} COLUMNS({column_sql}) ({', '.join(definitions)})"
+
+    def prepare_tables(self, Base, tables=None, now=None):
+        """
+        Adds the PARTITION BY clause to the metadata tables of partitioned models before they are created.
+
+        Args:
+            Base (sqlalchemy.orm.DeclarativeMeta): Declarative base holding the models.
+            tables (list[sqlalchemy.Table], optional): Restrict to these tables. Defaults to all.
+            now (datetime, optional): Reference time for range partitions. Defaults to the current UTC time.
+
+        Returns:
+            list[Base]: The partitioned models that were prepared.
+        """
+
+        if not self.is_supported:
+            return []
+        models = []
+        for mapper in Base.registry.mappers:
+            Table = mapper.class_
+            if get_partitioning(Table) is None or (tables is not None and mapper.local_table not in tables):
+                continue
+            dialect_key = 'mysql' if self.dialect_name == 'mariadb' else self.dialect_name
+            mapper.local_table.dialect_options[dialect_key]['partition_by'] = self.partition_by_clause(Table, now)
+            models.append(Table)
+        return models
+
+    def list_partitions(self, Table):
+        """
+        Lists the existing partitions of a table.
+
+        Args:
+            Table (Base): A SQLAlchemy ORM model/table class.
+
+        Returns:
+            list[str]: Partition names without the PostgreSQL table name prefix.
+        """
+
+        table = inspect(Table).local_table
+        with self.engine.connect() as connection:
+            if self.dialect_name == 'postgresql':
+                rows = connection.execute(text(
+                    "SELECT child.relname FROM pg_inherits "
+                    "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+                    "WHERE pg_inherits.inhparent = CAST(:parent AS regclass)"),
+                    {'parent': self.engine.dialect.identifier_preparer.format_table(table)}).scalars()
+                prefix = f"{table.name}_"
+                return sorted(name[len(prefix):] for name in rows if name.startswith(prefix))
+            if self.dialect_name in ('mysql', 'mariadb'):
+                rows = connection.execute(text(
+                    "SELECT partition_name FROM information_schema.partitions "
+                    "WHERE table_schema = COALESCE(:schema, DATABASE()) AND table_name = :table "
+                    "AND partition_name IS NOT NULL"), {'schema': table.schema, 'table': table.name}).scalars()
+                return sorted(rows)
+        return []
+
+    def _create_partition(self, connection, Table, partitioning, partition):
+        table = inspect(Table).local_table
+        column = getattr(Table, partitioning.column_name).property.columns[0]
+        preparer = self.engine.dialect.identifier_preparer
+        parent = preparer.format_table(table)
+
+        if self.dialect_name == 'postgresql':
+            child = preparer.quote(f"{table.name}_{partition.name}")
+            if table.schema:
+                child = f"{preparer.quote_schema(table.schema)}.{child}"
+            bound = 'DEFAULT' if partition.bound is None else \
+                f"FOR VALUES {self._render_bound(partitioning, partition, column)}"
+            connection.execute(text(f"CREATE TABLE IF NOT EXISTS {child} PARTITION OF {parent} {bound}"))
+        else:
+            connection.execute(text(f"ALTER TABLE {parent} ADD PARTITION (PARTITION {preparer.quote(partition.name)} "
+                                    f"{self._render_bound(partitioning, partition, column)})"))
+
+    def create_partitions(self, Table, now=None):
+        """
+        Creates the declared partitions that do not exist yet; for range partitioning the
+        partitions from `start` (or the current interval) up to `premake` intervals ahead.
+
+        Args:
+            Table (Base): A SQLAlchemy ORM model/table class declaring `__partitioning__`.
+            now (datetime, optional): Reference time for range partitions. Defaults to the current UTC time.
+
+        Returns:
+            list[str]: Names of the created partitions.
+        """
+
+        partitioning = get_partitioning(Table)
+        if partitioning is None:
+            raise ValueError(f"{Table.__name__} does not declare __partitioning__")
+        if not self.is_supported:
+            return []
+
+        existing = set(self.list_partitions(Table))
+        missing = [partition for partition in partitioning.partitions(now or _utc_now())
+                   if partition.name not in existing]
+        if self.dialect_name != 'postgresql':
+            # MySQL hash and list partitions are fixed at CREATE TABLE; range partitions can only be appended.
+            if partitioning.method != 'RANGE':
+                return []
+            highest = max(filter(None, map(partitioning.lower_bound_of, existing)), default=None)
+            missing = [partition for partition in missing if highest is None or partition.bound[0] > highest]
+
+        with self.engine.begin() as connection:
+            for partition in missing:
+                self._create_partition(connection, Table, partitioning, partition)
+        if missing:
+            print(f"PARTITIONS CREATED FOR {Table.__tablename__}: {[partition.name for partition in missing]}")
+        return [partition.name for partition in missing]
+
+    def drop_expired_partitions(self, Table, now=None, detach_only=False):
+        """
+        Removes range partitions that ended before the retention window.
+
+        Args:
+            Table (Base): A SQLAlchemy ORM model/table class declaring RangePartitioning.
+            now (datetime, optional): Reference time. Defaults to the current UTC time.
+            detach_only (bool, optional): On PostgreSQL, detach the partitions into standalone tables
+                (e.g. for archiving) instead of dropping them. Defaults to False.
+
+        Returns:
+            list[str]: Names of the removed partitions.
+        """
+
+        partitioning = get_partitioning(Table)
+        if not isinstance(partitioning, RangePartitioning):
+            raise ValueError(f"{Table.__name__} does not declare RangePartitioning")
+        expired_before = partitioning.expired_before(now or _utc_now())
+        if expired_before is None or not self.is_supported:
+            return []
+
+        expired = [name for name in self.list_partitions(Table)
+                   if (lower := partitioning.lower_bound_of(name)) is not None
+                   and partitioning.shift(lower, 1) <= expired_before]
+
+        table = inspect(Table).local_table
+        preparer = self.engine.dialect.identifier_preparer
+        parent = preparer.format_table(table)
+        with self.engine.begin() as connection:
+            for name in expired:
+                if self.dialect_name == 'postgresql':
+                    child = preparer.quote(f"{table.name}_{name}")
+                    if table.schema:
+                        child = f"{preparer.quote_schema(table.schema)}.{child}"
+                    connection.execute(text(f"ALTER TABLE {parent} DETACH PARTITION {child}"))
+                    if not detach_only:
+                        connection.execute(text(f"DROP TABLE {child}"))
+                else:
+                    connection.execute(text(f"ALTER TABLE {parent} DROP PARTITION {preparer.quote(name)}"))
+        if expired:
+            print(f"PARTITIONS {'DETACHED' if detach_only else 'DROPPED'} FOR {Table.__tablename__}: {expired}")
+        return expired
+
+    def maintain(self, Table, now=None, detach_only=False):
+        """
+        Runs routine maintenance: pre-creates future partitions and removes expired ones.
+        Intended to be scheduled, e.g. daily.
+
+        Args:
+            Table (Base): A SQLAlchemy ORM model/table class declaring RangePartitioning.
+            now (datetime, optional): Reference time. Defaults to the current UTC time.
+            detach_only (bool, optional): Detach instead of drop expired partitions (PostgreSQL). Defaults to False.
+
+        Returns:
+            dict: Names of the created and removed partitions.
+        """
+
+        now = now or _utc_now()
+        return {'created': self.create_partitions(Table, now),
+                'removed': self.drop_expired_partitions(Table, now, detach_only=detach_only)}
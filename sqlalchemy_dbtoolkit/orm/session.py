@@ -1,5 +1,6 @@
 from sqlalchemy.orm import sessionmaker
 from contextlib import contextmanager
+from sqlalchemy_dbtoolkit.engine.group import EngineGroup
 
 
 class ORMSessionManager:
@@ -7,17 +8,31 @@ class ORMSessionManager:
     Manages SQLAlchemy ORM sessions using a context manager pattern.
 
     Provides reusable access to scoped sessions for database transactions.
+    When bound to an EngineGroup, read-only scopes (commit=False) are routed to
+    the read replicas and committing scopes to the primary.
     """
 
-    def __init__(self, engine):
+    def __init__(self, engine, retry_policy=None):
         """
-        Initializes the session manager with a SQLAlchemy engine.
+        Initializes the session manager with a SQLAlchemy engine or engine group.
 
         Args:
-            engine (sqlalchemy.engine.Engine): SQLAlchemy engine used for session binding.
+            engine (sqlalchemy.engine.Engine or EngineGroup): SQLAlchemy engine used for session binding,
+                or an EngineGroup of a primary and its read replicas.
+            retry_policy (RetryPolicy, optional): Policy for re-running transactions that fail with a
+                deadlock or serialization failure (see `run_in_transaction`). Defaults to no retries.
         """
 
+        if isinstance(engine, EngineGroup):
+            self.engine_group = engine
+            engine = engine.primary
+        else:
+            self.engine_group = None
+
         self.session_factory = sessionmaker(bind=engine)
+        self.read_session_factories = {engine: self.session_factory}
+        self.dialect_name = engine.dialect.name
+        self.retry_policy = retry_policy
 
     @property
     def session(self):
@@ -30,27 +45,74 @@ class ORMSessionManager:
 
         return self.session_factory()
 
+    @property
+    def read_session(self):
+        """
+        Provides a new SQLAlchemy session for read-only work.
+        Bound to a read replica selected by the EngineGroup, if one is configured.
+
+        Returns:
+            sqlalchemy.orm.Session: A new session instance.
+        """
+
+        if self.engine_group is None:
+            return self.session_factory()
+
+        engine = self.engine_group.get_read_engine()
+        session_factory = self.read_session_factories.get(engine)
+        if session_factory is None:
+            session_factory = self.read_session_factories.setdefault(engine, sessionmaker(bind=engine))
+        return session_factory()
+
     @contextmanager
     def session_scope(self, commit=True):
         """
         Provides a transactional scope around a series of operations.
         Ensures proper commit, rollback, and closure of the session context.
+        Errors are re-raised unchanged after the rollback.
 
         Args:
             commit (bool): Whether to commit the session at the end of the block.
-                           Useful to disable for read-only operations.
+                           Useful to disable for read-only operations, which are then
+                           served by a read replica when bound to an EngineGroup.
 
         Yields:
             sqlalchemy.orm.Session: A session object within the managed scope.
         """
 
-        session = self.session
+        session = self.session if commit else self.read_session
         try:
             yield session
             if commit:
                 session.commit()
-        except Exception as e:
+                if self.engine_group is not None:
+                    self.engine_group.mark_write()
+        except Exception:
             session.rollback()
-            raise Exception(f"Session rolled back: {e} ")
+            raise
         finally:
             session.close()
+
+    def run_in_transaction(self, func, *args, **kwargs):
+        """
+        Runs a function in a committing session scope, re-running the whole transaction under the
+        retry policy when it fails with a deadlock or serialization failure. Without a retry policy
+        the function runs once.
+
+        Args:
+            func (callable): Function taking the session as its first argument. It may run more than
+                once, so it must not have side effects outside the transaction.
+            *args: Additional positional arguments for `func`.
+            **kwargs: Additional keyword arguments for `func`.
+
+        Returns:
+            Any: The return value of `func` from the committed attempt.
+        """
+
+        def unit_of_work():
+            with self.session_scope() as session:
+                return func(session, *args, **kwargs)
+
+        if self.retry_policy is None:
+            return unit_of_work()
+        return self.retry_policy.run(unit_of_work, dialect_name=self.dialect_name)
@@ -0,0 +1,258 @@
+import logging
+import queue
+import threading
+import time
+import weakref
+
+from sqlalchemy_dbtoolkit.query.create import InsertManager
+
+buffered_insert_logger = logging.getLogger('sqlalchemy_dbtoolkit.buffered_insert')
+
+_STOP = object()
+
+
+class _FlushRequest:
+    """
+    Queue marker asking the worker to flush everything queued before it.
+    """
+
+    def __init__(self):
+        self.done = threading.Event()
+
+
+class _BatchWriter:
+    """
+    Writes batches for the worker thread and keeps the counters. Kept apart from BufferedInserter
+    so the running worker does not hold a reference to the inserter.
+    """
+
+    def __init__(self, inserter, on_error):
+        self.inserter = inserter
+        self.on_error = on_error
+        self.lock = threading.Lock()
+        self.stats = {'rows_queued': 0, 'rows_flushed': 0, 'batches_flushed': 0,
+                      'batches_failed': 0, 'rows_failed': 0}
+
+    def write(self, Table, rows):
+        try:
+            self.inserter.bulk_insert_rows(Table, rows)
+        except Exception as e:
+            with self.lock:
+                self.stats['batches_failed'] += 1
+                self.stats['rows_failed'] += len(rows)
+            if self.on_error is not None:
+                try:
+                    self.on_error(Table, rows, e)
+                except Exception:
+                    buffered_insert_logger.exception("Error callback failed")
+            else:
+                buffered_insert_logger.error("Failed to insert %d rows into %s: %s", len(rows), Table.__name__, e)
+        else:
+            with self.lock:
+                self.stats['rows_flushed'] += len(rows)
+                self.stats['batches_flushed'] += 1
+
+
+def _run(batches, writer, max_batch_size, flush_interval_s):
+    pending = {}
+    pending_rows = 0
+    deadline = None
+
+    def flush_all():
+        for Table, rows in pending.items():
+            if rows:
+                writer.write(Table, rows)
+        pending.clear()
+
+    while True:
+        timeout = None if not pending_rows else max(deadline - time.monotonic(), 0)
+        try:
+            item = batches.get(timeout=timeout)
+        except queue.Empty:
+            flush_all()
+            pending_rows = 0
+            continue
+
+        if item is _STOP:
+            flush_all()
+            return
+        if isinstance(item, _FlushRequest):
+            flush_all()
+            pending_rows = 0
+            item.done.set()
+            continue
+
+        Table, row = item
+        rows = pending.setdefault(Table, [])
+        rows.append(row)
+        pending_rows += 1
+        if pending_rows == 1:
+            deadline = time.monotonic() + flush_interval_s
+        if len(rows) >= max_batch_size:
+            writer.write(Table, rows)
+            pending_rows -= len(rows)
+            pending[Table] = []
+
+
+def _stop_worker(batches, worker, timeout=None):
+    """
+    Queues the stop marker and waits for the worker to flush. Runs from `close`, when the inserter
+    is garbage collected, or at interpreter exit.
+    """
+
+    batches.put(_STOP)
+    if worker is not threading.current_thread():
+        worker.join(timeout)
+
+
+class BufferedInserter:
+    """
+    Write-behind insert buffer that batches rows in memory and writes them from a background thread.
+
+    Rows are queued by `add` and flushed through InsertManager's bulk insert path when a
+    table's batch reaches `max_batch_size` or `flush_interval_s` has passed since the oldest
+    buffered row. A bounded queue applies backpressure to producers. `close()` (also run when the
+    inserter is garbage collected or at interpreter exit) flushes everything that was queued.
+    Failed batches are reported to an error callback rather than stopping the worker.
+    """
+
+    def __init__(self, engine, max_batch_size=1000, flush_interval_s=1.0, max_queue_size=100000,
+                 put_timeout_s=None, on_error=None):
+        """
+        Initializes the BufferedInserter and starts its worker thread.
+
+        Args:
+            engine (sqlalchemy.Engine): An initialized SQLAlchemy engine.
+            max_batch_size (int, optional): Rows per table that trigger a flush. Defaults to 1000.
+            flush_interval_s (float, optional): Maximum seconds a row waits before being flushed. Defaults to 1.0.
+            max_queue_size (int, optional): Rows that may be queued before `add` blocks. Defaults to 100000.
+            put_timeout_s (float, optional): Seconds `add` blocks on a full queue before raising
+                queue.Full. Defaults to None (block until space is available).
+            on_error (callable, optional): Called as `on_error(Table, rows, exception)` for each
+                failed batch. Failures are logged if omitted.
+        """
+
+        self.inserter = InsertManager(engine)
+        self.max_batch_size = max_batch_size
+        self.flush_interval_s = flush_interval_s
+        self.put_timeout_s = put_timeout_s
+        self.on_error = on_error
+
+        self._queue = queue.Queue(maxsize=max_queue_size)
+        # Guards `_closed` and the count of puts in progress; `close` waits for those puts before it
+        # queues the stop marker, so nothing lands behind it. Puts themselves run outside the lock.
+        self._state = threading.Condition()
+        self._closed = False
+        self._puts_in_flight = 0
+        self._writer = _BatchWriter(self.inserter, on_error)
+
+        self._worker = threading.Thread(target=_run, name='dbtoolkit-buffered-insert', daemon=True,
+                                        args=(self._queue, self._writer, max_batch_size, flush_interval_s))
+        self._worker.start()
+        # Holds only the queue and the thread, so an unreferenced inserter can still be collected.
+        self._finalizer = weakref.finalize(self, _stop_worker, self._queue, self._worker)
+
+    def add(self, Table, args: dict):
+        """
+        Queues a single row for insertion.
+
+        Args:
+            Table (Base): A SQLAlchemy ORM model/table class.
+            args (dict): Dictionary of values for the new row.
+
+        Raises:
+            RuntimeError: If the inserter has been closed.
+            queue.Full: If the queue stays full for longer than `put_timeout_s`.
+        """
+
+        if not self._put((Table, args), self.put_timeout_s):
+            raise RuntimeError("BufferedInserter is closed")
+        with self._writer.lock:
+            self._writer.stats['rows_queued'] += 1
+
+    def add_many(self, Table, args: list[dict]):
+        """
+        Queues multiple rows for insertion.
+
+        Args:
+            Table (Base): A SQLAlchemy ORM model/table class.
+            args (list[dict]): A list of dictionaries, each representing a new row.
+        """
+
+        for arg in args:
+            self.add(Table, arg)
+
+    def flush(self, timeout=None):
+        """
+        Blocks until every row queued before this call has been written (or reported as failed).
+
+        Args:
+            timeout (float, optional): Maximum seconds to wait.
+
+        Returns:
+            bool: True if the flush completed within the timeout.
+        """
+
+        request = _FlushRequest()
+        if not self._put(request):
+            # The worker flushes everything before stopping.
+            self._worker.join(timeout)
+            return not self._worker.is_alive()
+        return request.done.wait(timeout)
+
+    def close(self, timeout=None):
+        """
+        Flushes all queued rows and stops the worker thread. Safe to call more than once.
+
+        Args:
+            timeout (float, optional): Maximum seconds to wait for the worker to finish.
+        """
+
+        with self._state:
+            if self._closed:
+                return
+            self._closed = True
+            self._finalizer.detach()
+            # The worker keeps draining, so puts blocked on a full queue finish or time out.
+            self._state.wait_for(lambda: not self._puts_in_flight)
+        self._queue.put(_STOP)
+        self._worker.join(timeout)
+
+    def _put(self, item, timeout=None):
+        """
+        Queues an item unless the inserter is closed; `timeout` bounds only the wait for queue space.
+
+        Returns:
+            bool: False if the inserter is closed.
+        """
+
+        with self._state:
+            if self._closed:
+                return False
+            self._puts_in_flight += 1
+        try:
+            self._queue.put(item, timeout=timeout)
+        finally:
+            with self._state:
+                self._puts_in_flight -= 1
+                self._state.notify_all()
+        return True
+
+    def stats(self):
+        """
+        Returns counters describing the buffer's activity.
+
+        Returns:
+            dict: Rows queued, flushed and failed, batch counts and the current queue size.
+        """
+
+        with self._writer.lock:
+            stats = dict(self._writer.stats)
+        stats['queue_size'] = self._queue.qsize()
+        return stats
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -1,4 +1,7 @@
+from sqlalchemy import insert
 from sqlalchemy_dbtoolkit.orm.session import ORMSessionManager
+from sqlalchemy_dbtoolkit.utils.retry import retry_transaction
+from sqlalchemy_dbtoolkit.utils.tracing import track_operation
 
 
 class InsertManager:
@@ -6,16 +9,20 @@ class InsertManager:
     Handles database insert operations using SQLAlchemy ORM sessions.
     """
 
-    def __init__(self, engine):
+    def __init__(self, engine, retry_policy=None):
         """
         Initializes the InsertManager with a SQLAlchemy engine.
 
         Args:
             engine (sqlalchemy.Engine): An initialized SQLAlchemy engine.
+            retry_policy (RetryPolicy, optional): Re-runs a write that fails with a deadlock or
+                serialization failure. Defaults to no retries.
         """
 
-        self.session_manager = ORMSessionManager(engine)
+        self.session_manager = ORMSessionManager(engine, retry_policy=retry_policy)
 
+    @track_operation
+    @retry_transaction
     def add_row(self, Table, args: dict):
         """
         Inserts a single row into the specified table.
@@ -29,6 +36,8 @@ class InsertManager:
             row_data = Table(**args)
             session.add(row_data)
 
+    @track_operation
+    @retry_transaction
     def add_rows(self, Table, args: list[dict]):
         """
         Inserts multiple rows into the specified table.
@@ -41,3 +50,29 @@ class InsertManager:
         with self.session_manager.session_scope() as session:
             rows_data = [Table(**arg) for arg in args]
             session.add_all(rows_data)
+
+    @track_operation
+    @retry_transaction
+    def bulk_insert_rows(self, Table, args: list[dict]):
+        """
+        Inserts multiple rows using a single executemany-style INSERT statement.
+
+        Unlike `add_rows`, no ORM objects are created and the unit of work is bypassed,
+        which makes this the fastest insert path for large batches. ORM events are not
+        fired and generated primary keys are not fetched.
+
+        Args:
+            Table (Base): A SQLAlchemy ORM model/table class.
+            args (list[dict]): A list of dictionaries, each representing a new row.
+
+        Returns:
+            int: The number of rows inserted.
+        """
+
+        if not args:
+            return 0
+
+        with self.session_manager.session_scope() as session:
+            session.execute(insert(Table), args)
+
+        return len(args)
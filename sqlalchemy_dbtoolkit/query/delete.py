@@ -1,5 +1,7 @@
 from sqlalchemy_dbtoolkit.orm.session import ORMSessionManager
 from sqlalchemy_dbtoolkit.utils.query_operators import get_filter_operator
+from sqlalchemy_dbtoolkit.utils.retry import retry_transaction
+from sqlalchemy_dbtoolkit.utils.tracing import track_operation
 
 
 class DeleteManager:
@@ -7,16 +9,20 @@ class DeleteManager:
     Handles database delete operations using SQLAlchemy ORM sessions.
     """
 
-    def __init__(self, engine):
+    def __init__(self, engine, retry_policy=None):
         """
         Initializes the DeleteManager with a SQLAlchemy engine.
 
         Args:
             engine (sqlalchemy.Engine): An initialized SQLAlchemy engine.
+            retry_policy (RetryPolicy, optional): Re-runs a write that fails with a deadlock or
+                serialization failure. Defaults to no retries.
         """
 
-        self.session_manager = ORMSessionManager(engine)
+        self.session_manager = ORMSessionManager(engine, retry_policy=retry_policy)
 
+    @track_operation
+    @retry_transaction
     def delete_row(self, row_instance):
         """
         Deletes a single ORM object from the database.
@@ -36,6 +42,8 @@ class DeleteManager:
 
         return 1
 
+    @track_operation
+    @retry_transaction
     def delete_rows(self, row_instances):
         """
         Deletes multiple ORM objects at once.
@@ -56,6 +64,8 @@ class DeleteManager:
 
         return len(row_instances)
 
+    @track_operation
+    @retry_transaction
     def delete_rows_by_filter(self, Table, column_name, column_value, operator_name='eq'):
         """
             Deletes rows from the specified table based on a filter condition.
@@ -0,0 +1,144 @@
+import itertools
+import time
+import uuid
+from contextlib import suppress
+
+from sqlalchemy import Column, MetaData, and_, exists, func, insert, inspect, or_, select, text, update
+from sqlalchemy import Table as CoreTable
+
+from sqlalchemy_dbtoolkit.io.bulk_load import bulk_load
+from sqlalchemy_dbtoolkit.orm.session import ORMSessionManager
+from sqlalchemy_dbtoolkit.utils.tracing import track_operation
+
+
+class MergeManager:
+    """
+    Merges large sets of incoming rows into a table with set-based statements.
+
+    The rows are bulk loaded into a temporary staging table through the dialect's fastest
+    loader (see `bulk_load`). A single UPDATE ... FROM (a multi-table UPDATE on MySQL) then
+    rewrites only the target rows whose values differ, and a single INSERT ... SELECT adds
+    the rows without a match. Everything runs in one transaction on one connection, which
+    the temporary table is bound to.
+    """
+
+    def __init__(self, engine, batch_size=10000):
+        """
+        Initializes the MergeManager with a SQLAlchemy engine.
+
+        Args:
+            engine (sqlalchemy.Engine): An initialized SQLAlchemy engine.
+            batch_size (int, optional): Rows loaded into the staging table per batch. Defaults to 10000.
+        """
+
+        self.session_manager = ORMSessionManager(engine)
+        self.batch_size = batch_size
+
+    @staticmethod
+    def _create_staging_table(target, column_names):
+        """
+        Builds a constraint-free temporary copy of the target's columns.
+        """
+
+        columns = [Column(name, target.c[name].type) for name in column_names]
+        return CoreTable(f'_stage_{target.name}_{uuid.uuid4().hex[:8]}', MetaData(), *columns,
+                         prefixes=['TEMPORARY'])
+
+    @staticmethod
+    def _drop_staging_table(connection, staging):
+        # On MySQL only DROP TEMPORARY TABLE avoids an implicit commit of the merge transaction.
+        if connection.dialect.name in ('mysql', 'mariadb'):
+            table_name = connection.dialect.identifier_preparer.format_table(staging)
+            connection.execute(text(f"DROP TEMPORARY TABLE {table_name}"))
+        else:
+            staging.drop(connection)
+
+    def _stage_rows(self, connection, staging, first_row, rows):
+        keys = staging.columns.keys()
+        staged = 0
+        batches = itertools.chain([[first_row]], iter(lambda: list(itertools.islice(rows, self.batch_size)), []))
+        for batch in batches:
+            missing = [key for row in batch for key in keys if key not in row]
+            if missing:
+                raise ValueError(f"Every row needs the columns of the first row; missing: {sorted(set(missing))}")
+            staged += bulk_load(connection, staging, [tuple(row[key] for key in keys) for row in batch])
+        return staged
+
+    @track_operation
+    def merge_rows(self, Table, rows, key_columns=None, update_columns=None):
+        """
+        Inserts rows whose key is new and updates existing rows whose values changed.
+
+        Args:
+            Table (Base): A SQLAlchemy ORM model/table class.
+            rows (Iterable[dict]): Incoming rows. Every row must have the columns of the first row,
+                and keys must be unique within the input.
+            key_columns (list[str], optional): Columns identifying a row. Defaults to the primary key.
+            update_columns (list[str], optional): Columns to update on existing rows. Defaults to
+                every non-key column present in the first row.
+
+        Returns:
+            dict: Counts of staged, inserted, updated and unchanged rows and the elapsed seconds.
+        """
+
+        start = time.perf_counter()
+        target = inspect(Table).local_table
+        key_columns = key_columns or [column.name for column in target.primary_key.columns]
+
+        rows = iter(rows)
+        first_row = next(rows, None)
+        if first_row is None:
+            return {'staged': 0, 'inserted': 0, 'updated': 0, 'unchanged': 0, 'seconds': 0.0}
+
+        staged_columns = [name for name in first_row if name in target.c]
+        unknown_columns = [name for name in first_row if name not in target.c]
+        if unknown_columns:
+            raise AttributeError(f"{unknown_columns} are not valid columns of {Table.__name__}")
+        missing_keys = [name for name in key_columns if name not in staged_columns]
+        if missing_keys:
+            raise ValueError(f"Rows must contain the key columns {missing_keys}")
+        if update_columns is None:
+            update_columns = [name for name in staged_columns if name not in key_columns]
+        elif [name for name in update_columns if name not in staged_columns]:
+            raise ValueError(f"update_columns must be a subset of the row columns {staged_columns}")
+
+        staging = self._create_staging_table(target, staged_columns)
+        join_condition = and_(*[target.c[name] == staging.c[name] for name in key_columns])
+
+        with self.session_manager.session_scope() as session:
+            connection = session.connection()
+            staging.create(connection)
+            try:
+                staged = self._stage_rows(connection, staging, first_row, rows)
+
+                distinct_keys = select(*[staging.c[name] for name in key_columns]).distinct().subquery()
+                if connection.execute(select(func.count()).select_from(distinct_keys)).scalar_one() != staged:
+                    raise ValueError("Incoming rows contain duplicate keys")
+
+                matched = connection.execute(
+                    select(func.count()).select_from(staging).where(exists().where(join_condition))).scalar_one()
+
+                updated = 0
+                if update_columns:
+                    changed = or_(*[target.c[name].is_distinct_from(staging.c[name]) for name in update_columns])
+                    statement = (update(target)
+                                 .values({name: staging.c[name] for name in update_columns})
+                                 .where(join_condition, changed))
+                    updated = connection.execute(statement).rowcount
+
+                new_rows = select(*[staging.c[name] for name in staged_columns]).where(~exists().where(join_condition))
+                inserted = connection.execute(insert(target).from_select(staged_columns, new_rows)).rowcount
+            except Exception:
+                # Only PostgreSQL rolls the CREATE back with the transaction (a DROP inside its aborted
+                # transaction fails harmlessly). MySQL keeps temporary tables until the connection closes.
+                # pysqlite runs the CREATE before it opens the transaction, so the transaction is ended
+                # first; otherwise the rollback would undo the DROP but keep the table.
+                with suppress(Exception):
+                    if connection.dialect.name == 'sqlite':
+                        connection.connection.dbapi_connection.rollback()
+                    self._drop_staging_table(connection, staging)
+                raise
+            self._drop_staging_table(connection, staging)
+
+        return {'staged': staged, 'inserted': inserted, 'updated': updated, 'unchanged': matched - updated,
+                'seconds': round(time.perf_counter() - start, 3)}
@@ -1,5 +1,9 @@
+from sqlalchemy import exists, func, select
+
+from sqlalchemy_dbtoolkit.orm.loading import build_loader_options
 from sqlalchemy_dbtoolkit.orm.session import ORMSessionManager
-from sqlalchemy_dbtoolkit.utils.query_operators import get_filter_operator
+from sqlalchemy_dbtoolkit.utils.query_operators import get_aggregate_function, get_filter_operator
+from sqlalchemy_dbtoolkit.utils.tracing import track_operation
 
 
 class SelectManager:
@@ -12,12 +16,14 @@ class SelectManager:
         Initializes the SelectManager with a SQLAlchemy engine.
 
         Args:
-            engine (sqlalchemy.Engine): An initialized SQLAlchemy engine.
+            engine (sqlalchemy.Engine or EngineGroup): An initialized SQLAlchemy engine, or an
+                EngineGroup whose read replicas serve the queries.
         """
 
         self.session_manager = ORMSessionManager(engine)
 
-    def select_all_from_table(self, Table, offset=None, limit=None):
+    @track_operation
+    def select_all_from_table(self, Table, offset=None, limit=None, load_only=None, defer=None, eager_load=None):
         """
         Queries all rows from the specified table, with optional offset and limit.
 
@@ -25,13 +31,20 @@ class SelectManager:
             Table (Base): A SQLAlchemy ORM model/table class.
             offset (int, optional): Number of rows to skip before returning results. Defaults to None.
             limit (int, optional): Maximum number of rows to return. Defaults to None.
+            load_only (list[str], optional): Only load these columns; others raise on access.
+                Defaults to the model's loading profile.
+            defer (list[str], optional): Columns not to load; they raise on access. Defaults to the model's
+                loading profile.
+            eager_load (dict[str, str], optional): Relationship paths mapped to 'selectin', 'joined' or 'raise'.
+                Defaults to the model's loading profile.
 
         Returns:
             list[Base]: A list of ORM model instances. Empty list if no rows are found.
         """
 
+        options = build_loader_options(Table, load_only, defer, eager_load)
         with self.session_manager.session_scope(commit=False) as session:
-            query = session.query(Table)
+            query = session.query(Table).options(*options)
             if offset is not None:
                 query = query.offset(offset)
             if limit is not None:
@@ -39,23 +52,33 @@ class SelectManager:
             result = query.all()
         return result
 
-    def select_one_by_primary_key(self, Table, primary_key):
+    @track_operation
+    def select_one_by_primary_key(self, Table, primary_key, load_only=None, defer=None, eager_load=None):
         """
         Queries a single row from the specified table by its primary key value.
 
         Args:
             Table (Base): A SQLAlchemy ORM model/table class.
             primary_key (Any): The primary key value to look up.
+            load_only (list[str], optional): Only load these columns; others raise on access.
+                Defaults to the model's loading profile.
+            defer (list[str], optional): Columns not to load; they raise on access. Defaults to the model's
+                loading profile.
+            eager_load (dict[str, str], optional): Relationship paths mapped to 'selectin', 'joined' or 'raise'.
+                Defaults to the model's loading profile.
 
         Returns:
             Base or None: The ORM model instance if found, otherwise None.
         """
 
+        options = build_loader_options(Table, load_only, defer, eager_load)
         with self.session_manager.session_scope(commit=False) as session:
-            result = session.get(Table, primary_key)
+            result = session.get(Table, primary_key, options=options)
         return result
 
-    def select_one_by_column(self, Table, column_name, column_value, operator_name='eq'):
+    @track_operation
+    def select_one_by_column(self, Table, column_name, column_value, operator_name='eq', load_only=None, defer=None,
+                             eager_load=None):
         """
         Queries a single row from the specified table by a given column value.
 
@@ -65,6 +88,12 @@ class SelectManager:
             column_value (Any): The column_value to match in the specified column.
             operator_name (str, optional): The filter operator to use (default 'eq').
                 Supported operators: eq, ne, gt, lt, ge, le, like, in, etc.
+            load_only (list[str], optional): Only load these columns; others raise on access.
+                Defaults to the model's loading profile.
+            defer (list[str], optional): Columns not to load; they raise on access. Defaults to the model's
+                loading profile.
+            eager_load (dict[str, str], optional): Relationship paths mapped to 'selectin', 'joined' or 'raise'.
+                Defaults to the model's loading profile.
 
         Returns:
             Base or None: An instance of the ORM model if found, else None.
@@ -76,10 +105,14 @@ class SelectManager:
                 raise AttributeError(f"{column_name} is not a valid column of {Table.__name__}")
 
             operator_func = get_filter_operator(operator_name=operator_name)
-            result = session.query(Table).filter(operator_func(column_attr, column_value)).one_or_none()
+            options = build_loader_options(Table, load_only, defer, eager_load)
+            query = session.query(Table).options(*options)
+            result = query.filter(operator_func(column_attr, column_value)).one_or_none()
         return result
 
-    def select_all_by_column(self, Table, column_name, column_value, operator_name='eq'):
+    @track_operation
+    def select_all_by_column(self, Table, column_name, column_value, operator_name='eq', load_only=None, defer=None,
+                             eager_load=None):
         """
         Queries all rows from the specified table by a given column value.
 
@@ -89,6 +122,12 @@ class SelectManager:
             column_value (Any): The column_value to match in the specified column.
             operator_name (str, optional): The filter operator to use (default 'eq').
                 Supported operators: eq, ne, gt, lt, ge, le, like, in, etc.
+            load_only (list[str], optional): Only load these columns; others raise on access.
+                Defaults to the model's loading profile.
+            defer (list[str], optional): Columns not to load; they raise on access. Defaults to the model's
+                loading profile.
+            eager_load (dict[str, str], optional): Relationship paths mapped to 'selectin', 'joined' or 'raise'.
+                Defaults to the model's loading profile.
 
         Returns:
             list[Base]: A list of ORM model instances. Empty list if no matches.
@@ -100,6 +139,103 @@ class SelectManager:
                 raise AttributeError(f"{column_name} is not a valid column of {Table.__name__}")
 
             operator_func = get_filter_operator(operator_name=operator_name)
-            result = session.query(Table).filter(operator_func(column_attr, column_value)).all()
+            options = build_loader_options(Table, load_only, defer, eager_load)
+            query = session.query(Table).options(*options)
+            result = query.filter(operator_func(column_attr, column_value)).all()
+
+        return result
+
+    @staticmethod
+    def _get_column(Table, column_name):
+        column_attr = getattr(Table, column_name, None)
+        if column_attr is None:
+            raise AttributeError(f"{column_name} is not a valid column of {Table.__name__}")
+        return column_attr
+
+    def _build_filter(self, Table, column_name, column_value, operator_name='eq'):
+        operator_func = get_filter_operator(operator_name=operator_name)
+        return operator_func(self._get_column(Table, column_name), column_value)
+
+    @track_operation
+    def count_by_column(self, Table, column_name, column_value, operator_name='eq'):
+        """
+        Counts the rows of the specified table matching a given column value, without loading them.
+
+        Args:
+            Table (Base): A SQLAlchemy ORM model/table class.
+            column_name (str): The column name to filter by.
+            column_value (Any): The column_value to match in the specified column.
+            operator_name (str, optional): The filter operator to use (default 'eq').
+                Supported operators: eq, ne, gt, lt, ge, le, like, in, etc.
+
+        Returns:
+            int: The number of matching rows.
+        """
+
+        condition = self._build_filter(Table, column_name, column_value, operator_name)
+        with self.session_manager.session_scope(commit=False) as session:
+            result = session.execute(select(func.count()).select_from(Table).where(condition)).scalar_one()
+        return result
+
+    @track_operation
+    def exists_by_column(self, Table, column_name, column_value, operator_name='eq'):
+        """
+        Checks whether any row of the specified table matches a given column value.
+        The database stops at the first match.
+
+        Args:
+            Table (Base): A SQLAlchemy ORM model/table class.
+            column_name (str): The column name to filter by.
+            column_value (Any): The column_value to match in the specified column.
+            operator_name (str, optional): The filter operator to use (default 'eq').
+                Supported operators: eq, ne, gt, lt, ge, le, like, in, etc.
 
+        Returns:
+            bool: True if at least one row matches, False otherwise.
+        """
+
+        condition = self._build_filter(Table, column_name, column_value, operator_name)
+        with self.session_manager.session_scope(commit=False) as session:
+            result = session.execute(select(exists().where(condition))).scalar_one()
+        return bool(result)
+
+    @track_operation(column_parameter=None, filters_parameter='filters')
+    def aggregate(self, Table, func_name, column_name=None, group_by=None, filters=None):
+        """
+        Computes an aggregate over the specified table in the database, optionally grouped.
+
+        Args:
+            Table (Base): A SQLAlchemy ORM model/table class.
+            func_name (str): The aggregate to compute: count, sum, min, max or avg.
+            column_name (str, optional): The column to aggregate. Required except for 'count',
+                which counts all rows when omitted.
+            group_by (str or list[str], optional): Column name(s) to group by. Defaults to None.
+            filters (list[tuple], optional): Conditions combined with AND, each a
+                `(column_name, column_value)` or `(column_name, column_value, operator_name)` tuple.
+
+        Returns:
+            Any or list[Row]: The aggregate value without `group_by`. Otherwise one row per group,
+                holding the group columns followed by the aggregate labelled `func_name`, ordered by the group columns.
+        """
+
+        aggregate_func = get_aggregate_function(func_name)
+        if column_name is None:
+            if func_name != 'count':
+                raise ValueError(f"Aggregate function {func_name} requires a column_name")
+            aggregate_expression = aggregate_func()
+        else:
+            aggregate_expression = aggregate_func(self._get_column(Table, column_name))
+
+        if isinstance(group_by, str):
+            group_by = [group_by]
+        group_columns = [self._get_column(Table, name) for name in group_by or []]
+
+        statement = select(*group_columns, aggregate_expression.label(func_name)).select_from(Table)
+        for condition in filters or []:
+            statement = statement.where(self._build_filter(Table, *condition))
+
+        with self.session_manager.session_scope(commit=False) as session:
+            if not group_columns:
+                return session.execute(statement).scalar_one()
+            result = session.execute(statement.group_by(*group_columns).order_by(*group_columns)).all()
         return result
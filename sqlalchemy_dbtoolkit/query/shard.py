@@ -0,0 +1,377 @@
+import contextvars
+import heapq
+from concurrent.futures import ThreadPoolExecutor
+
+from sqlalchemy import inspect
+from sqlalchemy.orm.exc import MultipleResultsFound
+
+from sqlalchemy_dbtoolkit.orm.session import ORMSessionManager
+from sqlalchemy_dbtoolkit.utils.query_operators import get_filter_operator
+from sqlalchemy_dbtoolkit.utils.tracing import track_operation
+
+
+class ShardedQueryManager:
+    """
+    Handles CRUD operations on a table that is split across several databases of the same schema.
+
+    Calls that name the shard key (inserts, primary key lookups, 'eq'/'in' filters on the shard
+    key column) are routed to the owning shard(s) only. All other queries are fanned out to every
+    shard concurrently on a thread pool and merged, so latency tracks the slowest shard rather
+    than the sum of all shards. Writes are committed per shard; there is no cross-shard transaction.
+    """
+
+    def __init__(self, engines, shard_key_func, shard_key_column=None, max_workers=None):
+        """
+        Initializes the ShardedQueryManager.
+
+        Args:
+            engines (dict or list): Mapping of shard id to SQLAlchemy engine (or EngineGroup).
+                A list is treated as shards 0..n-1.
+            shard_key_func (callable): Maps a shard key value to a shard id.
+            shard_key_column (str, optional): Column holding the shard key. Defaults to the
+                single-column primary key of each queried table.
+            max_workers (int, optional): Threads used for fan-out queries. Defaults to one per shard.
+        """
+
+        if isinstance(engines, (list, tuple)):
+            engines = dict(enumerate(engines))
+        if not engines:
+            raise ValueError("At least one shard engine is required")
+
+        self.engines = dict(engines)
+        self.shard_key_func = shard_key_func
+        self.shard_key_column = shard_key_column
+        self.session_managers = {shard_id: ORMSessionManager(engine) for shard_id, engine in self.engines.items()}
+        self.executor = ThreadPoolExecutor(max_workers=max_workers or len(self.engines),
+                                           thread_name_prefix='dbtoolkit-shard')
+
+    def get_shard(self, shard_key_value):
+        """
+        Resolves the shard owning a shard key value.
+
+        Args:
+            shard_key_value (Any): Value of the shard key column.
+
+        Raises:
+            KeyError: If the shard key function returns an unknown shard id.
+
+        Returns:
+            Any: The shard id.
+        """
+
+        shard_id = self.shard_key_func(shard_key_value)
+        if shard_id not in self.engines:
+            raise KeyError(f"Shard key {shard_key_value!r} maps to unknown shard {shard_id!r}")
+        return shard_id
+
+    def get_shard_key_column(self, Table):
+        """
+        Returns the name of the shard key column for a table.
+
+        Args:
+            Table (Base): A SQLAlchemy ORM model/table class.
+
+        Returns:
+            str: The configured shard key column, or the table's primary key column.
+        """
+
+        if self.shard_key_column is not None:
+            return self.shard_key_column
+
+        primary_key = inspect(Table).primary_key
+        if len(primary_key) != 1:
+            raise ValueError(f"{Table.__name__} has a composite primary key; set shard_key_column explicitly")
+        return primary_key[0].key
+
+    def route_filter(self, Table, column_name, column_value, operator_name):
+        """
+        Determines which shards a filter has to be sent to.
+
+        Args:
+            Table (Base): A SQLAlchemy ORM model/table class.
+            column_name (str): The column name to filter by.
+            column_value (Any): The value to match in the specified column.
+            operator_name (str): The filter operator.
+
+        Returns:
+            dict: Mapping of shard id to the column value to query that shard with.
+        """
+
+        if column_name == self.get_shard_key_column(Table):
+            if operator_name == 'eq':
+                return {self.get_shard(column_value): column_value}
+            if operator_name == 'in':
+                routed = {}
+                for value in column_value:
+                    routed.setdefault(self.get_shard(value), []).append(value)
+                return routed
+        return {shard_id: column_value for shard_id in self.engines}
+
+    def _run(self, tasks):
+        """
+        Runs one callable per shard concurrently and returns their results by shard id.
+        Each task runs in a copy of the caller's context so instrumentation keeps its origin.
+        """
+
+        if len(tasks) == 1:
+            (shard_id, task), = tasks.items()
+            return {shard_id: task()}
+
+        futures = {shard_id: self.executor.submit(contextvars.copy_context().run, task)
+                   for shard_id, task in tasks.items()}
+        return {shard_id: future.result() for shard_id, future in futures.items()}
+
+    @staticmethod
+    def _filter_clause(Table, column_name, column_value, operator_name):
+        column_attr = getattr(Table, column_name, None)
+        if column_attr is None:
+            raise AttributeError(f"{column_name} is not a valid column of {Table.__name__}")
+
+        operator_func = get_filter_operator(operator_name=operator_name)
+        return operator_func(column_attr, column_value)
+
+    @staticmethod
+    def _merge(results, order_by, descending, limit):
+        """
+        Merges per-shard result lists, keeping the order of pre-sorted inputs and applying the limit.
+        NULLs sort as the largest value, as in `_select`.
+        """
+
+        if order_by is None:
+            merged = [row for rows in results for row in rows]
+        else:
+            def key(row):
+                value = getattr(row, order_by)
+                return value is None, value
+
+            merged = list(heapq.merge(*results, key=key, reverse=descending))
+        return merged[:limit] if limit is not None else merged
+
+    def _select(self, shard_id, Table, clause, order_by, descending, limit):
+        with self.session_managers[shard_id].session_scope(commit=False) as session:
+            query = session.query(Table)
+            if clause is not None:
+                query = query.filter(clause)
+            if order_by is not None:
+                column_attr = getattr(Table, order_by, None)
+                if column_attr is None:
+                    raise AttributeError(f"{order_by} is not a valid column of {Table.__name__}")
+                # NULLs last ascending and first descending on every dialect; MySQL has no NULLS LAST.
+                is_null = column_attr.is_(None)
+                query = query.order_by(*((is_null.desc(), column_attr.desc()) if descending
+                                         else (is_null, column_attr)))
+            if limit is not None:
+                query = query.limit(limit)
+            return query.all()
+
+    @track_operation
+    def add_row(self, Table, args: dict):
+        """
+        Inserts a single row into the shard owning its shard key.
+
+        Args:
+            Table (Base): A SQLAlchemy ORM model/table class.
+            args (dict): Dictionary of values for the new row, including the shard key.
+        """
+
+        shard_key_column = self.get_shard_key_column(Table)
+        if shard_key_column not in args:
+            raise ValueError(f"Row is missing shard key column '{shard_key_column}'")
+
+        with self.session_managers[self.get_shard(args[shard_key_column])].session_scope() as session:
+            session.add(Table(**args))
+
+    @track_operation
+    def add_rows(self, Table, args: list[dict]):
+        """
+        Inserts multiple rows, grouped by shard and written to all shards concurrently.
+
+        Args:
+            Table (Base): A SQLAlchemy ORM model/table class.
+            args (list[dict]): A list of dictionaries, each including the shard key.
+
+        Returns:
+            dict: Number of rows inserted per shard id.
+        """
+
+        shard_key_column = self.get_shard_key_column(Table)
+        grouped = {}
+        for arg in args:
+            if shard_key_column not in arg:
+                raise ValueError(f"Row is missing shard key column '{shard_key_column}'")
+            grouped.setdefault(self.get_shard(arg[shard_key_column]), []).append(arg)
+
+        def insert(shard_id, rows):
+            with self.session_managers[shard_id].session_scope() as session:
+                session.add_all([Table(**row) for row in rows])
+            return len(rows)
+
+        return self._run({shard_id: (lambda s=shard_id, r=rows: insert(s, r)) for shard_id, rows in grouped.items()})
+
+    @track_operation
+    def select_one_by_primary_key(self, Table, primary_key):
+        """
+        Queries a single row by primary key. Routed to one shard if the primary key is the
+        shard key, otherwise all shards are queried concurrently.
+
+        Args:
+            Table (Base): A SQLAlchemy ORM model/table class.
+            primary_key (Any): The primary key value to look up.
+
+        Returns:
+            Base or None: The ORM model instance if found, otherwise None.
+        """
+
+        primary_key_column = inspect(Table).primary_key[0].key
+        if self.get_shard_key_column(Table) == primary_key_column:
+            shard_ids = [self.get_shard(primary_key)]
+        else:
+            shard_ids = list(self.engines)
+
+        def get(shard_id):
+            with self.session_managers[shard_id].session_scope(commit=False) as session:
+                return session.get(Table, primary_key)
+
+        results = self._run({shard_id: (lambda s=shard_id: get(s)) for shard_id in shard_ids})
+        return next((row for row in results.values() if row is not None), None)
+
+    @track_operation
+    def select_one_by_column(self, Table, column_name, column_value, operator_name='eq'):
+        """
+        Queries a single row by a given column value across the relevant shards.
+
+        Args:
+            Table (Base): A SQLAlchemy ORM model/table class.
+            column_name (str): The column name to filter by.
+            column_value (Any): The column_value to match in the specified column.
+            operator_name (str, optional): The filter operator to use (default 'eq').
+
+        Raises:
+            MultipleResultsFound: If more than one row matches across all shards.
+
+        Returns:
+            Base or None: An instance of the ORM model if found, else None.
+        """
+
+        routed = self.route_filter(Table, column_name, column_value, operator_name)
+        tasks = {}
+        for shard_id, value in routed.items():
+            clause = self._filter_clause(Table, column_name, value, operator_name)
+            tasks[shard_id] = lambda s=shard_id, c=clause: self._select(s, Table, c, None, False, 2)
+
+        rows = [row for shard_rows in self._run(tasks).values() for row in shard_rows]
+        if len(rows) > 1:
+            raise MultipleResultsFound(f"Multiple rows of {Table.__name__} match {column_name} across shards")
+        return rows[0] if rows else None
+
+    @track_operation
+    def select_all_by_column(self, Table, column_name, column_value, operator_name='eq', order_by=None,
+                             descending=False, limit=None):
+        """
+        Queries all matching rows across the relevant shards and merges them.
+
+        Ordering and limit are pushed down to every shard, then the pre-sorted shard
+        results are merged and truncated, so each shard returns at most `limit` rows.
+
+        Args:
+            Table (Base): A SQLAlchemy ORM model/table class.
+            column_name (str): The column name to filter by.
+            column_value (Any): The column_value to match in the specified column.
+            operator_name (str, optional): The filter operator to use (default 'eq').
+            order_by (str, optional): Column name to order the merged result by.
+            descending (bool, optional): Sort descending instead of ascending. Defaults to False.
+            limit (int, optional): Maximum number of rows to return.
+
+        Returns:
+            list[Base]: A list of ORM model instances. Empty list if no matches.
+        """
+
+        routed = self.route_filter(Table, column_name, column_value, operator_name)
+        tasks = {}
+        for shard_id, value in routed.items():
+            clause = self._filter_clause(Table, column_name, value, operator_name)
+            tasks[shard_id] = lambda s=shard_id, c=clause: self._select(s, Table, c, order_by, descending, limit)
+
+        return self._merge(list(self._run(tasks).values()), order_by, descending, limit)
+
+    @track_operation
+    def select_all_from_table(self, Table, order_by=None, descending=False, limit=None):
+        """
+        Queries all rows of the table from every shard concurrently and merges them.
+
+        Args:
+            Table (Base): A SQLAlchemy ORM model/table class.
+            order_by (str, optional): Column name to order the merged result by.
+            descending (bool, optional): Sort descending instead of ascending. Defaults to False.
+            limit (int, optional): Maximum number of rows to return.
+
+        Returns:
+            list[Base]: A list of ORM model instances. Empty list if no rows are found.
+        """
+
+        tasks = {shard_id: (lambda s=shard_id: self._select(s, Table, None, order_by, descending, limit))
+                 for shard_id in self.engines}
+        return self._merge(list(self._run(tasks).values()), order_by, descending, limit)
+
+    @track_operation
+    def bulk_update_rows(self, Table, column_name, column_value, update_dict, operator_name='eq'):
+        """
+        Performs a bulk update on the matching rows of the relevant shards.
+
+        Args:
+            Table (Base): A SQLAlchemy ORM model/table class.
+            column_name (str): The column name to filter by.
+            column_value (Any): The value to match in the specified column.
+            update_dict (dict): A dictionary of column-value pairs to update.
+            operator_name (str, optional): The filter operator to use (default 'eq').
+
+        Returns:
+            int: The number of rows updated across all shards.
+        """
+
+        if self.get_shard_key_column(Table) in update_dict:
+            raise ValueError("Updating the shard key column would move rows between shards")
+
+        def update(shard_id, clause):
+            with self.session_managers[shard_id].session_scope() as session:
+                return session.query(Table).filter(clause).update(update_dict)
+
+        routed = self.route_filter(Table, column_name, column_value, operator_name)
+        tasks = {}
+        for shard_id, value in routed.items():
+            clause = self._filter_clause(Table, column_name, value, operator_name)
+            tasks[shard_id] = lambda s=shard_id, c=clause: update(s, c)
+        return sum(self._run(tasks).values())
+
+    @track_operation
+    def delete_rows_by_filter(self, Table, column_name, column_value, operator_name='eq'):
+        """
+        Deletes the matching rows from the relevant shards.
+
+        Args:
+            Table (Base): A SQLAlchemy ORM model/table class.
+            column_name (str): The column name to filter by.
+            column_value (Any): The value to match in the specified column.
+            operator_name (str, optional): The filter operator to use (default 'eq').
+
+        Returns:
+            int: The number of rows deleted across all shards.
+        """
+
+        def delete(shard_id, clause):
+            with self.session_managers[shard_id].session_scope() as session:
+                return session.query(Table).filter(clause).delete(synchronize_session=False)
+
+        routed = self.route_filter(Table, column_name, column_value, operator_name)
+        tasks = {}
+        for shard_id, value in routed.items():
+            clause = self._filter_clause(Table, column_name, value, operator_name)
+            tasks[shard_id] = lambda s=shard_id, c=clause: delete(s, c)
+        return sum(self._run(tasks).values())
+
+    def close(self):
+        """
+        Shuts down the fan-out thread pool.
+        """
+
+        self.executor.shutdown(wait=True)
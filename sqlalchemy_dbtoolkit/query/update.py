@@ -1,5 +1,7 @@
 from sqlalchemy_dbtoolkit.orm.session import ORMSessionManager
 from sqlalchemy_dbtoolkit.utils.query_operators import get_filter_operator
+from sqlalchemy_dbtoolkit.utils.retry import retry_transaction
+from sqlalchemy_dbtoolkit.utils.tracing import track_operation
 
 
 class UpdateManager:
@@ -7,16 +9,20 @@ class UpdateManager:
     Handles database update operations using SQLAlchemy ORM sessions.
     """
 
-    def __init__(self, engine):
+    def __init__(self, engine, retry_policy=None):
         """
         Initializes the UpdateManager with a SQLAlchemy engine.
 
         Args:
             engine (sqlalchemy.Engine): An initialized SQLAlchemy engine.
+            retry_policy (RetryPolicy, optional): Re-runs a write that fails with a deadlock or
+                serialization failure. Defaults to no retries.
         """
 
-        self.session_manager = ORMSessionManager(engine)
+        self.session_manager = ORMSessionManager(engine, retry_policy=retry_policy)
 
+    @track_operation
+    @retry_transaction
     def bulk_update_rows(self, Table, column_name, column_value, update_dict, operator_name='eq'):
         """
         Performs a bulk update on one or more rows in the specified table that match a column value.
@@ -43,6 +49,8 @@ class UpdateManager:
 
         return updated_rows
 
+    @track_operation
+    @retry_transaction
     def update_rows(self, Table, column_name, column_value, update_dict, operator_name='eq'):
         """
         Updates rows in the specified table that match a column value using ORM objects.
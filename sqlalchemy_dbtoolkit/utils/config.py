@@ -33,6 +33,29 @@ class Config:
         config.read(self.config_path)
         return config
 
+    def parse_replicas(self, section):
+        """
+        Parse the optional comma-separated 'replicas' entry of a section.
+        Each entry is 'host' or 'host:port'; a missing port is returned as None.
+
+        Args:
+            section (str): Config section name, e.g. 'postgresql'.
+
+        Returns:
+            list[tuple[str, str or None]]: Replica hosts and ports. Empty if not configured.
+        """
+        if section not in self.config:
+            return []
+
+        replicas = []
+        for entry in self.config[section].get('replicas', '').split(','):
+            entry = entry.strip()
+            if not entry:
+                continue
+            host, _, port = entry.partition(':')
+            replicas.append((host, port or None))
+        return replicas
+
     @property
     def mysql_host(self):
         """
@@ -73,6 +96,20 @@ class Config:
         except KeyError:
             raise KeyError("Missing 'mysql port' under [mysql] section.")
 
+    @property
+    def mysql_driver(self):
+        """
+        Return the configured MySQL driver name. Optional.
+        """
+        return self.config['mysql'].get('driver') if 'mysql' in self.config else None
+
+    @property
+    def mysql_replicas(self):
+        """
+        Return MySQL read replicas as (host, port) tuples. Optional.
+        """
+        return self.parse_replicas('mysql')
+
     @property
     def postgresql_host(self):
         """
@@ -113,6 +150,20 @@ class Config:
         except KeyError:
             raise KeyError("Missing 'postgresql port' under [postgresql] section.")
 
+    @property
+    def postgresql_driver(self):
+        """
+        Return the configured PostgreSQL driver name. Optional.
+        """
+        return self.config['postgresql'].get('driver') if 'postgresql' in self.config else None
+
+    @property
+    def postgresql_replicas(self):
+        """
+        Return PostgreSQL read replicas as (host, port) tuples. Optional.
+        """
+        return self.parse_replicas('postgresql')
+
     @property
     def sqlite_path(self):
         """
@@ -122,3 +173,20 @@ class Config:
             return self.config['sqlite']['path']
         except KeyError:
             raise KeyError("Missing 'sqlite path' under [sqlite] section.")
+
+    @property
+    def sqlite_mode(self):
+        """
+        Return the SQLite open mode ('rw', 'ro' or 'memory'). Optional.
+        """
+        return self.config['sqlite'].get('mode') if 'sqlite' in self.config else None
+
+    @property
+    def sqlite_persist_interval(self):
+        """
+        Return the seconds between persists of an in-memory SQLite database. Optional.
+        """
+        try:
+            return self.config.getfloat('sqlite', 'persist_interval_s', fallback=None)
+        except ValueError:
+            raise ValueError("'persist_interval_s' under [sqlite] section must be a number.")
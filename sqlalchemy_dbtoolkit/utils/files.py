@@ -0,0 +1,33 @@
+import os
+import tempfile
+
+
+def atomic_write(path, write, prefix=None):
+    """
+    Writes a file through a temporary file in the same directory, flushes it to disk and renames it
+    into place, so readers never see a partial file. The temporary file is removed if writing fails
+    or is interrupted.
+
+    Args:
+        path (str): Target file; replaced if it exists.
+        write (callable): Called as `write(temp_path)` to write the complete contents to the temporary file.
+        prefix (str, optional): Prefix of the temporary file name. Defaults to '.<file name>.'.
+
+    Returns:
+        str: The target path.
+    """
+
+    directory = os.path.dirname(os.path.abspath(path))
+    file_descriptor, temp_path = tempfile.mkstemp(dir=directory, prefix=prefix or f'.{os.path.basename(path)}.',
+                                                  suffix='.tmp')
+    os.close(file_descriptor)
+    try:
+        write(temp_path)
+        with open(temp_path, 'r+b') as temp_file:
+            os.fsync(temp_file.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+    return path
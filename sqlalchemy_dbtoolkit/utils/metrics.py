@@ -0,0 +1,88 @@
+import bisect
+
+# Upper bounds of the latency buckets in milliseconds; the last bucket is unbounded.
+DEFAULT_LATENCY_BUCKETS_MS = (0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+class LatencyHistogram:
+    """
+    Fixed-bucket latency histogram with constant memory and O(log n) updates.
+
+    Not thread-safe on its own; callers are expected to hold their own lock.
+    """
+
+    def __init__(self, buckets_ms=DEFAULT_LATENCY_BUCKETS_MS):
+        """
+        Initializes an empty histogram.
+
+        Args:
+            buckets_ms (tuple[float]): Ascending bucket upper bounds in milliseconds.
+        """
+
+        self.buckets_ms = tuple(buckets_ms)
+        self.counts = [0] * (len(self.buckets_ms) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, value_ms):
+        """
+        Records a single latency sample.
+
+        Args:
+            value_ms (float): Latency in milliseconds.
+        """
+
+        self.counts[bisect.bisect_left(self.buckets_ms, value_ms)] += 1
+        self.count += 1
+        self.total_ms += value_ms
+        if value_ms > self.max_ms:
+            self.max_ms = value_ms
+
+    def percentile(self, pct):
+        """
+        Estimates a percentile as the upper bound of the bucket that contains it.
+
+        Args:
+            pct (float): Percentile between 0 and 100.
+
+        Returns:
+            float or None: Estimated latency in milliseconds, or None if no samples were recorded.
+        """
+
+        if not self.count:
+            return None
+
+        threshold = pct / 100 * self.count
+        cumulative = 0
+        for index, bucket_count in enumerate(self.counts):
+            cumulative += bucket_count
+            if cumulative >= threshold and bucket_count:
+                if index < len(self.buckets_ms):
+                    return min(self.buckets_ms[index], self.max_ms)
+                return self.max_ms
+        return self.max_ms
+
+    @staticmethod
+    def _rounded(value):
+        return round(value, 3) if value is not None else None
+
+    def snapshot(self):
+        """
+        Returns the histogram state as a plain dictionary.
+
+        Returns:
+            dict: Count, sum, mean, max, estimated p50/p95/p99 and per-bucket (non-cumulative) counts.
+        """
+
+        labels = [f'le_{bound}' for bound in self.buckets_ms] + ['le_inf']
+        return {
+            'count': self.count,
+            'total_ms': round(self.total_ms, 3),
+            'mean_ms': round(self.total_ms / self.count, 3) if self.count else None,
+            'max_ms': round(self.max_ms, 3),
+            'p50_ms': self._rounded(self.percentile(50)),
+            'p95_ms': self._rounded(self.percentile(95)),
+            'p99_ms': self._rounded(self.percentile(99)),
+            'buckets': dict(zip(labels, self.counts))
+        }
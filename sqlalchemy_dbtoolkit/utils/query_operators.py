@@ -13,6 +13,9 @@ COMPARISON_OPERATORS = {
     'not_in': lambda c, v: ~c.in_(v)   # [value, value]
 }
 
+# Resolved against sqlalchemy.func on use, so importing this module stays free of SQLAlchemy.
+AGGREGATE_FUNCTIONS = ('count', 'sum', 'min', 'max', 'avg')
+
 
 def get_filter_operator(operator_name: str):
     """
@@ -37,3 +40,28 @@ def get_filter_operator(operator_name: str):
     if op is None:
         raise ValueError(f"Unsupported operator: {operator_name}")
     return op
+
+
+def get_aggregate_function(func_name: str):
+    """
+    Retrieves and validates an SQL aggregate function.
+
+    Args:
+        func_name (str): The name of the aggregate (e.g., "count", "sum", "avg").
+
+    Returns:
+        callable: A function that builds the aggregate expression for a column.
+
+    Raises:
+        ValueError: If the aggregate is not supported.
+        TypeError: If func_name is not a string.
+    """
+
+    if not isinstance(func_name, str):
+        raise TypeError(f"{func_name} must be a string")
+
+    if func_name not in AGGREGATE_FUNCTIONS:
+        raise ValueError(f"Unsupported aggregate function: {func_name}")
+
+    from sqlalchemy import func
+    return getattr(func, func_name)
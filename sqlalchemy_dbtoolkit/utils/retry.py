@@ -0,0 +1,225 @@
+import functools
+import random
+import threading
+import time
+
+from sqlalchemy_dbtoolkit.utils.tracing import get_current_operation
+
+# Errors after which re-running the whole transaction is expected to succeed.
+RETRYABLE_ERROR_CODES = {
+    'postgresql': frozenset({'40001', '40P01'}),   # serialization_failure, deadlock_detected
+    'mysql': frozenset({1213, 1205}),   # ER_LOCK_DEADLOCK, ER_LOCK_WAIT_TIMEOUT
+    'mariadb': frozenset({1213, 1205})
+}
+
+# SQLite busy/locked errors; only retried when enabled on the policy.
+SQLITE_LOCKED_ERROR_CODES = frozenset({'SQLITE_BUSY', 'SQLITE_LOCKED'})
+
+_SQLITE_LOCKED_MESSAGES = {'database is locked': 'SQLITE_BUSY', 'database table is locked': 'SQLITE_LOCKED'}
+
+
+def get_error_code(error):
+    """
+    Extracts the driver error code from a SQLAlchemy DBAPIError.
+
+    Args:
+        error (Exception): The raised exception.
+
+    Returns:
+        str or int or None: The SQLSTATE (PostgreSQL), error number (MySQL) or result code name (SQLite),
+            or None if the error does not wrap a DBAPI error or carries no code.
+    """
+
+    original = getattr(error, 'orig', None)
+    if original is None:
+        return None
+
+    # mysql-connector-python; checked first as its errors also carry a SQLSTATE
+    code = getattr(original, 'errno', None)
+    if isinstance(code, int):
+        return code
+    # psycopg 3 and psycopg2
+    for attribute in ('sqlstate', 'pgcode'):
+        code = getattr(original, attribute, None)
+        if code:
+            return code
+    # sqlite3 (Python 3.11+), with a message fallback for older versions
+    code = getattr(original, 'sqlite_errorname', None)
+    if code:
+        return code
+    message = str(original).lower()
+    for locked_message, locked_code in _SQLITE_LOCKED_MESSAGES.items():
+        if locked_message in message:
+            return locked_code
+    # MySQLdb and PyMySQL
+    if original.args and isinstance(original.args[0], int):
+        return original.args[0]
+    return None
+
+
+class RetryPolicy:
+    """
+    Re-runs a unit of work that failed with a deadlock, serialization failure or lock timeout.
+
+    Retries wait with capped exponential backoff and full jitter: the n-th retry sleeps a random
+    duration between 0 and min(max_delay_s, base_delay_s * 2 ** (n - 1)), so contending writers
+    spread out instead of colliding again. The unit of work must be the whole transaction, as the
+    database has already rolled it back. Retry counts are kept per policy; see `snapshot`.
+    """
+
+    def __init__(self, max_attempts=5, base_delay_s=0.05, max_delay_s=2.0, retry_sqlite_locked=False,
+                 retryable_codes=None):
+        """
+        Initializes the RetryPolicy.
+
+        Args:
+            max_attempts (int, optional): Attempts per call, including the first. Defaults to 5.
+            base_delay_s (float, optional): Backoff cap of the first retry in seconds. Defaults to 0.05.
+            max_delay_s (float, optional): Upper bound of any backoff in seconds. Defaults to 2.0.
+            retry_sqlite_locked (bool, optional): Also retry SQLite 'database is locked' errors. Defaults to False.
+            retryable_codes (dict, optional): Dialect names mapped to retryable error codes,
+                replacing `RETRYABLE_ERROR_CODES`.
+        """
+
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        if base_delay_s < 0 or max_delay_s < 0:
+            raise ValueError("Backoff delays must not be negative")
+
+        self.max_attempts = max_attempts
+        self.base_delay_s = base_delay_s
+        self.max_delay_s = max_delay_s
+        self.retryable_codes = dict(RETRYABLE_ERROR_CODES if retryable_codes is None else retryable_codes)
+        if retry_sqlite_locked:
+            self.retryable_codes['sqlite'] = self.retryable_codes.get('sqlite', frozenset()) | SQLITE_LOCKED_ERROR_CODES
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """
+        Clears the retry metrics.
+        """
+
+        with self._lock:
+            self._metrics = {'calls': 0, 'retries': 0, 'recovered': 0, 'exhausted': 0, 'backoff_s': 0.0}
+            self._retries_by_code = {}
+            self._retries_by_operation = {}
+
+    def is_retryable(self, error, dialect_name=None):
+        """
+        Checks whether an error is a retryable conflict on the given dialect.
+
+        Args:
+            error (Exception): The raised exception.
+            dialect_name (str, optional): Dialect the error came from. Defaults to checking every dialect.
+
+        Returns:
+            bool: True if the transaction should be re-run.
+        """
+
+        code = get_error_code(error)
+        if code is None:
+            return False
+        if dialect_name is not None:
+            return code in self.retryable_codes.get(dialect_name, ())
+        return any(code in codes for codes in self.retryable_codes.values())
+
+    def backoff(self, retry):
+        """
+        Draws the sleep before a retry.
+
+        Args:
+            retry (int): Number of the retry, starting at 1.
+
+        Returns:
+            float: Seconds to sleep.
+        """
+
+        return random.uniform(0, min(self.max_delay_s, self.base_delay_s * 2 ** (retry - 1)))
+
+    def run(self, func, args=(), kwargs=None, dialect_name=None):
+        """
+        Calls a function and re-runs it while it fails with a retryable error.
+
+        Args:
+            func (callable): The unit of work; it must open and commit its own transaction.
+            args (tuple, optional): Positional arguments for `func`.
+            kwargs (dict, optional): Keyword arguments for `func`.
+            dialect_name (str, optional): Dialect of the engine `func` writes to.
+
+        Returns:
+            Any: The return value of `func`.
+        """
+
+        kwargs = kwargs or {}
+        with self._lock:
+            self._metrics['calls'] += 1
+
+        attempt = 1
+        while True:
+            try:
+                result = func(*args, **kwargs)
+            except Exception as e:
+                if not self.is_retryable(e, dialect_name):
+                    raise
+                if attempt >= self.max_attempts:
+                    with self._lock:
+                        self._metrics['exhausted'] += 1
+                    raise
+                delay = self.backoff(attempt)
+                self._record_retry(get_error_code(e), delay)
+                time.sleep(delay)
+                attempt += 1
+                continue
+            if attempt > 1:
+                with self._lock:
+                    self._metrics['recovered'] += 1
+            return result
+
+    def _record_retry(self, code, delay):
+        operation = get_current_operation()
+        method = operation.method if operation is not None else None
+        with self._lock:
+            self._metrics['retries'] += 1
+            self._metrics['backoff_s'] += delay
+            self._retries_by_code[code] = self._retries_by_code.get(code, 0) + 1
+            self._retries_by_operation[method] = self._retries_by_operation.get(method, 0) + 1
+
+    def snapshot(self):
+        """
+        Returns the retry metrics.
+
+        Returns:
+            dict: Calls run through the policy, retries, calls that succeeded after retrying (recovered),
+                calls that gave up after `max_attempts` (exhausted), total backoff seconds, and retries
+                per error code and per manager method (None outside of a manager call).
+        """
+
+        with self._lock:
+            snapshot = dict(self._metrics)
+            snapshot['backoff_s'] = round(snapshot['backoff_s'], 3)
+            snapshot['retries_by_code'] = dict(self._retries_by_code)
+            snapshot['retries_by_operation'] = dict(self._retries_by_operation)
+        return snapshot
+
+
+def retry_transaction(func):
+    """
+    Decorator for write manager methods that re-runs the method under the retry policy of the
+    manager's session manager. Without a policy the method runs once.
+
+    Args:
+        func (callable): The manager method to wrap; it must run its whole transaction itself.
+
+    Returns:
+        callable: The wrapped method.
+    """
+
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        session_manager = self.session_manager
+        if session_manager.retry_policy is None:
+            return func(self, *args, **kwargs)
+        return session_manager.retry_policy.run(func, (self, *args), kwargs, dialect_name=session_manager.dialect_name)
+
+    return wrapper
@@ -1,10 +1,10 @@
-import pandas as pd
-
-
 def sanitize_nan_to_none(value):
     """
     Converts NaN-like values to None for safe SQL insertion.
 
+    Plain Python values are handled without touching pandas; pandas is only
+    imported lazily for other objects (e.g. pd.NA, pd.NaT or numpy scalars).
+
     Args:
         value (any): The value to sanitize. Can be of any type, including float, string, or None.
 
@@ -13,9 +13,18 @@ def sanitize_nan_to_none(value):
              otherwise, returns the original value.
     """
 
-    if pd.isna(value):
+    if value is None:
         return None
-    elif isinstance(value, str) and value.strip().lower() == 'nan':
+    elif isinstance(value, str):
+        return None if value.strip().lower() == 'nan' else value
+    elif isinstance(value, float):
+        return None if value != value else value
+    elif isinstance(value, (bool, int)):
+        return value
+
+    import pandas as pd
+
+    if pd.isna(value):
         return None
     else:
         return value
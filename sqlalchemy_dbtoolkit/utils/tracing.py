@@ -0,0 +1,169 @@
+import functools
+import inspect
+import time
+from collections import namedtuple
+from contextvars import ContextVar
+
+OperationContext = namedtuple('OperationContext', ['method', 'table', 'column', 'operator', 'filters'],
+                              defaults=((),))
+OperationContext.__doc__ = """
+Describes the toolkit manager call that is currently executing.
+
+Attributes:
+    method (str): Qualified manager method, e.g. 'SelectManager.select_all_by_column'.
+    table (str or None): Table name of the ORM model the call targets.
+    column (str or None): Filter column passed to the call, if any.
+    operator (str or None): Filter operator name passed to the call, if any.
+    filters (tuple[tuple[str, str]]): Every (column, operator) predicate the call filters by,
+        including the `column`/`operator` pair.
+"""
+
+current_operation = ContextVar('dbtoolkit_current_operation', default=None)
+
+# Callbacks notified after every tracked manager call; see add_operation_listener.
+_operation_listeners = []
+
+
+def get_current_operation():
+    """
+    Returns the manager call executing in the current thread or task.
+
+    Returns:
+        OperationContext or None: The active operation, or None outside of a manager call.
+    """
+
+    return current_operation.get()
+
+
+def add_operation_listener(listener):
+    """
+    Registers a callback that is notified after every tracked manager call.
+
+    The callback receives the call's OperationContext, its duration in milliseconds and
+    whether it raised. It runs synchronously in the calling thread and must be cheap and
+    must not raise. While no listener is registered, calls are not timed at all.
+
+    Args:
+        listener (callable): Function taking (operation, elapsed_ms, error).
+    """
+
+    if listener not in _operation_listeners:
+        _operation_listeners.append(listener)
+
+
+def remove_operation_listener(listener):
+    """
+    Unregisters a callback added with `add_operation_listener`.
+
+    Args:
+        listener (callable): The registered callback.
+    """
+
+    if listener in _operation_listeners:
+        _operation_listeners.remove(listener)
+
+
+def _table_name(table):
+    """
+    Resolves a table name from an ORM model class or instance.
+    """
+
+    if table is None:
+        return None
+    return getattr(table, '__tablename__', None) or getattr(table, 'name', None)
+
+
+def _filter_predicates(filters):
+    """
+    Turns `(column_name, column_value[, operator_name])` filter tuples into (column, operator) pairs.
+    """
+
+    return tuple((condition[0], condition[2] if len(condition) > 2 else 'eq') for condition in filters or ())
+
+
+def track_operation(func=None, *, column_parameter='column_name', filters_parameter=None):
+    """
+    Decorator for manager methods that publishes an OperationContext while the method runs.
+
+    The positions of the `Table`, filter column and `operator_name` arguments are resolved
+    once at decoration time, so the per-call cost is a tuple build and a ContextVar set/reset.
+    Instrumentation such as engine event listeners can then attribute each SQL statement
+    to the manager method and filter that produced it.
+
+    Used bare (`@track_operation`) the `column_name` argument is the filter column. Methods whose
+    `column_name` is not a filter, or that take a list of filter tuples, name their parameters instead,
+    e.g. `@track_operation(column_parameter=None, filters_parameter='filters')`.
+
+    Args:
+        func (callable): The manager method to wrap.
+        column_parameter (str, optional): Parameter holding the filter column, or None. Defaults to 'column_name'.
+        filters_parameter (str, optional): Parameter holding `(column_name, column_value[, operator_name])`
+            filter tuples. Defaults to None.
+
+    Returns:
+        callable: The wrapped method.
+    """
+
+    if func is None:
+        return functools.partial(track_operation, column_parameter=column_parameter,
+                                 filters_parameter=filters_parameter)
+
+    parameters = list(inspect.signature(func).parameters.values())
+    names = [parameter.name for parameter in parameters]
+
+    def locate(name):
+        if name not in names:
+            return None, None
+        parameter = parameters[names.index(name)]
+        default = None if parameter.default is inspect.Parameter.empty else parameter.default
+        # Bound methods receive `self` separately, so positional indices shift by one.
+        return names.index(name) - 1, default
+
+    table_index, _ = locate('Table')
+    column_index, _ = locate(column_parameter)
+    operator_index, operator_default = locate('operator_name')
+    filters_index, _ = locate(filters_parameter)
+    method_name = func.__qualname__
+
+    def argument(args, kwargs, name, index, default=None):
+        if index is None:
+            return default
+        if index < len(args):
+            return args[index]
+        return kwargs.get(name, default)
+
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        column = argument(args, kwargs, column_parameter, column_index)
+        operator = argument(args, kwargs, 'operator_name', operator_index, operator_default)
+        filters = () if column is None else ((column, operator or 'eq'),)
+        if filters_index is not None:
+            filters += _filter_predicates(argument(args, kwargs, filters_parameter, filters_index))
+        context = OperationContext(
+            method=method_name,
+            table=_table_name(argument(args, kwargs, 'Table', table_index)),
+            column=column,
+            operator=operator,
+            filters=filters
+        )
+        token = current_operation.set(context)
+        if not _operation_listeners:
+            try:
+                return func(self, *args, **kwargs)
+            finally:
+                current_operation.reset(token)
+
+        start = time.perf_counter()
+        error = False
+        try:
+            return func(self, *args, **kwargs)
+        except BaseException:
+            error = True
+            raise
+        finally:
+            current_operation.reset(token)
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            for listener in tuple(_operation_listeners):
+                listener(context, elapsed_ms, error)
+
+    return wrapper